@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2026, Red Hat, Inc.
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import threading
+import traceback
+
+from concurrent.futures import ThreadPoolExecutor
+
+from ansible.errors import AnsibleActionFail
+from ansible.module_utils.common.arg_spec import ArgumentSpecValidator
+from ansible.plugins.action import ActionBase
+from ansible_collections.ovirt.ovirt.plugins.module_utils.ovirt import (
+    HAS_SDK,
+    create_connection,
+)
+from ansible_collections.ovirt.ovirt.plugins.modules.ovirt_vm import (
+    VM_ARGUMENT_SPEC_RULES,
+    manage_vm,
+    vm_argument_spec,
+)
+
+
+class VmFailed(Exception):
+    pass
+
+
+class VmModule(object):
+    """
+    Replacement of AnsibleModule, which is passed to the VM state handling
+    of ovirt_vm module for a single VM of the task.
+    """
+
+    def __init__(self, params, check_mode, diff):
+        self.params = params
+        self.check_mode = check_mode
+        self._diff = diff
+
+    def fail_json(self, msg, **kwargs):
+        raise VmFailed(msg)
+
+
+class ActionModule(ActionBase):
+
+    TRANSFERS_FILES = False
+    _VALID_ARGS = frozenset(('auth', 'vms', 'defaults', 'max_workers'))
+
+    def _get_vm_params(self, auth, defaults, vm):
+        params = dict(defaults)
+        params.update(vm)
+        params['auth'] = auth
+        validator = ArgumentSpecValidator(vm_argument_spec(), **VM_ARGUMENT_SPEC_RULES)
+        result = validator.validate(params)
+        if result.error_messages:
+            raise VmFailed(', '.join(result.error_messages))
+        params = result.validated_parameters
+        params.pop('auth')
+        return params
+
+    def run(self, tmp=None, task_vars=None):
+        result = super(ActionModule, self).run(tmp, task_vars)
+        del tmp
+
+        if not HAS_SDK:
+            raise AnsibleActionFail('ovirtsdk4 version 4.4.0 or higher is required for this module')
+
+        args = self._task.args
+        vms = args.get('vms') or []
+        defaults = args.get('defaults') or {}
+        max_workers = int(args.get('max_workers', 10))
+        if not isinstance(vms, list) or not all(isinstance(vm, dict) for vm in vms):
+            raise AnsibleActionFail("'vms' must be a list of dictionaries")
+        if not isinstance(defaults, dict):
+            raise AnsibleActionFail("'defaults' must be a dictionary")
+        if max_workers < 1:
+            raise AnsibleActionFail("'max_workers' must be a positive number")
+
+        # Validate the auth once, the same way the modules do:
+        validated = ArgumentSpecValidator(dict(auth=vm_argument_spec()['auth'])).validate(
+            dict(auth=args.get('auth'))
+        )
+        if validated.error_messages:
+            raise AnsibleActionFail(', '.join(validated.error_messages))
+        auth = validated.validated_parameters['auth']
+
+        # Login once, all the workers use the same token:
+        connection = create_connection(auth)
+        logout = auth.get('token') is None
+        worker_auth = dict(auth, token=auth.get('token') or connection.authenticate())
+
+        local = threading.local()
+        connections = []
+        lock = threading.Lock()
+        check_mode = self._play_context.check_mode
+        diff = self._play_context.diff
+
+        def run_vm(vm):
+            vm_result = dict(name=vm.get('name'), id=vm.get('id'))
+            try:
+                params = self._get_vm_params(worker_auth, defaults, vm)
+                if getattr(local, 'connection', None) is None:
+                    local.connection = create_connection(worker_auth)
+                    with lock:
+                        connections.append(local.connection)
+                vm_result.update(manage_vm(VmModule(params, check_mode, diff), local.connection))
+            except Exception as e:
+                vm_result.update(failed=True, msg=str(e), exception=traceback.format_exc())
+            return vm_result
+
+        try:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(vms) or 1)) as executor:
+                results = list(executor.map(run_vm, vms))
+        finally:
+            for worker_connection in connections:
+                worker_connection.close(logout=False)
+            connection.close(logout=logout)
+
+        failed = [vm_result for vm_result in results if vm_result.get('failed')]
+        result.update(
+            changed=any(vm_result.get('changed') for vm_result in results),
+            vms=results,
+        )
+        if failed:
+            result.update(
+                failed=True,
+                msg="Failed to manage {0} of {1} VMs: {2}".format(
+                    len(failed), len(results), ', '.join(str(vm_result['name'] or vm_result['id']) for vm_result in failed),
+                ),
+            )
+        return result
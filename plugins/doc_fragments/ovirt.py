@@ -90,6 +90,25 @@ options:
                 description: Flag indicating if compression is used for connection.
                 type: bool
                 default: true
+            token_cache:
+                description:
+                    - Path to the file where SSO token is cached and shared between tasks, which don't specify C(token).
+                    - The first task logs in and stores the token, the following tasks reuse it and don't logout,
+                      so the engine SSO isn't contacted by every task.
+                    - The cache is keyed by C(url), C(username), C(password) and C(ca_file).
+                    - The cached token, which wasn't used in the last minute, is tested by the task and when the engine
+                      doesn't accept it anymore, for example after the restart of the engine, new login is done.
+                    - Default value is set by C(OVIRT_TOKEN_CACHE) environment variable.
+                type: path
+                version_added: 3.3.0
+            token_cache_timeout:
+                description:
+                    - Number of seconds after which a token that was not used is removed from C(token_cache)
+                      and its session is logged out.
+                    - It should be lower than the engine user session timeout.
+                type: int
+                default: 600
+                version_added: 3.3.0
         type: dict
         required: true
     timeout:
@@ -101,8 +120,19 @@ options:
     poll_interval:
         description:
             - "Number of the seconds the module waits until another poll request on entity status is sent."
+            - "The first poll requests are sent sooner, the interval starts at one second and it's doubled up to C(poll_interval)."
         type: int
         default: 3
+    wait_events:
+        description:
+            - "If I(true) the module follows the engine events while waiting for the entity and checks the entity
+               status as soon as an event about the entity appears, instead of polling it every C(poll_interval) seconds."
+            - "The events are fetched in the same increasing intervals as the entity would be polled, the entity
+               is still checked after ten fetches of the events without an event about the entity."
+            - "If the events can't be listed, the module falls back to polling."
+        type: bool
+        default: false
+        version_added: 3.3.0
 requirements:
   - python >= 2.7
   - ovirt-engine-sdk-python >= 4.4.0
@@ -29,6 +29,14 @@ options:
         type: list
         elements: str
         default: []
+    fields:
+        description:
+            - List of the attributes of the entities, which should be returned, for example C(id), C(name) and C(status).
+            - If not specified, all the attributes are returned.
+            - The nested entities of the attributes, which are not listed, are not fetched when C(fetch_nested) is used.
+        type: list
+        elements: str
+        version_added: 3.3.0
     auth:
         description:
             - "Dictionary with values needed to create HTTP/HTTPS connection to oVirt:"
@@ -88,6 +96,25 @@ options:
                 description: Flag indicating if compression is used for connection.
                 type: bool
                 default: true
+            token_cache:
+                description:
+                    - Path to the file where SSO token is cached and shared between tasks, which don't specify C(token).
+                    - The first task logs in and stores the token, the following tasks reuse it and don't logout,
+                      so the engine SSO isn't contacted by every task.
+                    - The cache is keyed by C(url), C(username), C(password) and C(ca_file).
+                    - The cached token, which wasn't used in the last minute, is tested by the task and when the engine
+                      doesn't accept it anymore, for example after the restart of the engine, new login is done.
+                    - Default value is set by C(OVIRT_TOKEN_CACHE) environment variable.
+                type: path
+                version_added: 3.3.0
+            token_cache_timeout:
+                description:
+                    - Number of seconds after which a token that was not used is removed from C(token_cache)
+                      and its session is logged out.
+                    - It should be lower than the engine user session timeout.
+                type: int
+                default: 600
+                version_added: 3.3.0
         type: dict
         required: true
 requirements:
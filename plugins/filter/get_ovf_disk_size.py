@@ -2,20 +2,29 @@
 from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
+import io
+
 from ansible.errors import AnsibleFilterError
+from ansible.module_utils.common.text.converters import to_bytes
 
 import xml.etree.ElementTree as ET
 
 
 def get_ovf_disk_size(data):
     try:
-        root = ET.fromstring(data)
-        for child in root:
-            for element in child:
-                if element.tag == "Disk":
-                    return element.attrib.get(
-                        "{http://schemas.dmtf.org/ovf/envelope/1/}size"
-                    )
+        # Parse the OVF incrementally and stop at the first disk, so the rest
+        # of the document is neither parsed nor kept in the memory:
+        depth = 0
+        for event, element in ET.iterparse(io.BytesIO(to_bytes(data)), events=("start", "end")):
+            if event == "end":
+                depth -= 1
+                element.clear()
+                continue
+            if depth == 2 and element.tag == "Disk":
+                return element.attrib.get(
+                    "{http://schemas.dmtf.org/ovf/envelope/1/}size"
+                )
+            depth += 1
     except Exception as e:
         raise AnsibleFilterError(
             "Error in get_ovf_disk_size filter plugin:\n%s" % e
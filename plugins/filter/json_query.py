@@ -21,28 +21,84 @@ __metaclass__ = type
 
 from ansible.errors import AnsibleError, AnsibleFilterError
 
+try:
+    from functools import lru_cache
+except ImportError:
+    lru_cache = None
+
 try:
     import jmespath
     HAS_LIB = True
 except ImportError:
     HAS_LIB = False
 
+# Number of the compiled expressions kept in the cache:
+CACHE_SIZE = 256
 
-def json_query(data, expr):
-    '''Query data using jmespath query language ( http://jmespath.org ). Example:
-    - ansible.builtin.debug: msg="{{ instance | json_query(tagged_instances[*].block_device_mapping.*.volume_id') }}"
-    '''
+_TYPES_REGISTERED = False
+
+
+def _register_types():
+    # Hack to handle Ansible Unsafe text, AnsibleMapping and AnsibleSequence
+    # See issue: https://github.com/ansible-collections/community.general/issues/320
+    # The types are registered only once, not on every call of the filter.
+    global _TYPES_REGISTERED
+    if _TYPES_REGISTERED:
+        return
+    for jmespath_type, ansible_types in (
+        ('string', ('AnsibleUnicode', 'AnsibleUnsafeText')),
+        ('array', ('AnsibleSequence', )),
+        ('object', ('AnsibleMapping', )),
+    ):
+        types = jmespath.functions.REVERSE_TYPES_MAP[jmespath_type]
+        jmespath.functions.REVERSE_TYPES_MAP[jmespath_type] = types + tuple(t for t in ansible_types if t not in types)
+    _TYPES_REGISTERED = True
+
+
+def _jmespath_compile(expr):
+    return jmespath.compile(expr)
+
+
+if lru_cache is not None:
+    _jmespath_compile = lru_cache(maxsize=CACHE_SIZE)(_jmespath_compile)
+
+
+def _compile(expr):
+    try:
+        return _jmespath_compile(expr)
+    except jmespath.exceptions.JMESPathError as e:
+        raise AnsibleFilterError('JMESPathError in json_query filter plugin:\n%s' % e)
+    except Exception as e:
+        # For older jmespath, we can get ValueError and TypeError without much info.
+        raise AnsibleFilterError('Error in jmespath.compile in json_query filter plugin:\n%s' % e)
+
+
+def _check_lib():
     if not HAS_LIB:
         raise AnsibleError('You need to install "jmespath" prior to running '
                            'json_query filter')
 
-    # Hack to handle Ansible Unsafe text, AnsibleMapping and AnsibleSequence
-    # See issue: https://github.com/ansible-collections/community.general/issues/320
-    jmespath.functions.REVERSE_TYPES_MAP['string'] = jmespath.functions.REVERSE_TYPES_MAP['string'] + ('AnsibleUnicode', 'AnsibleUnsafeText', )
-    jmespath.functions.REVERSE_TYPES_MAP['array'] = jmespath.functions.REVERSE_TYPES_MAP['array'] + ('AnsibleSequence', )
-    jmespath.functions.REVERSE_TYPES_MAP['object'] = jmespath.functions.REVERSE_TYPES_MAP['object'] + ('AnsibleMapping', )
+
+def json_query_compile(expr):
+    '''Compile jmespath query, so it can be passed to json_query filter many times
+    without parsing it again. The compiled query lives only within the template,
+    other tasks rely on the cache of json_query. Example:
+    - ansible.builtin.debug: msg="{% set query = 'block_device_mapping.*.volume_id' | json_query_compile %}{{ instances | map('json_query', query) }}"
+    '''
+    _check_lib()
+    return _compile(expr)
+
+
+def json_query(data, expr):
+    '''Query data using jmespath query language ( http://jmespath.org ). Example:
+    - ansible.builtin.debug: msg="{{ instance | json_query(tagged_instances[*].block_device_mapping.*.volume_id') }}"
+    The expr can be also the query compiled by json_query_compile filter.
+    '''
+    _check_lib()
+    _register_types()
+    query = expr if hasattr(expr, 'search') else _compile(expr)
     try:
-        return jmespath.search(expr, data)
+        return query.search(data)
     except jmespath.exceptions.JMESPathError as e:
         raise AnsibleFilterError('JMESPathError in json_query filter plugin:\n%s' % e)
     except Exception as e:
@@ -55,5 +111,6 @@ class FilterModule(object):
 
     def filters(self):
         return {
-            'json_query': json_query
+            'json_query': json_query,
+            'json_query_compile': json_query_compile,
         }
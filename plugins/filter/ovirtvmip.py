@@ -3,8 +3,15 @@
 from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
+import binascii
+import ipaddress
+import socket
+
 from xml.etree import ElementTree
 
+from ansible.errors import AnsibleFilterError
+from ansible.module_utils.common.text.converters import to_text
+
 
 class FilterModule(object):
     'Filter for IP addresses on newly created VMs'
@@ -58,11 +65,11 @@ class FilterModule(object):
 
     def ovirtvmip(self, ovirt_vms, attr=None, network_ip=None):
         'Return first IP'
-        return self.__get_first_ip(self.ovirtvmips(ovirt_vms, attr))
+        return self.__get_first_ip(self.ovirtvmips(ovirt_vms, attr, network_ip))
 
     def ovirtvmips(self, ovirt_vms, attr=None, network_ip=None):
         'Return list of IPs'
-        return self._parse_ips(ovirt_vms, attr=attr)
+        return self._parse_ips(ovirt_vms, attr=attr, network_ip=network_ip)
 
     def ovirtvmipv4(self, ovirt_vms, attr=None, network_ip=None):
         'Return first IPv4 IP'
@@ -70,64 +77,70 @@ class FilterModule(object):
 
     def ovirtvmipsv4(self, ovirt_vms, attr=None, network_ip=None):
         'Return list of IPv4 IPs'
-        ips = self._parse_ips(ovirt_vms, lambda version: version == 'v4', attr)
-        if attr:
-            return dict((k, list(filter(lambda x: self.__address_in_network(x, network_ip), v))) for k, v in ips.items())
-        return list(filter(lambda x: self.__address_in_network(x, network_ip), ips))
+        return self._parse_ips(ovirt_vms, 'v4', attr, network_ip)
 
     def ovirtvmipv6(self, ovirt_vms, attr=None, network_ip=None):
         'Return first IPv6 IP'
-        return self.__get_first_ip(self.ovirtvmipsv6(ovirt_vms, attr))
+        return self.__get_first_ip(self.ovirtvmipsv6(ovirt_vms, attr, network_ip))
 
     def ovirtvmipsv6(self, ovirt_vms, attr=None, network_ip=None):
         'Return list of IPv6 IPs'
-        return self._parse_ips(ovirt_vms, lambda version: version == 'v6', attr)
+        return self._parse_ips(ovirt_vms, 'v6', attr, network_ip)
 
-    def _parse_ips(self, ovirt_vms, version_condition=lambda version: True, attr=None):
+    def _parse_ips(self, ovirt_vms, version=None, attr=None, network_ip=None):
         if not isinstance(ovirt_vms, list):
             ovirt_vms = [ovirt_vms]
 
+        in_network = self._in_network(network_ip)
         if attr is None:
-            return self._parse_ips_aslist(ovirt_vms, version_condition)
-        else:
-            return self._parse_ips_asdict(ovirt_vms, version_condition, attr)
-
-    @staticmethod
-    def _parse_ips_asdict(ovirt_vms, version_condition=lambda version: True, attr=None):
-        vm_ips = {}
-        for ovirt_vm in ovirt_vms:
-            ips = []
-            for device in ovirt_vm.get('reported_devices', []):
-                for curr_ip in device.get('ips', []):
-                    if version_condition(curr_ip.get('version')):
-                        ips.append(curr_ip.get('address'))
-            vm_ips[ovirt_vm.get(attr)] = ips
-        return vm_ips
+            return list(self._vm_ips(ovirt_vms, version, in_network))
+        return dict((ovirt_vm.get(attr), list(self._vm_ips([ovirt_vm], version, in_network))) for ovirt_vm in ovirt_vms)
 
     @staticmethod
-    def _parse_ips_aslist(ovirt_vms, version_condition=lambda version: True):
-        ips = []
-        for ovirt_vm in ovirt_vms:
-            for device in ovirt_vm.get('reported_devices', []):
-                for curr_ip in device.get('ips', []):
-                    if version_condition(curr_ip.get('version')):
-                        ips.append(curr_ip.get('address'))
-        return ips
+    def _vm_ips(ovirt_vms, version, in_network):
+        return (
+            curr_ip.get('address')
+            for ovirt_vm in ovirt_vms
+            for device in ovirt_vm.get('reported_devices', [])
+            for curr_ip in device.get('ips', [])
+            if (version is None or curr_ip.get('version') == version) and (in_network is None or in_network(curr_ip.get('address')))
+        )
 
     @staticmethod
     def __get_first_ip(res):
         return res[0] if isinstance(res, list) and res else res
 
-    def __address_in_network(self, ip, net):
-        "Return boolean if IP is in network."
-        if net:
-            ipaddr = int(''.join(['%02x' % int(x) for x in ip.split('.')]), 16)
-            netstr, bits = net.split('/')
-            netaddr = int(''.join(['%02x' % int(x)
-                                   for x in netstr.split('.')]), 16)
-            mask = (0xffffffff << (32 - int(bits))) & 0xffffffff
-            return (ipaddr & mask) == (netaddr & mask)
-        return True
+    @staticmethod
+    def _in_network(net):
+        """
+        Return function, which returns boolean if IP is in network, or None
+        if all IPs are in network. The network is parsed once and the IPs are
+        compared as integers. The IPs of the other IP version than the network
+        are never in the network.
+        """
+        if not net:
+            return None
+        try:
+            network = ipaddress.ip_network(to_text(net), strict=False)
+        except ValueError as e:
+            raise AnsibleFilterError("Invalid network '%s': %s" % (net, e))
+        if network.prefixlen == 0:
+            # The '0.0.0.0/0' is the default of the wait_for_ip_range of the vm_infra role,
+            # which is passed also to the IPv6 filters, so it means no filtering at all:
+            return None
+        family = socket.AF_INET if network.version == 4 else socket.AF_INET6
+        netaddr = int(network.network_address)
+        mask = int(network.netmask)
+
+        def in_network(ip):
+            try:
+                # The scope of the link-local IPv6 address isn't part of the address:
+                ipaddr = int(binascii.hexlify(socket.inet_pton(family, ip.partition('%')[0])), 16)
+            except (OSError, ValueError):
+                # The IP of the other IP version:
+                return False
+            return (ipaddr & mask) == netaddr
+        return in_network
 
     def removesensitivevmdata(self, data, key_to_remove='root_password'):
         for value in data:
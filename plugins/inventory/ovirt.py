@@ -58,6 +58,38 @@ DOCUMENTATION = '''
         default: ['fqdn', 'name']
         type: list
         elements: str
+      ovirt_bulk_fetch:
+        required: False
+        description:
+            - If C(True) the VMs are listed with their reported devices, tags, statistics and affinity labels in single request,
+              and the clusters, hosts, templates and affinity groups are fetched only once, instead of several requests for every VM.
+            - Requires oVirt engine which supports the C(follow) parameter.
+        default: False
+        type: bool
+        version_added: 3.3.0
+      ovirt_max_workers:
+        required: False
+        description:
+            - Maximal number of VMs, whose devices, tags, statistics and affinity are fetched concurrently.
+            - Every worker uses its own connection to the engine, which reuses the SSO token of the plugin.
+            - At most 16 workers are used, so the engine isn't overloaded.
+            - The order of the hosts doesn't depend on the number of workers.
+            - This option doesn't apply when C(ovirt_bulk_fetch) is C(True), as all data are fetched by few requests.
+        default: 1
+        type: int
+        version_added: 3.3.0
+      ovirt_incremental_cache:
+        required: False
+        description:
+            - If C(True) and the inventory is read from the cache, the cached hosts are updated by the engine events
+              created since the cache was stored. Only the VMs mentioned in the events are fetched again,
+              the removed VMs are dropped and the new VMs are added.
+            - If the events since the cache was stored are not available anymore, the whole inventory is fetched.
+            - The statistics and reported devices of the VMs are not refreshed unless there is an event about the VM.
+            - Requires C(cache) to be enabled.
+        default: False
+        type: bool
+        version_added: 3.3.0
 '''
 
 EXAMPLES = '''
@@ -82,11 +114,20 @@ compose:
   ansible_host: devices["eth0"][0]
 '''
 
+import threading
+
+from concurrent.futures import ThreadPoolExecutor
+
 from ansible.plugins.inventory import BaseInventoryPlugin, Constructable, Cacheable
 from ansible.errors import AnsibleError, AnsibleParserError
 
+from ansible_collections.ovirt.ovirt.plugins.module_utils.ovirt import get_vms_affinity_groups
+
 HAS_OVIRT_LIB = False
 
+# Maximal number of the workers of ovirt_max_workers, so the engine isn't overloaded:
+MAX_WORKERS = 16
+
 try:
     import ovirtsdk4 as sdk
     HAS_OVIRT_LIB = True
@@ -98,41 +139,82 @@ class InventoryModule(BaseInventoryPlugin, Constructable, Cacheable):
 
     NAME = 'ovirt.ovirt.ovirt'
 
-    def _get_dict_of_struct(self, vm):
+    def _create_connection(self, token=None):
+        return sdk.Connection(
+            url=self.get_option('ovirt_url'),
+            username=None if token else self.get_option('ovirt_username'),
+            password=None if token else self.get_option('ovirt_password'),
+            token=token,
+            ca_file=self.get_option('ovirt_cafile'),
+            insecure=self.get_option('ovirt_insecure') if self.get_option('ovirt_insecure') is not None else not self.get_option('ovirt_cafile'),
+        )
+
+    def _get_dict_of_struct(self, vm, connection=None):
         '''  Transform SDK Vm Struct type to Python dictionary.
              :param vm: host struct of which to create dict
+             :param connection: connection used to fetch the data, the connection of the plugin by default
              :return dict of vm struct type
         '''
 
-        vms_service = self.connection.system_service().vms_service()
-        clusters_service = self.connection.system_service().clusters_service()
+        connection = connection or self.connection
+        vms_service = connection.system_service().vms_service()
+        clusters_service = connection.system_service().clusters_service()
         vm_service = vms_service.vm_service(vm.id)
         devices = vm_service.reported_devices_service().list()
         tags = vm_service.tags_service().list()
         stats = vm_service.statistics_service().list()
         labels = vm_service.affinity_labels_service().list()
-        groups = clusters_service.cluster_service(
-            vm.cluster.id
-        ).affinity_groups_service().list()
+        if vm.cluster.id not in self._affinity_groups:
+            self._affinity_groups[vm.cluster.id] = get_vms_affinity_groups(
+                clusters_service.cluster_service(vm.cluster.id).affinity_groups_service()
+            )
+
+        return self._vm_to_dict(
+            vm,
+            host=connection.follow_link(vm.host).name if vm.host else None,
+            cluster=connection.follow_link(vm.cluster).name,
+            template=connection.follow_link(vm.template).name,
+            devices=devices,
+            tags=tags,
+            stats=stats,
+            labels=labels,
+            affinity_groups=self._affinity_groups[vm.cluster.id].get(vm.id, []),
+        )
 
+    def _get_dict_of_struct_bulk(self, vm, lookup):
+        '''  Transform SDK Vm Struct type, listed with followed links, to Python dictionary.
+             :param vm: host struct of which to create dict
+             :param lookup: dictionary of names of clusters, hosts and templates by ID
+             :return dict of vm struct type
+        '''
+        return self._vm_to_dict(
+            vm,
+            host=lookup['hosts'].get(vm.host.id) if vm.host else None,
+            cluster=lookup['clusters'].get(vm.cluster.id),
+            template=lookup['templates'].get(vm.template.id),
+            devices=vm.reported_devices or [],
+            tags=vm.tags or [],
+            stats=vm.statistics or [],
+            labels=vm.affinity_labels or [],
+            affinity_groups=self._affinity_groups[vm.cluster.id].get(vm.id, []),
+        )
+
+    def _vm_to_dict(self, vm, host, cluster, template, devices, tags, stats, labels, affinity_groups):
         return {
             'id': vm.id,
             'name': vm.name,
-            'host': self.connection.follow_link(vm.host).name if vm.host else None,
-            'cluster': self.connection.follow_link(vm.cluster).name,
+            'host': host,
+            'cluster': cluster,
             'status': str(vm.status),
             'description': vm.description,
             'fqdn': vm.fqdn,
             'os': vm.os.type,
-            'template': self.connection.follow_link(vm.template).name,
+            'template': template,
             'creation_time': str(vm.creation_time),
             'creation_time_timestamp': float(vm.creation_time.strftime("%s.%f")),
             'tags': [tag.name for tag in tags],
             'affinity_labels': [label.name for label in labels],
-            'affinity_groups': [
-                group.name for group in groups
-                if vm.name in [vm.name for vm in self.connection.follow_link(group.vms)]
-            ],
+            'affinity_groups': affinity_groups,
             'statistics': dict(
                 (stat.name, stat.values[0].datum if stat.values else None) for stat in stats
             ),
@@ -141,12 +223,136 @@ class InventoryModule(BaseInventoryPlugin, Constructable, Cacheable):
             ),
         }
 
+    def _get_lookup(self, vms):
+        '''
+            Fetch the entities referenced by the VMs once.
+            :param vms: list of oVirt vm structs
+            :return dictionary of names of clusters, hosts and templates by ID
+        '''
+        system_service = self.connection.system_service()
+        clusters_service = system_service.clusters_service()
+        lookup = {
+            'clusters': dict((c.id, c.name) for c in clusters_service.list()),
+            'hosts': dict((h.id, h.name) for h in system_service.hosts_service().list()),
+            'templates': dict((t.id, t.name) for t in system_service.templates_service().list()),
+        }
+        self._fetch_affinity_groups(vm.cluster.id for vm in vms)
+        return lookup
+
+    def _fetch_affinity_groups(self, cluster_ids):
+        '''
+            Fetch the affinity groups of the clusters, which weren't fetched yet.
+            :param cluster_ids: IDs of the clusters
+        '''
+        clusters_service = self.connection.system_service().clusters_service()
+        for cluster_id in set(cluster_ids) - set(self._affinity_groups):
+            self._affinity_groups[cluster_id] = get_vms_affinity_groups(
+                clusters_service.cluster_service(cluster_id).affinity_groups_service()
+            )
+
     def _query(self, query_filter=None):
         '''
             :param query_filter: dictionary of filter parameter/values
             :return dict of oVirt vm dicts
         '''
-        return [self._get_dict_of_struct(host) for host in self._get_hosts(query_filter=query_filter)]
+        if self.get_option('ovirt_bulk_fetch'):
+            query_filter = dict(query_filter or {})
+            follow = [f for f in query_filter.get('follow', '').split(',') if f]
+            follow.extend(
+                f for f in ['reported_devices', 'tags', 'statistics', 'affinity_labels'] if f not in follow
+            )
+            query_filter['follow'] = ','.join(follow)
+            vms = self._get_hosts(query_filter=query_filter)
+            lookup = self._get_lookup(vms)
+            return [self._get_dict_of_struct_bulk(vm, lookup) for vm in vms]
+
+        return self._get_dicts_of_structs(self._get_hosts(query_filter=query_filter))
+
+    def _get_dicts_of_structs(self, vms):
+        '''
+            :param vms: list of oVirt vm structs
+            :return list of oVirt vm dicts
+        '''
+        max_workers = min(self.get_option('ovirt_max_workers') or 1, MAX_WORKERS)
+        if max_workers > 1 and len(vms) > 1:
+            return self._query_concurrently(vms, max_workers)
+
+        return [self._get_dict_of_struct(host) for host in vms]
+
+    def _query_concurrently(self, vms, max_workers):
+        '''
+            Transform the VMs to dicts by pool of workers, each with its own connection.
+            :param vms: list of oVirt vm structs
+            :param max_workers: maximal number of workers
+            :return list of oVirt vm dicts, in the same order as the VMs
+        '''
+        # All the workers use the token of the plugin connection, instead of their own logins:
+        token = self.connection.authenticate()
+        # Fetch the affinity groups of the clusters before the workers, which would
+        # fetch the affinity groups of the same cluster concurrently:
+        self._fetch_affinity_groups(vm.cluster.id for vm in vms)
+        local = threading.local()
+        connections = []
+        lock = threading.Lock()
+
+        def get_dict_of_struct(vm):
+            if getattr(local, 'connection', None) is None:
+                local.connection = self._create_connection(token=token)
+                with lock:
+                    connections.append(local.connection)
+            return self._get_dict_of_struct(vm, connection=local.connection)
+
+        try:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(vms))) as executor:
+                return list(executor.map(get_dict_of_struct, vms))
+        finally:
+            for connection in connections:
+                connection.close(logout=False)
+
+    def _get_last_event_id(self):
+        '''
+            :return ID of the last engine event, or None if there is no event
+        '''
+        events = self.connection.system_service().events_service().list(max=1)
+        return max(int(event.id) for event in events) if events else None
+
+    def _query_incremental(self, cached, query_filter=None):
+        '''
+            Update the cached VM dicts by the events created since the cache was stored.
+            :param cached: dictionary with ID of the last event and list of oVirt vm dicts
+            :param query_filter: dictionary of filter parameter/values
+            :return dictionary with ID of the last event and list of oVirt vm dicts,
+                    or None if the cache can't be updated from the events
+        '''
+        last_event_id = cached.get('last_event_id') if isinstance(cached, dict) else None
+        if last_event_id is None:
+            return None
+
+        events_service = self.connection.system_service().events_service()
+        try:
+            # If the last event was removed, we could have missed some events:
+            events_service.event_service(str(last_event_id)).get()
+        except sdk.NotFoundError:
+            return None
+
+        events = events_service.list(from_=last_event_id)
+        changed = set(event.vm.id for event in events if event.vm is not None)
+        last_event_id = max([last_event_id] + [int(event.id) for event in events])
+        if not changed:
+            return dict(last_event_id=last_event_id, hosts=cached['hosts'])
+
+        # List the VMs to find out added and removed VMs, and fetch
+        # the data only of the VMs, which are new or were changed:
+        cached_hosts = dict((host['id'], host) for host in cached['hosts'])
+        vms = self._get_hosts(query_filter=query_filter)
+        refreshed = self._get_dicts_of_structs(
+            [vm for vm in vms if vm.id in changed or vm.id not in cached_hosts]
+        )
+        cached_hosts.update((host['id'], host) for host in refreshed)
+        return dict(
+            last_event_id=last_event_id,
+            hosts=[cached_hosts[vm.id] for vm in vms],
+        )
 
     def _get_hosts(self, query_filter=None):
         '''
@@ -237,18 +443,15 @@ class InventoryModule(BaseInventoryPlugin, Constructable, Cacheable):
 
         config = self._read_config_data(path)
 
-        self.connection = sdk.Connection(
-            url=self.get_option('ovirt_url'),
-            username=self.get_option('ovirt_username'),
-            password=self.get_option('ovirt_password'),
-            ca_file=self.get_option('ovirt_cafile'),
-            insecure=self.get_option('ovirt_insecure') if self.get_option('ovirt_insecure') is not None else not self.get_option('ovirt_cafile'),
-        )
+        self.connection = self._create_connection()
+        # Names of affinity groups by VM ID, for every cluster:
+        self._affinity_groups = {}
 
         query_filter = self._get_query_options(self.get_option('ovirt_query_filter', None))
 
         cache_key = self.get_cache_key(path)
         source_data = None
+        incremental = self.get_option('ovirt_incremental_cache')
 
         user_cache_setting = self.get_option('cache')
         attempt_to_read_cache = user_cache_setting and cache
@@ -260,11 +463,20 @@ class InventoryModule(BaseInventoryPlugin, Constructable, Cacheable):
             except KeyError:
                 cache_needs_update = True
 
+        if incremental and source_data is not None:
+            source_data = self._query_incremental(source_data, query_filter=query_filter)
+            cache_needs_update = True
+
         if source_data is None:
-            source_data = self._query(query_filter=query_filter)
+            if incremental:
+                # The ID of the last event must be read before the VMs, so we don't miss any change:
+                last_event_id = self._get_last_event_id()
+                source_data = dict(last_event_id=last_event_id, hosts=self._query(query_filter=query_filter))
+            else:
+                source_data = self._query(query_filter=query_filter)
 
         if cache_needs_update:
             self._cache[cache_key] = source_data
 
-        self._populate_from_source(source_data)
+        self._populate_from_source(source_data['hosts'] if isinstance(source_data, dict) else source_data)
         self.connection.close()
@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2026, Red Hat, Inc.
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import inspect
+
+
+# Names of the parameters of the inspected functions, by the function:
+_parameters = {}
+
+
+def parameters(function):
+    """
+    Return frozenset of the names of the parameters of the `function`, for
+    example of the `list` method of the SDK service or of the ovirt-imageio
+    client function, so the modules can check which parameters the installed
+    version supports. Every function is inspected only once per process, the
+    bound methods of all the instances of the class share the same entry.
+    """
+    key = getattr(function, '__func__', function)
+    names = _parameters.get(key)
+    if names is None:
+        try:
+            names = frozenset(inspect.signature(key).parameters)
+        except (TypeError, ValueError):
+            # The signature of some builtins can't be inspected:
+            names = frozenset()
+        _parameters[key] = names
+    return names
+
+
+def accepts(function, *names):
+    """
+    Return True if the `function` has all the parameters `names`.
+    """
+    return parameters(function).issuperset(names)
+
+
+def supported_kwargs(function, **kwargs):
+    """
+    Return the keyword arguments `kwargs`, which the `function` has and
+    which are not None, so they can be passed to any version of the function.
+    """
+    names = parameters(function)
+    return dict((name, value) for name, value in kwargs.items() if name in names and value is not None)
@@ -0,0 +1,1231 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2026, Red Hat, Inc.
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import errno
+import hashlib
+import json
+import math
+import os
+import random
+import ssl
+import struct
+import tarfile
+import threading
+import time
+import uuid
+import zlib
+
+from contextlib import contextmanager
+
+from ansible.module_utils.six.moves import queue
+from ansible.module_utils.six.moves.http_client import HTTPSConnection
+from ansible.module_utils.six.moves.urllib.parse import urlparse
+from ansible_collections.ovirt.ovirt.plugins.module_utils.ovirt import locked_state
+
+try:
+    from urllib import getproxies_environment, proxy_bypass
+except ImportError:
+    from urllib.request import getproxies_environment, proxy_bypass
+
+
+BUFFER_SIZE = 128 * 1024
+RANGE_SIZE = 64 * 1024 ** 2
+MAX_WORKERS = 4
+CHECKSUM_ALGORITHM = 'blake2b'
+CHECKSUM_BLOCK_SIZE = 4 * 1024 ** 2
+STREAM_CHUNK_SIZE = 8 * 1024 ** 2
+QCOW2_MAGIC = b'QFI\xfb'
+COMPRESSION_MAGICS = (
+    ('gzip', b'\x1f\x8b'),
+    ('xz', b'\xfd7zXZ\x00'),
+    ('bzip2', b'BZh'),
+)
+TRANSFER_PRIORITIES = dict(high=0, normal=1, low=2)
+
+# Argument spec of the transfer_scheduler parameter of the modules transferring images:
+TRANSFER_SCHEDULER_SPEC = dict(
+    type='dict',
+    options=dict(
+        path=dict(type='path', required=True),
+        max_transfers_per_host=dict(type='int'),
+        max_transfers_per_storage_domain=dict(type='int'),
+        priority=dict(default='normal', choices=list(TRANSFER_PRIORITIES)),
+        bandwidth_limit=dict(type='int'),
+        queue_timeout=dict(type='int'),
+    ),
+)
+
+# Argument spec of the transfer_probe_cache parameter of the modules transferring images:
+TRANSFER_PROBE_CACHE_SPEC = dict(
+    type='dict',
+    options=dict(
+        path=dict(type='path', required=True),
+        ttl=dict(type='int', default=3600),
+    ),
+)
+
+
+def create_ssl_context(auth):
+    """
+    Create SSL context used to connect to the imageio server, using the
+    same values of the `auth` parameter as the connection to the engine.
+    """
+    context = ssl.create_default_context()
+    if auth.get('insecure'):
+        context.check_hostname = False
+        context.verify_mode = ssl.CERT_NONE
+    elif auth.get('ca_file'):
+        context.load_verify_locations(cafile=auth.get('ca_file'))
+    return context
+
+
+class TokenBucket(object):
+    """
+    Token bucket limiting the rate of the transferred bytes to `rate` bytes
+    per second, shared by all the workers of the transfer.
+
+    If `share` is passed, it's called every `share_interval` seconds and
+    returns the number of the transfers sharing the `rate`, so the rate of
+    this transfer is the fair share of the `rate`.
+    """
+
+    def __init__(self, rate, burst=None, share=None, share_interval=5):
+        self._total_rate = float(rate)
+        self._burst = burst
+        self._share = share
+        self._share_interval = share_interval
+        self._shared = None
+        self.rate = self._total_rate
+        self.capacity = float(burst or rate)
+        self._tokens = self.capacity
+        self._last = time.time()
+        self._lock = threading.Lock()
+
+    def _update_share(self, now):
+        if self._share is None or (self._shared is not None and now < self._shared + self._share_interval):
+            return
+        self._shared = now
+        self.rate = self._total_rate / max(1, self._share())
+        self.capacity = float(self._burst or self.rate)
+        self._tokens = min(self._tokens, self.capacity)
+
+    def consume(self, count):
+        with self._lock:
+            now = time.time()
+            self._update_share(now)
+            self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+            self._last = now
+            self._tokens -= count
+            # The tokens may be borrowed, the worker then waits until they are refilled:
+            delay = -self._tokens / self.rate if self._tokens < 0 else 0
+        if delay:
+            time.sleep(delay)
+
+
+def _token_bucket(bandwidth_limit):
+    # The limit is either the rate in bytes per second, or the bucket shared with other transfers:
+    if isinstance(bandwidth_limit, TokenBucket) or not bandwidth_limit:
+        return bandwidth_limit or None
+    return TokenBucket(bandwidth_limit)
+
+
+class ImageioClient(object):
+    """
+    Minimal client of the imageio HTTP API of single image transfer.
+
+    Every client holds its own HTTPS connection, so every worker of the
+    transfer must use its own client.
+    """
+
+    def __init__(self, url, ticket, context, buffer_size=BUFFER_SIZE, bucket=None):
+        self._url = urlparse(url)
+        self._ticket = ticket
+        self._buffer_size = buffer_size
+        self._bucket = bucket
+        self._connection = HTTPSConnection(
+            self._url.hostname,
+            self._url.port,
+            context=context,
+        )
+
+    def close(self):
+        self._connection.close()
+
+    def _request(self, method, path=None, body=None, headers=None):
+        all_headers = {'Authorization': self._ticket}
+        all_headers.update(headers or {})
+        self._connection.request(method, path or self._url.path, body=body, headers=all_headers)
+        return self._connection.getresponse()
+
+    def _check(self, response, *statuses):
+        if response.status not in statuses:
+            raise RuntimeError(
+                "Request to imageio failed with status %s: %s" % (response.status, response.read()[:512])
+            )
+
+    def options(self):
+        """
+        Return the features and limits of the imageio server, or empty
+        dictionary if the server doesn't support OPTIONS request.
+        """
+        response = self._request('OPTIONS')
+        body = response.read()
+        if response.status != 200:
+            return {}
+        return json.loads(body)
+
+    def size(self):
+        """
+        Return the size of the image, as reported by the ranged request.
+        """
+        response = self._request('GET', headers={'Range': 'bytes=0-0'})
+        if response.status == 206:
+            response.read()
+            size = response.getheader('Content-Range', '').rpartition('/')[2]
+            if size.isdigit():
+                return int(size)
+        else:
+            self._check(response, 200)
+            size = int(response.getheader('Content-Length'))
+            # We don't want to read the whole image, the connection will be re-established:
+            self._connection.close()
+            return size
+        raise RuntimeError("imageio server doesn't report the size of the image")
+
+    def read_range(self, offset, length, image, checksum=None):
+        """
+        Read `length` bytes of the image from the `offset` and write them to
+        the local file `image` at the same offset. If `checksum` is passed,
+        it is updated by the data as they are read.
+        """
+        response = self._request(
+            'GET',
+            headers={'Range': 'bytes=%d-%d' % (offset, offset + length - 1)},
+        )
+        if response.status != 206 and response.getheader('Content-Length') != str(length):
+            self._check(response, 206)
+        image.seek(offset)
+        pos = 0
+        while pos < length:
+            chunk = response.read(min(length - pos, self._buffer_size))
+            if not chunk:
+                raise RuntimeError("Socket disconnected at pos=%d" % (offset + pos))
+            image.write(chunk)
+            if self._bucket is not None:
+                self._bucket.consume(len(chunk))
+            if checksum is not None:
+                checksum.update(offset + pos, chunk)
+            pos += len(chunk)
+
+    def write_range(self, offset, length, image, checksum=None):
+        """
+        Write `length` bytes of the local file `image` from the `offset`
+        to the image at the same offset, without flushing the data. If
+        `checksum` is passed, it is updated by the data as they are sent.
+        """
+        self._connection.putrequest('PUT', '%s?flush=n' % self._url.path)
+        self._connection.putheader('Authorization', self._ticket)
+        self._connection.putheader('Content-Range', 'bytes %d-%d/*' % (offset, offset + length - 1))
+        self._connection.putheader('Content-Length', '%d' % length)
+        self._connection.endheaders()
+        image.seek(offset)
+        pos = 0
+        while pos < length:
+            chunk = image.read(min(length - pos, self._buffer_size))
+            if not chunk:
+                raise RuntimeError("Unexpected end of file at pos=%d" % (offset + pos))
+            self._connection.send(chunk)
+            if self._bucket is not None:
+                self._bucket.consume(len(chunk))
+            if checksum is not None:
+                checksum.update(offset + pos, chunk)
+            pos += len(chunk)
+        response = self._connection.getresponse()
+        response.read()
+        self._check(response, 200, 204)
+
+    def write(self, offset, data):
+        """
+        Write the `data` to the image at the `offset`, without flushing.
+        """
+        if self._bucket is not None:
+            self._bucket.consume(len(data))
+        response = self._request(
+            'PUT',
+            path='%s?flush=n' % self._url.path,
+            body=data,
+            headers={'Content-Range': 'bytes %d-%d/*' % (offset, offset + len(data) - 1)},
+        )
+        response.read()
+        self._check(response, 200, 204)
+
+    def extents(self):
+        """
+        Return list of (offset, length, zero) extents of the image, as
+        reported by the imageio server.
+        """
+        response = self._request('GET', path='%s/extents?context=zero' % self._url.path)
+        body = response.read()
+        self._check(response, 200)
+        return merge_extents(
+            (extent['start'], extent['length'], extent['zero'])
+            for extent in json.loads(body)
+        )
+
+    def zero(self, offset, length):
+        """
+        Zero `length` bytes of the image from the `offset`, without sending
+        the data and without flushing.
+        """
+        response = self._request(
+            'PATCH',
+            body=json.dumps({'op': 'zero', 'offset': offset, 'size': length, 'flush': False}).encode('utf-8'),
+            headers={'Content-Type': 'application/json'},
+        )
+        response.read()
+        self._check(response, 200, 204)
+
+    def checksum(self, algorithm=CHECKSUM_ALGORITHM, block_size=CHECKSUM_BLOCK_SIZE):
+        """
+        Return dictionary with the checksum of the image computed by the
+        imageio server, or None if the server doesn't support checksums.
+        """
+        response = self._request(
+            'GET',
+            path='%s/checksum?algorithm=%s&block_size=%d' % (self._url.path, algorithm, block_size),
+        )
+        body = response.read()
+        if response.status in (404, 405):
+            return None
+        self._check(response, 200)
+        return json.loads(body)
+
+    def flush(self):
+        response = self._request(
+            'PATCH',
+            body=json.dumps({'op': 'flush'}).encode('utf-8'),
+            headers={'Content-Type': 'application/json'},
+        )
+        response.read()
+        self._check(response, 200, 204)
+
+
+class TransferWorker(object):
+    """
+    Worker of the transfer, holding its own imageio client and its own
+    file object of the local image.
+    """
+
+    def __init__(self, url, ticket, context, path, mode, buffer_size=BUFFER_SIZE, bucket=None):
+        self.client = ImageioClient(url, ticket, context, buffer_size=buffer_size, bucket=bucket)
+        self.image = open(path, mode)
+
+    def close(self):
+        self.image.close()
+        self.client.close()
+
+
+def merge_extents(extents):
+    """
+    Merge the adjacent (offset, length, zero) extents of the same kind.
+    """
+    merged = []
+    for offset, length, zero in extents:
+        if merged and merged[-1][2] == zero and merged[-1][0] + merged[-1][1] == offset:
+            merged[-1] = (merged[-1][0], merged[-1][1] + length, zero)
+        elif length:
+            merged.append((offset, length, zero))
+    return merged
+
+
+def local_extents(path):
+    """
+    Return list of (offset, length, zero) extents of the local file, where
+    holes of the sparse file are reported as zero extents. If the file
+    system doesn't report holes, the whole file is single data extent.
+    """
+    size = os.path.getsize(path)
+    if not hasattr(os, 'SEEK_DATA'):
+        return merge_extents([(0, size, False)])
+    extents = []
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        offset = 0
+        while offset < size:
+            try:
+                data = os.lseek(fd, offset, os.SEEK_DATA)
+            except OSError as e:
+                # There is no data after the offset, rest of the file is a hole:
+                if e.errno != errno.ENXIO:
+                    raise
+                data = size
+            if data > offset:
+                extents.append((offset, data - offset, True))
+                offset = data
+            else:
+                hole = min(os.lseek(fd, offset, os.SEEK_HOLE), size)
+                extents.append((offset, hole - offset, False))
+                offset = hole
+    except OSError as e:
+        if e.errno not in (errno.EINVAL, errno.ENOTSUP):
+            raise
+        extents = [(0, size, False)]
+    finally:
+        os.close(fd)
+    return merge_extents(extents)
+
+
+def split_ranges(extents, range_size=RANGE_SIZE):
+    """
+    Split the data extents to (offset, length, zero) ranges of at most
+    `range_size` bytes, so they can be transferred by multiple workers.
+    The zero extents are not split, as they don't carry any data. The
+    ranges are aligned to `range_size`, so the blocks of the checksum are
+    not split between multiple data ranges.
+    """
+    ranges = []
+    for start, length, zero in extents:
+        if zero:
+            ranges.append((start, length, zero))
+            continue
+        offset = start
+        while offset < start + length:
+            end = min((offset // range_size + 1) * range_size, start + length)
+            ranges.append((offset, end - offset, zero))
+            offset = end
+    return ranges
+
+
+def run_workers(create_worker, ranges, handler, max_workers=MAX_WORKERS, done=None):
+    """
+    Call `handler(worker, offset, length, zero)` for every range, using pool of
+    `max_workers` threads, where every thread uses its own worker created by
+    `create_worker()`. Every successfully transferred range is reported by
+    `done(offset, length, zero)`, which is called by one thread at a time.
+    The first error stops all workers and is re-raised.
+    """
+    pending = queue.Queue()
+    for item in ranges:
+        pending.put(item)
+    errors = []
+    lock = threading.Lock()
+
+    def run():
+        try:
+            worker = create_worker()
+        except Exception as e:
+            errors.append(e)
+            return
+        try:
+            while not errors:
+                try:
+                    offset, length, zero = pending.get_nowait()
+                except queue.Empty:
+                    return
+                handler(worker, offset, length, zero)
+                if done is not None:
+                    with lock:
+                        done(offset, length, zero)
+        except Exception as e:
+            errors.append(e)
+        finally:
+            worker.close()
+
+    threads = [
+        threading.Thread(target=run, name='imageio-%d' % i)
+        for i in range(max(1, min(max_workers, len(ranges))))
+    ]
+    for thread in threads:
+        thread.daemon = True
+        thread.start()
+    for thread in threads:
+        thread.join()
+    if errors:
+        raise errors[0]
+
+
+class Journal(object):
+    """
+    Checkpoint journal of the transfer of the local image, which is stored
+    next to the image, unless `journal_path` is specified. It records the ID
+    of the image transfer and the byte ranges, which were already
+    transferred, so the failed transfer can be resumed by transferring only
+    the missing ranges.
+    """
+
+    def __init__(self, path, direction, journal_path=None):
+        self.path = journal_path or '%s.journal' % path
+        self.direction = direction
+        self.transfer_id = None
+        self.completed = []
+        if os.path.exists(self.path):
+            with open(self.path) as journal:
+                data = json.load(journal)
+            if data.get('direction') == direction:
+                self.transfer_id = data.get('transfer_id')
+                self.completed = [tuple(item) for item in data.get('completed', [])]
+        # The data transferred by the previous runs are verified at the end:
+        self.resumed = bool(self.completed)
+
+    def covers(self, offset, length):
+        return any(start <= offset and offset + length <= end for start, end in self.completed)
+
+    def add(self, offset, length):
+        completed = []
+        start, end = offset, offset + length
+        for item_start, item_end in self.completed:
+            if item_end < start or end < item_start:
+                completed.append((item_start, item_end))
+            else:
+                start, end = min(start, item_start), max(end, item_end)
+        completed.append((start, end))
+        self.completed = sorted(completed)
+        self.save()
+
+    def reset(self, transfer_id=None):
+        self.transfer_id = transfer_id
+        self.completed = []
+        self.resumed = False
+        self.save()
+
+    def save(self):
+        # Replace the journal atomically, so it is never left half written:
+        tmp_path = '%s.tmp' % self.path
+        with open(tmp_path, 'w') as journal:
+            json.dump(
+                dict(
+                    transfer_id=self.transfer_id,
+                    direction=self.direction,
+                    completed=self.completed,
+                ),
+                journal,
+            )
+        os.rename(tmp_path, self.path)
+
+    def remove(self):
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+
+def _new_hash(algorithm, data=b''):
+    if algorithm.startswith('blake2'):
+        return hashlib.new(algorithm, data, digest_size=32)
+    return hashlib.new(algorithm, data)
+
+
+class ChecksumError(RuntimeError):
+    """
+    The checksum of the local image doesn't match the checksum of the image
+    computed by the imageio server.
+    """
+
+
+class Checksum(object):
+    """
+    Checksum of the image computed the same way as the imageio server
+    computes it, by hashing the digests of the blocks of the image.
+
+    The blocks are hashed from the data as they are transferred, in any
+    order and by multiple workers, so the image doesn't have to be read
+    again to compute its checksum. Blocks, which were not transferred,
+    are read from the local image by `hexdigest()`.
+    """
+
+    def __init__(self, size, algorithm=CHECKSUM_ALGORITHM, block_size=CHECKSUM_BLOCK_SIZE):
+        self.size = size
+        self.algorithm = algorithm
+        self.block_size = block_size
+        self._digests = {}
+        # Block index -> [hash, next offset, data received out of order]:
+        self._blocks = {}
+        self._zero_digest = None
+        self._lock = threading.Lock()
+
+    def _block_end(self, index):
+        return min((index + 1) * self.block_size, self.size)
+
+    def _add(self, index, offset, data):
+        state = self._blocks.get(index)
+        if state is None:
+            state = self._blocks[index] = [_new_hash(self.algorithm), index * self.block_size, {}]
+        block_hash, next_offset, pending = state
+        if offset != next_offset:
+            pending[offset] = bytes(data)
+            return
+        block_hash.update(data)
+        next_offset += len(data)
+        while next_offset in pending:
+            data = pending.pop(next_offset)
+            block_hash.update(data)
+            next_offset += len(data)
+        state[1] = next_offset
+        if next_offset == self._block_end(index):
+            self._digests[index] = block_hash.digest()
+            del self._blocks[index]
+
+    def update(self, offset, data):
+        data = memoryview(data)
+        with self._lock:
+            while data:
+                index = offset // self.block_size
+                length = self._block_end(index) - offset
+                self._add(index, offset, data[:length])
+                offset += len(data[:length])
+                data = data[length:]
+
+    def zero(self, offset, length):
+        end = offset + length
+        with self._lock:
+            while offset < end:
+                index = offset // self.block_size
+                block_end = self._block_end(index)
+                piece_end = min(block_end, end)
+                if offset == index * self.block_size and piece_end == block_end == offset + self.block_size:
+                    # Whole zero block is hashed only once:
+                    if self._zero_digest is None:
+                        self._zero_digest = _new_hash(self.algorithm, b'\0' * self.block_size).digest()
+                    self._digests[index] = self._zero_digest
+                else:
+                    self._add(index, offset, b'\0' * (piece_end - offset))
+                offset = piece_end
+
+    def hexdigest(self, path):
+        """
+        Return the checksum of the image, the blocks which were not
+        transferred are read from the local image `path`. The image is
+        considered to be padded with zeros up to the size of the checksum.
+        """
+        outer = _new_hash(self.algorithm)
+        with open(path, 'rb') as image:
+            for index in range(int(math.ceil(self.size / float(self.block_size)))):
+                digest = self._digests.get(index)
+                if digest is None:
+                    length = self._block_end(index) - index * self.block_size
+                    image.seek(index * self.block_size)
+                    block = image.read(length)
+                    block += b'\0' * (length - len(block))
+                    digest = _new_hash(self.algorithm, block).digest()
+                outer.update(digest)
+        return outer.hexdigest()
+
+
+def verify(client, checksum, path):
+    """
+    Compare the checksum of the local image with the checksum of the image
+    computed by the imageio server. Return dictionary describing the
+    checksum, which is not verified when the imageio server doesn't
+    support checksums.
+    """
+    result = dict(
+        algorithm=checksum.algorithm,
+        block_size=checksum.block_size,
+        checksum=checksum.hexdigest(path),
+        verified=False,
+    )
+    remote = client.checksum(checksum.algorithm, checksum.block_size)
+    if remote is None:
+        return result
+    if result['checksum'] != remote['checksum']:
+        raise ChecksumError(
+            "Checksum of the local image %s doesn't match the checksum of the transferred image %s"
+            % (result['checksum'], remote['checksum'])
+        )
+    result['verified'] = True
+    return result
+
+
+def _max_workers(options, key, max_workers):
+    # Don't use more connections than the imageio server accepts for the image:
+    if options.get(key):
+        return min(max_workers, options[key])
+    return max_workers
+
+
+class _Stats(object):
+
+    def __init__(self, extents, journal=None):
+        self.start = time.time()
+        self.size = sum(length for offset, length, zero in extents)
+        self.transferred = 0
+        self.zero = 0
+        self.journal = journal
+
+    def done(self, offset, length, zero):
+        if zero:
+            self.zero += length
+        else:
+            self.transferred += length
+        if self.journal is not None:
+            self.journal.add(offset, length)
+
+    def pending(self, ranges):
+        if self.journal is None:
+            return ranges
+        return [item for item in ranges if not self.journal.covers(item[0], item[1])]
+
+    def result(self):
+        elapsed = max(time.time() - self.start, 0.001)
+        return dict(
+            size=self.size,
+            transferred=self.transferred,
+            zero=self.zero,
+            elapsed=round(elapsed, 3),
+            throughput=int(self.transferred / elapsed),
+        )
+
+
+def download(url, ticket, context, path, max_workers=MAX_WORKERS, buffer_size=BUFFER_SIZE, journal=None, checksum=False,
+             bandwidth_limit=None):
+    """
+    Download the image of the transfer to the local file `path`, using
+    `max_workers` connections, every one of them downloading different
+    ranges of the image. Only the data extents of the image are downloaded,
+    the zero extents are left as holes of the sparse local file. If the
+    `journal` is passed, the ranges recorded in the journal are skipped and
+    every downloaded range is recorded to the journal. If `checksum` is
+    True or the download is resumed, the image is verified by its checksum.
+    The `bandwidth_limit` limits the rate of the download in bytes per second,
+    it can be also `TokenBucket` shared with other transfers.
+    Return the statistics of the transfer.
+    """
+    bucket = _token_bucket(bandwidth_limit)
+    client = ImageioClient(url, ticket, context, buffer_size=buffer_size)
+    try:
+        options = client.options()
+        if 'extents' in options.get('features', []):
+            extents = client.extents()
+        else:
+            extents = merge_extents([(0, client.size(), False)])
+        stats = _Stats(extents, journal)
+        resumed = journal is not None and journal.resumed
+        image_checksum = Checksum(stats.size) if checksum or resumed else None
+
+        # Keep the data downloaded by the previous run when resuming:
+        with open(path, 'r+b' if resumed and os.path.exists(path) else 'wb') as image:
+            image.truncate(stats.size)
+
+        def handler(worker, offset, length, zero):
+            if not zero:
+                worker.client.read_range(offset, length, worker.image, checksum=image_checksum)
+            elif image_checksum is not None:
+                image_checksum.zero(offset, length)
+
+        run_workers(
+            lambda: TransferWorker(url, ticket, context, path, 'r+b', buffer_size=buffer_size, bucket=bucket),
+            stats.pending(split_ranges(extents)),
+            handler,
+            max_workers=_max_workers(options, 'max_readers', max_workers),
+            done=stats.done,
+        )
+        result = stats.result()
+        if image_checksum is not None:
+            result['checksum'] = verify(client, image_checksum, path)
+    finally:
+        client.close()
+    return result
+
+
+def upload(url, ticket, context, path, max_workers=MAX_WORKERS, buffer_size=BUFFER_SIZE, journal=None, checksum=False,
+           bandwidth_limit=None):
+    """
+    Upload the local file `path` to the image of the transfer, using
+    `max_workers` connections, every one of them uploading different
+    ranges of the image. The holes of the sparse local file are zeroed
+    by the imageio server instead of sending the zeros. The data are
+    flushed once, when all the ranges are uploaded. If the `journal` is
+    passed, the ranges recorded in the journal are skipped and every
+    uploaded range is recorded to the journal. If `checksum` is True or
+    the upload is resumed, the image is verified by its checksum. The
+    `bandwidth_limit` limits the rate of the upload in bytes per second,
+    it can be also `TokenBucket` shared with other transfers.
+    Return the statistics of the transfer.
+    """
+    bucket = _token_bucket(bandwidth_limit)
+    client = ImageioClient(url, ticket, context, buffer_size=buffer_size)
+    try:
+        options = client.options()
+        if 'zero' in options.get('features', []):
+            extents = local_extents(path)
+        else:
+            extents = merge_extents([(0, os.path.getsize(path), False)])
+        stats = _Stats(extents, journal)
+        # The image can be bigger than the local file, its checksum
+        # includes also the zeros after the end of the local file:
+        image_checksum = None
+        if checksum or (journal is not None and journal.resumed):
+            image_checksum = Checksum(client.size())
+
+        def handler(worker, offset, length, zero):
+            if zero:
+                worker.client.zero(offset, length)
+                if image_checksum is not None:
+                    image_checksum.zero(offset, length)
+            else:
+                worker.client.write_range(offset, length, worker.image, checksum=image_checksum)
+
+        run_workers(
+            lambda: TransferWorker(url, ticket, context, path, 'rb', buffer_size=buffer_size, bucket=bucket),
+            stats.pending(split_ranges(extents)),
+            handler,
+            max_workers=_max_workers(options, 'max_writers', max_workers),
+            done=stats.done,
+        )
+        client.flush()
+        result = stats.result()
+        if image_checksum is not None:
+            result['checksum'] = verify(client, image_checksum, path)
+    finally:
+        client.close()
+    return result
+
+
+class _PeekableStream(object):
+    """
+    File object reading the `stream`, which allows to look at the head
+    of the stream before it's read.
+    """
+
+    def __init__(self, stream):
+        self._stream = stream
+        self._head = b''
+
+    def peek(self, size):
+        while len(self._head) < size:
+            data = self._stream.read(size - len(self._head))
+            if not data:
+                break
+            self._head += data
+        return self._head[:size]
+
+    def read(self, size=-1):
+        if self._head:
+            if size is None or size < 0:
+                size = len(self._head)
+            data, self._head = self._head[:size], self._head[size:]
+            return data
+        return self._stream.read(size)
+
+
+class DecompressedStream(object):
+    """
+    File object reading the data of the `stream` compressed by `compression`,
+    which is one of 'gzip', 'xz' or 'bzip2'. At most `size` bytes are
+    decompressed by every read, so the zeros compressed to few bytes don't
+    have to fit into the memory.
+    """
+
+    def __init__(self, stream, compression, buffer_size=BUFFER_SIZE):
+        self._stream = stream
+        self._buffer_size = buffer_size
+        if compression == 'gzip':
+            self._decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        elif compression == 'xz':
+            import lzma
+            self._decompressor = lzma.LZMADecompressor()
+        else:
+            import bz2
+            self._decompressor = bz2.BZ2Decompressor()
+
+    def read(self, size=-1):
+        if size is None or size < 0:
+            size = self._buffer_size
+        data = b''
+        while not data and not self._decompressor.eof:
+            # The zlib decompressor keeps the input it didn't decompress yet in
+            # unconsumed_tail, the lzma and bz2 decompressors keep it internally:
+            if getattr(self._decompressor, 'unconsumed_tail', b''):
+                compressed = self._decompressor.unconsumed_tail
+            elif getattr(self._decompressor, 'needs_input', True):
+                compressed = self._stream.read(self._buffer_size)
+                if not compressed:
+                    raise RuntimeError("Unexpected end of the compressed image")
+            else:
+                compressed = b''
+            data = self._decompressor.decompress(compressed, size)
+        return data
+
+
+class ImageStream(object):
+    """
+    Image read sequentially from the file object `stream`, for example from
+    the HTTP response, so the image doesn't have to be stored locally. The
+    image compressed by gzip, xz or bzip2 is decompressed and the first disk
+    of the OVA archive is extracted, as the image is read. The `size` is
+    the size of the data of the `stream`, if it's known.
+
+    The `format` of the image is 'qcow2' or 'raw', the `virtual_size` is
+    the size of the disk and the `size` is the size of the image data,
+    they are None if they aren't known before the whole image is read.
+    """
+
+    def __init__(self, stream, size=None):
+        stream = _PeekableStream(stream)
+        self.compression = None
+        for compression, magic in COMPRESSION_MAGICS:
+            if stream.peek(len(magic)) == magic:
+                self.compression = compression
+                stream = _PeekableStream(DecompressedStream(stream, compression))
+                size = None
+                break
+
+        self.ovf = None
+        if stream.peek(tarfile.BLOCKSIZE)[257:262] == b'ustar':
+            stream, size = self._extract_disk(tarfile.open(fileobj=stream, mode='r|'))
+            stream = _PeekableStream(stream)
+
+        head = stream.peek(512)
+        if head.startswith(QCOW2_MAGIC):
+            backing_file_offset, cluster_bits, virtual_size = struct.unpack('>Q4xIQ', head[8:32])
+            if backing_file_offset:
+                raise ValueError("The qcow2 image with backing file is not supported")
+            self.format = 'qcow2'
+            self.virtual_size = virtual_size
+            self._cluster_size = 1 << cluster_bits
+        elif head.startswith(b'KDMV'):
+            raise ValueError("The VMDK image is not supported, only qcow2 and raw images are supported")
+        else:
+            self.format = 'raw'
+            self.virtual_size = size
+            self._cluster_size = 64 * 1024
+        self.size = size
+        self._stream = stream
+
+    def _extract_disk(self, archive):
+        for member in archive:
+            if member.name.endswith('.ovf'):
+                self.ovf = archive.extractfile(member).read().decode('utf-8')
+            elif member.isfile() and member.size and not member.name.endswith(('.mf', '.cert')):
+                return archive.extractfile(member), member.size
+        raise ValueError("The OVA archive doesn't contain any disk")
+
+    @property
+    def initial_size(self):
+        """
+        Return the size of the qcow2 image, or the maximal size of the qcow2
+        image of the whole `virtual_size`, if the size isn't known.
+        """
+        if self.format == 'qcow2' and self.size is not None:
+            return self.size
+        if self.virtual_size is None:
+            return None
+        clusters = -(-self.virtual_size // self._cluster_size)
+        # The L2 tables and the refcount blocks, plus the header, L1 and refcount tables:
+        metadata = -(-clusters * 16 // self._cluster_size) + 8
+        return (clusters + metadata) * self._cluster_size
+
+    def read(self, size=-1):
+        return self._stream.read(size)
+
+
+def _read_chunk(stream, size):
+    chunk = b''
+    while len(chunk) < size:
+        data = stream.read(size - len(chunk))
+        if not data:
+            break
+        chunk += data
+    return chunk
+
+
+def upload_stream(url, ticket, context, stream, max_workers=MAX_WORKERS, buffer_size=BUFFER_SIZE, bandwidth_limit=None,
+                  chunk_size=STREAM_CHUNK_SIZE):
+    """
+    Upload the image read sequentially from the file object `stream`, which
+    doesn't have to be seekable, so the image can be uploaded as it's
+    downloaded and decompressed. The image is read by chunks of `chunk_size`
+    bytes, which are uploaded by `max_workers` connections, so only few
+    chunks are kept in the memory. The chunks of zeros are zeroed by the
+    imageio server instead of sending the zeros. The `bandwidth_limit`
+    limits the rate of the upload in bytes per second, it can be also
+    `TokenBucket` shared with other transfers. Return the
+    statistics of the transfer.
+    """
+    bucket = _token_bucket(bandwidth_limit)
+    client = ImageioClient(url, ticket, context, buffer_size=buffer_size)
+    try:
+        options = client.options()
+        can_zero = 'zero' in options.get('features', [])
+        max_workers = max(1, _max_workers(options, 'max_writers', max_workers))
+        stats = _Stats([])
+        chunks = queue.Queue(max_workers)
+        errors = []
+        lock = threading.Lock()
+
+        def run():
+            worker = None
+            while True:
+                item = chunks.get()
+                if item is None:
+                    break
+                # Keep taking the chunks after the error, so the reader isn't blocked:
+                if errors:
+                    continue
+                offset, data, zero = item
+                try:
+                    if worker is None:
+                        worker = ImageioClient(url, ticket, context, buffer_size=buffer_size, bucket=bucket)
+                    if zero:
+                        worker.zero(offset, len(data))
+                    else:
+                        worker.write(offset, data)
+                    with lock:
+                        stats.done(offset, len(data), zero)
+                except Exception as e:
+                    errors.append(e)
+            if worker is not None:
+                worker.close()
+
+        threads = [threading.Thread(target=run, name='imageio-%d' % i) for i in range(max_workers)]
+        for thread in threads:
+            thread.daemon = True
+            thread.start()
+        zeros = b'\0' * chunk_size
+        offset = 0
+        try:
+            while not errors:
+                data = _read_chunk(stream, chunk_size)
+                if not data:
+                    break
+                chunks.put((offset, data, can_zero and data == zeros[:len(data)]))
+                offset += len(data)
+        finally:
+            for thread in threads:
+                chunks.put(None)
+            for thread in threads:
+                thread.join()
+        if errors:
+            raise errors[0]
+        client.flush()
+        stats.size = offset
+        result = stats.result()
+    finally:
+        client.close()
+    return result
+
+
+class TransferScheduler(object):
+    """
+    Scheduler of the image transfers of all the modules running on the same
+    machine, which share the state file `path`. The transfers wait in the
+    queue ordered by their priority, until there is free slot for the host
+    and the storage domain of the transfer, as limited by `limits`, which
+    maps 'host'/'storage_domain' to the maximal number of the transfers.
+
+    The state file also keeps the history of the finished transfers, so
+    the aggregate throughput of the concurrent transfers can be reported.
+    """
+
+    HISTORY_SIZE = 100
+
+    def __init__(self, path, limits=None, priority='normal'):
+        self.path = path
+        self.limits = dict((kind, limit) for kind, limit in (limits or {}).items() if limit)
+        self.priority = TRANSFER_PRIORITIES[priority]
+        self._id = '%d-%s' % (os.getpid(), uuid.uuid4())
+        self._start = None
+        self._queued = None
+
+    @contextmanager
+    def _locked_state(self):
+        with locked_state(self.path) as state:
+            for key in ('waiting', 'running'):
+                state[key] = dict(
+                    (entry_id, entry) for entry_id, entry in state.get(key, {}).items() if _is_alive(entry['pid'])
+                )
+            state.setdefault('history', [])
+            yield state
+
+    def _may_start(self, state):
+        used = {}
+        for entry in state['running'].values():
+            for key in entry['keys']:
+                used[key] = used.get(key, 0) + 1
+        # The transfers, which can't start, block the later transfers using the same
+        # host or storage domain, so the transfers with lower priority can't starve them:
+        blocked = set()
+        for entry_id, entry in sorted(state['waiting'].items(), key=lambda item: (item[1]['priority'], item[1]['seq'])):
+            may_start = all(
+                key not in blocked and used.get(key, 0) < self.limits.get(key.split(':', 1)[0], float('inf'))
+                for key in entry['keys']
+            )
+            if entry_id == self._id:
+                return may_start
+            if may_start:
+                for key in entry['keys']:
+                    used[key] = used.get(key, 0) + 1
+            else:
+                blocked.update(entry['keys'])
+        return False
+
+    def acquire(self, timeout=None, poll_interval=1, max_poll_interval=30, **keys):
+        """
+        Wait until the transfer using the `keys`, for example the host and
+        the storage domain of the transfer, can start, at most `timeout`
+        seconds, or without limit if `timeout` is None. The state is checked
+        in increasing intervals, starting at `poll_interval` up to
+        `max_poll_interval` seconds, so the waiting transfers don't lock
+        the state file all the time.
+        """
+        queued = time.time()
+        keys = sorted('%s:%s' % (kind, value) for kind, value in keys.items() if value)
+        with self._locked_state() as state:
+            state['seq'] = state.get('seq', 0) + 1
+            state['waiting'][self._id] = dict(
+                pid=os.getpid(),
+                priority=self.priority,
+                seq=state['seq'],
+                keys=keys,
+            )
+        try:
+            interval = poll_interval
+            while True:
+                with self._locked_state() as state:
+                    if self._may_start(state):
+                        entry = state['waiting'].pop(self._id)
+                        self._start = time.time()
+                        self._queued = self._start - queued
+                        state['running'][self._id] = dict(pid=entry['pid'], keys=keys, start=self._start)
+                        return
+                if timeout is not None and time.time() > queued + timeout:
+                    raise RuntimeError("Timed out waiting for the transfer slot of %s" % ', '.join(keys))
+                time.sleep(interval * random.uniform(0.9, 1.1))
+                interval = min(interval * 2, max_poll_interval)
+        except BaseException:
+            with self._locked_state() as state:
+                state['waiting'].pop(self._id, None)
+            raise
+
+    def running(self):
+        """
+        Return the number of the running transfers of the scheduler.
+        """
+        with self._locked_state() as state:
+            return len(state['running'])
+
+    def release(self, transferred=0):
+        """
+        Release the slot of the transfer, which transferred `transferred`
+        bytes. Return the time the transfer waited in the queue and the
+        aggregate throughput of the transfers running concurrently with it.
+        """
+        if self._start is None:
+            return {}
+        now = time.time()
+        with self._locked_state() as state:
+            state['running'].pop(self._id, None)
+            state['history'].append(dict(start=self._start, end=now, transferred=transferred))
+            del state['history'][:-self.HISTORY_SIZE]
+            history = list(state['history'])
+        self._start, start = None, self._start
+
+        # Find the period of the overlapping transfers, which contains this transfer:
+        period_start, period_end, period_transferred = start, now, 0
+        changed = True
+        while changed:
+            changed = False
+            for entry in history:
+                if entry.get('counted') is None and entry['start'] <= period_end and entry['end'] >= period_start:
+                    entry['counted'] = True
+                    period_start = min(period_start, entry['start'])
+                    period_end = max(period_end, entry['end'])
+                    period_transferred += entry['transferred']
+                    changed = True
+        return dict(
+            queued=round(self._queued, 3),
+            aggregate_throughput=int(period_transferred / max(period_end - period_start, 0.001)),
+        )
+
+
+def _is_alive(pid):
+    try:
+        os.kill(pid, 0)
+    except OSError as e:
+        return e.errno == errno.EPERM
+    return True
+
+
+def create_bandwidth_limit(params):
+    """
+    Create the token bucket limiting the rate of the transfer by the
+    `bandwidth_limit` of the `transfer_scheduler` parameter of the module.
+    The limit is shared by all the transfers running in the scheduler,
+    every one of them gets the same share of it. Return None if there
+    is no limit.
+    """
+    if not params or not params.get('bandwidth_limit'):
+        return None
+    scheduler = TransferScheduler(params['path'])
+    return TokenBucket(params['bandwidth_limit'], share=scheduler.running)
+
+
+def create_transfer_scheduler(params):
+    """
+    Create the transfer scheduler from the `transfer_scheduler` parameter
+    of the module, or return None if the parameter isn't passed.
+    """
+    if not params:
+        return None
+    return TransferScheduler(
+        params['path'],
+        limits=dict(
+            host=params.get('max_transfers_per_host'),
+            storage_domain=params.get('max_transfers_per_storage_domain'),
+        ),
+        priority=params.get('priority') or 'normal',
+    )
+
+
+def proxied(url):
+    """
+    Return True if the `url` is accessed through a proxy, according to
+    the proxy environment variables, the same way as the `proxied` test.
+    """
+    netloc = urlparse(url).netloc
+    return bool(getproxies_environment()) and not proxy_bypass(netloc)
+
+
+class ProbeCache(object):
+    """
+    Cache of the results of the probes of the direct connections to the
+    hosts, by the host address. The results are shared by all the modules
+    running on the same machine using the same file `path` and they expire
+    after `ttl` seconds. Without `path` the results are only kept
+    in memory.
+    """
+
+    def __init__(self, path=None, ttl=3600):
+        self.path = path
+        self.ttl = ttl
+        self._probes = {}
+
+    @contextmanager
+    def _locked_probes(self):
+        if self.path is None:
+            yield self._probes
+            return
+        with locked_state(self.path) as probes:
+            now = time.time()
+            for address, probe in list(probes.items()):
+                if probe['time'] + self.ttl < now:
+                    del probes[address]
+            yield probes
+
+    def get(self, address):
+        """
+        Return True if the direct connection to the `address` works,
+        False if it doesn't, or None if it wasn't probed recently.
+        """
+        with self._locked_probes() as probes:
+            probe = probes.get(address)
+            if probe is None or probe['time'] + self.ttl < time.time():
+                return None
+            return probe['direct']
+
+    def set(self, address, direct):
+        with self._locked_probes() as probes:
+            probes[address] = dict(direct=direct, time=time.time())
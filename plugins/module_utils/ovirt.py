@@ -21,12 +21,19 @@
 from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
-import inspect
+import hashlib
+import json
+import os
+import random
 import time
+import weakref
 
 from abc import ABCMeta, abstractmethod
+from collections import OrderedDict
+from contextlib import contextmanager
 from datetime import datetime
 
+from ansible_collections.ovirt.ovirt.plugins.module_utils import capabilities
 from ansible_collections.ovirt.ovirt.plugins.module_utils.cloud import CloudRetry
 from ansible_collections.ovirt.ovirt.plugins.module_utils.version import ComparableVersion
 from ansible.module_utils.basic import env_fallback
@@ -50,6 +57,15 @@ BYTES_MAP = {
     'pib': 2**50,
 }
 
+# The cached token used within this number of seconds isn't tested before it's returned:
+TOKEN_VALIDATION_INTERVAL = 60
+
+# Number of the polls of the events, after which the entity is checked even without an event about it:
+EVENTS_CHECK_INTERVAL = 10
+
+# Maximal number of the entities kept by the link cache of the connection, None means no limit:
+LINK_CACHE_SIZE = 1000
+
 
 def check_sdk(module):
     if not HAS_SDK:
@@ -66,6 +82,10 @@ def remove_underscore(val):
 
 
 def get_dict_of_struct_follow(struct, filter_keys):
+    """
+    Convert SDK Struct type with followed links into dictionary.
+    Only the top level keys are filtered by `filter_keys`, the nested values are converted whole.
+    """
     if isinstance(struct, sdk.Struct):
         res = {}
         for key, value in struct.__dict__.items():
@@ -73,30 +93,82 @@ def get_dict_of_struct_follow(struct, filter_keys):
                 continue
             key = remove_underscore(key)
             if filter_keys is None or key in filter_keys:
-                res[key] = get_dict_of_struct_follow(value, filter_keys)
+                res[key] = get_dict_of_struct_follow(value, None)
         return res
     elif isinstance(struct, Enum) or isinstance(struct, datetime):
         return str(struct)
     elif isinstance(struct, list) or isinstance(struct, sdk.List):
-        return [get_dict_of_struct_follow(i, filter_keys) for i in struct]
+        return [get_dict_of_struct_follow(i, None) for i in struct]
     return struct
 
 
-def get_dict_of_struct(struct, connection=None, fetch_nested=False, attributes=None, filter_keys=None, follow=None):
+class LinkCache(object):
+    """
+    Cache of the entities fetched by `follow_link`, keyed by their `href`, so
+    the entity linked from many other entities is fetched only once.
+    If `maxsize` is specified the least recently used entities are dropped.
+    """
+
+    def __init__(self, maxsize=None):
+        self._maxsize = maxsize
+        self._entities = OrderedDict()
+
+    def follow_link(self, connection, link):
+        """
+        Return the entity which link points to, or None if it can't be fetched.
+        """
+        href = link.href
+        if href in self._entities:
+            # Move the entity to the end, as the most recently used:
+            entity = self._entities.pop(href)
+        else:
+            try:
+                entity = connection.follow_link(link)
+            except sdk.Error:
+                entity = None
+
+        self._entities[href] = entity
+        if self._maxsize is not None and len(self._entities) > self._maxsize:
+            self._entities.popitem(last=False)
+        return entity
+
+    def clear(self):
+        self._entities.clear()
+
+
+_link_caches = weakref.WeakKeyDictionary()
+
+
+def get_link_cache(connection, maxsize=None):
+    """
+    Return the link cache of the connection. The cache lives as long as the connection
+    and keeps at most `maxsize` entities, `LINK_CACHE_SIZE` by default.
+    """
+    cache = _link_caches.get(connection)
+    if cache is None:
+        cache = _link_caches[connection] = LinkCache(maxsize or LINK_CACHE_SIZE)
+    return cache
+
+
+def get_dict_of_struct(struct, connection=None, fetch_nested=False, attributes=None, filter_keys=None, follow=None, link_cache=None):
     """
     Convert SDK Struct type into dictionary.
+
+    Nested entities fetched when `fetch_nested` is used are cached in `link_cache`,
+    if it's not specified the cache of the `connection` is used.
+    If `filter_keys` is specified, only those attributes are converted and only
+    their nested entities are fetched.
     """
     if follow:
         return get_dict_of_struct_follow(struct, filter_keys)
 
     res = {}
+    if fetch_nested and link_cache is None and connection is not None:
+        link_cache = get_link_cache(connection)
 
     def resolve_href(value):
         # Fetch nested values of struct:
-        try:
-            value = connection.follow_link(value)
-        except sdk.Error:
-            value = None
+        value = link_cache.follow_link(connection, value)
         nested_obj = dict(
             (attr, convert_value(getattr(value, attr)))
             for attr in attributes if getattr(value, attr, None) is not None
@@ -168,6 +240,128 @@ def engine_version(connection):
     return '%s.%s' % (engine_version.major, engine_version.minor)
 
 
+@contextmanager
+def locked_state(path):
+    """
+    Yield the dictionary stored in the JSON file `path`, exclusively locked
+    for the other processes, and store it back to the file when done.
+    """
+    import fcntl
+
+    fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+    with os.fdopen(fd, 'r+') as state_file:
+        fcntl.flock(state_file, fcntl.LOCK_EX)
+        try:
+            state = json.loads(state_file.read() or '{}')
+        except ValueError:
+            state = {}
+        yield state
+        state_file.seek(0)
+        state_file.truncate()
+        json.dump(state, state_file)
+
+
+def _token_connection(entry):
+    return sdk.Connection(
+        url=entry['url'],
+        token=entry['token'],
+        ca_file=entry.get('ca_file'),
+        insecure=entry.get('insecure', False),
+    )
+
+
+def _test_cached_token(entry):
+    """
+    Return True if the engine still accepts the token of the entry of the token cache.
+    """
+    connection = _token_connection(entry)
+    try:
+        return connection.test()
+    finally:
+        connection.close(logout=False)
+
+
+def _logout_cached_token(entry):
+    """
+    Logout the SSO session of the expired entry of the token cache, so the
+    session isn't left open on the engine until its own timeout.
+    """
+    if not entry.get('url'):
+        return
+    try:
+        _token_connection(entry).close(logout=True)
+    except Exception:
+        # The session may have been already invalidated by the engine:
+        pass
+
+
+def _login_cached_token(url, auth):
+    connection = sdk.Connection(
+        url=url,
+        username=auth.get('username'),
+        password=auth.get('password'),
+        ca_file=auth.get('ca_file', None),
+        insecure=auth.get('insecure', False),
+        headers=auth.get('headers', None),
+    )
+    try:
+        return dict(
+            token=connection.authenticate(),
+            url=url,
+            ca_file=auth.get('ca_file'),
+            insecure=auth.get('insecure', False),
+        )
+    finally:
+        connection.close(logout=False)
+
+
+def _get_cached_token(url, auth):
+    """
+    Return SSO token for the `url`, credentials and `ca_file` of the `auth`
+    from the token cache. If there is no token, the token wasn't used for
+    `token_cache_timeout` seconds, or the engine doesn't accept it anymore,
+    login and store the new token in cache.
+
+    The cache is locked only while reading and updating the entries, the
+    tokens are tested and the expired sessions are logged out without the
+    lock, so the parallel tasks don't wait for each other.
+    """
+    key = hashlib.sha256(
+        '\n'.join([url, auth.get('username') or '', auth.get('password') or '', auth.get('ca_file') or '']).encode('utf-8')
+    ).hexdigest()
+    timeout = auth.get('token_cache_timeout') or 600
+    now = time.time()
+    with locked_state(auth.get('token_cache')) as cache:
+        # Expire idle sessions, so we don't pass token which engine already invalidated:
+        expired = [cache.pop(k) for k, v in list(cache.items()) if v.get('last_used', 0) + timeout < now]
+        entry = cache.get(key)
+        if entry is not None:
+            used = entry['last_used']
+            entry['last_used'] = now
+
+    for expired_entry in expired:
+        _logout_cached_token(expired_entry)
+
+    if entry is not None:
+        # Token used by other task just now is still valid, so don't pay for the round-trip:
+        if now - used < TOKEN_VALIDATION_INTERVAL:
+            return entry['token']
+        entry.update(url=url, ca_file=auth.get('ca_file'), insecure=auth.get('insecure', False))
+        if _test_cached_token(entry):
+            return entry['token']
+
+    with locked_state(auth.get('token_cache')) as cache:
+        # The engine dropped the session, for example after its restart or logout, or there
+        # is no session yet. Other task may have logged in meanwhile, otherwise login while
+        # holding the lock, so parallel tasks wait for single SSO login and don't leak sessions:
+        cached = cache.get(key)
+        if cached is None or (entry is not None and cached['token'] == entry['token']):
+            cached = cache[key] = _login_cached_token(url, auth)
+        cached['last_used'] = now
+
+    return cached['token']
+
+
 def create_connection(auth):
     """
     Create a connection to Python SDK, from task `auth` parameter.
@@ -180,6 +374,10 @@ def create_connection(auth):
     The `ca_file` parameter is mandatory in case user want to use secure connection,
     in case user want to use insecure connection, it's mandatory to send insecure=True.
 
+    If user doesn't have SSO token and `token_cache` is specified, the token is
+    taken from the cache file shared by all tasks, so the SSO login is done only once.
+    The token is then stored in `auth`, so the module doesn't logout when closing the connection.
+
     :param auth: dictionary which contains needed values for connection creation
     :return: Python SDK connection
     """
@@ -188,6 +386,9 @@ def create_connection(auth):
     if url is None and auth.get('hostname') is not None:
         url = 'https://{0}/ovirt-engine/api'.format(auth.get('hostname'))
 
+    if auth.get('token') is None and auth.get('token_cache') and not auth.get('kerberos'):
+        auth['token'] = _get_cached_token(url, auth)
+
     return sdk.Connection(
         url=url,
         username=auth.get('username'),
@@ -271,6 +472,67 @@ def equal(param1, param2, ignore_case=False):
     return True
 
 
+def supports_search(service):
+    """
+    Return True if the `list` method of the collection service supports
+    search. The signature is inspected only once per process.
+    """
+    return capabilities.accepts(service.list, 'search')
+
+
+class CollectionIndex(object):
+    """
+    Local view of the entities of the collection, which doesn't support
+    search. The entities are listed once and indexed by the attributes of
+    the lookups, so every lookup is dictionary access instead of the scan
+    of all the entities. When more entities match, the first one is found.
+    """
+
+    def __init__(self, entities):
+        self._entities = list(entities)
+        self._indexes = {}
+
+    def find(self, **kwargs):
+        """
+        Return the first entity with the attributes equal to `kwargs`, or None.
+        """
+        keys = tuple(sorted(kwargs))
+        values = tuple(kwargs[key] for key in keys)
+        try:
+            index = self._indexes.get(keys)
+            if index is None:
+                index = {}
+                for entity in self._entities:
+                    index.setdefault(tuple(getattr(entity, key, None) for key in keys), entity)
+                self._indexes[keys] = index
+            return index.get(values)
+        except TypeError:
+            # Some of the values can't be indexed, for example lists:
+            return next((e for e in self._entities if tuple(getattr(e, key, None) for key in keys) == values), None)
+
+    def add(self, entity):
+        """
+        Add the `entity` created in the collection, so it's found by the following lookups.
+        """
+        self._entities.append(entity)
+        for keys, index in self._indexes.items():
+            try:
+                index.setdefault(tuple(getattr(entity, key, None) for key in keys), entity)
+            except TypeError:
+                pass
+
+    def __iter__(self):
+        return iter(self._entities)
+
+    def __len__(self):
+        return len(self._entities)
+
+
+def _find_by_attributes(entities, **kwargs):
+    # Single lookup doesn't pay off building the index of CollectionIndex:
+    return next((e for e in entities if all(getattr(e, k, None) == v for k, v in kwargs.items())), None)
+
+
 def search_by_attributes(service, list_params=None, **kwargs):
     """
     Search for the entity by attributes. Nested entities don't support search
@@ -279,21 +541,16 @@ def search_by_attributes(service, list_params=None, **kwargs):
     """
     list_params = list_params or {}
     # Check if 'list' method support search(look for search parameter):
-    if 'search' in inspect.getfullargspec(service.list)[0]:
+    if supports_search(service):
         res = service.list(
             # There must be double quotes around name, because some oVirt resources it's possible to create then with space in name.
             search=' and '.join('{0}="{1}"'.format(k, v) for k, v in kwargs.items()),
             **list_params
         )
-    else:
-        res = [
-            e for e in service.list(**list_params) if len([
-                k for k, v in kwargs.items() if getattr(e, k, None) == v
-            ]) == len(kwargs)
-        ]
+        res = res or [None]
+        return res[0]
 
-    res = res or [None]
-    return res[0]
+    return _find_by_attributes(service.list(**list_params), **kwargs)
 
 
 def search_by_name(service, name, **kwargs):
@@ -306,24 +563,65 @@ def search_by_name(service, name, **kwargs):
     :param name: name of the entity
     :return: Entity object returned by Python SDK
     """
+    if kwargs:
+        return _find_by_attributes(service.list(), **kwargs)
+
     # Check if 'list' method support search(look for search parameter):
-    if 'search' in inspect.getfullargspec(service.list)[0]:
+    if supports_search(service):
         res = service.list(
             # There must be double quotes around name, because some oVirt resources it's possible to create then with space in name.
             search='name="{name}"'.format(name=name)
         )
-    else:
-        res = [e for e in service.list() if e.name == name]
+        res = res or [None]
+        return res[0]
 
-    if kwargs:
-        res = [
-            e for e in service.list() if len([
-                k for k, v in kwargs.items() if getattr(e, k, None) == v
-            ]) == len(kwargs)
-        ]
+    return _find_by_attributes(service.list(), name=name)
 
-    res = res or [None]
-    return res[0]
+
+def list_paged(list_method, page_size, search=None, **kwargs):
+    """
+    Yield the entities of the collection, fetching `page_size` entities per
+    request using the `page` clause of the search query, so all the entities
+    don't have to be held in memory.
+
+    :param list_method: `list` method of the collection service
+    :param page_size: number of the entities fetched per request
+    :param search: search query of the entities
+    :param kwargs: additional parameters passed to `list_method`
+    :raises ValueError: if `page_size` isn't positive number
+    """
+    if page_size < 1:
+        raise ValueError("page_size must be greater than zero, got %s" % page_size)
+
+    page = 1
+    while True:
+        entities = list_method(
+            search='{0} page {1}'.format(search or '', page).strip(),
+            max=page_size,
+            **kwargs
+        )
+        for entity in entities:
+            yield entity
+        if len(entities) < page_size:
+            return
+        page += 1
+
+
+def write_json_lines(path, items):
+    """
+    Write every item as JSON object on separate line of the file.
+
+    :param path: path of the file
+    :param items: iterable of the items to be written
+    :return: number of the written items
+    """
+    count = 0
+    with open(path, 'w') as json_file:
+        for item in items:
+            json_file.write(json.dumps(item, default=str))
+            json_file.write('\n')
+            count += 1
+    return count
 
 
 def get_entity(service, get_params=None):
@@ -356,6 +654,132 @@ def get_id_by_name(service, name, raise_error=True, ignore_case=False):
         raise Exception("Entity '%s' was not found." % name)
 
 
+class EntityCache(object):
+    """
+    Cache of the entities searched by their name, keyed by the path of the
+    collection service and the name, so the entity referenced many times,
+    for example the storage domain of every disk, is searched only once.
+    The names which weren't found are cached too.
+    """
+
+    def __init__(self):
+        self._entities = {}
+
+    def search_by_name(self, service, name):
+        """
+        Return the entity with the `name` from the collection `service`,
+        or None, the same way as `search_by_name`.
+        """
+        key = (service._path, name)
+        if key not in self._entities:
+            self._entities[key] = search_by_name(service, name)
+        return self._entities[key]
+
+    def get_id_by_name(self, service, name, raise_error=True):
+        """
+        Return the ID of the entity with the `name`, the same way as `get_id_by_name`.
+        """
+        entity = self.search_by_name(service, name)
+
+        if entity is not None:
+            return entity.id
+
+        if raise_error:
+            raise Exception("Entity '%s' was not found." % name)
+
+    def clear(self):
+        self._entities.clear()
+
+
+_entity_caches = weakref.WeakKeyDictionary()
+
+
+def get_entity_cache(connection):
+    """
+    Return the entity cache of the connection. The cache lives as long as the
+    connection, but it's cleared by `BaseModule` whenever entity is changed.
+    """
+    cache = _entity_caches.get(connection)
+    if cache is None:
+        cache = _entity_caches[connection] = EntityCache()
+    return cache
+
+
+class EventsWatcher(object):
+    """
+    Follows the engine events of the connection and remembers IDs of the
+    entities, which were mentioned in the events since the watcher was created.
+    If events can't be listed, the watcher is marked as not available.
+    """
+
+    def __init__(self, connection):
+        self._service = connection.system_service().events_service()
+        self._last_id = None
+        self._refreshed = None
+        self._seen = {}
+        self.available = True
+        self.refresh()
+
+    def refresh(self, max_age=0):
+        """
+        Fetch the events newer than the last seen event, unless the events
+        were fetched in the last `max_age` seconds, so the waits sharing the
+        watcher don't fetch the same events.
+        """
+        if not self.available or (self._refreshed is not None and time.time() < self._refreshed + max_age):
+            return
+        self._refreshed = time.time()
+        try:
+            if self._last_id is None:
+                events = self._service.list(max=1)
+            else:
+                events = self._service.list(from_=self._last_id)
+        except sdk.Error:
+            self.available = False
+            return
+
+        for event in events:
+            if self._last_id is None or int(event.id) > self._last_id:
+                self._last_id = int(event.id)
+            for value in event.__dict__.values():
+                if isinstance(value, sdk.Struct) and getattr(value, 'id', None):
+                    self._seen[value.id] = self._last_id
+
+    def last_event(self, entity_id):
+        """
+        Return ID of the last event, which mentioned the entity, or None.
+        """
+        return self._seen.get(entity_id)
+
+
+_events_watchers = weakref.WeakKeyDictionary()
+
+
+def get_events_watcher(connection):
+    """
+    Return the events watcher of the connection, so all waits share single events feed.
+    """
+    watcher = _events_watchers.get(connection)
+    if watcher is None:
+        watcher = _events_watchers[connection] = EventsWatcher(connection)
+    return watcher
+
+
+def get_vms_affinity_groups(affinity_groups_service):
+    """
+    Build index of the affinity groups membership, so membership of many VMs
+    can be checked without fetching VMs of every group for every VM.
+
+    :param affinity_groups_service: affinity groups service of the cluster
+    :return: dictionary with list of names of affinity groups by VM ID
+    """
+    index = {}
+    for group in affinity_groups_service.list(follow='vms'):
+        for vm in group.vms or []:
+            index.setdefault(vm.id, []).append(group.name)
+    return index
+
+
 def wait(
     service,
     condition,
@@ -363,20 +787,33 @@ def wait(
     timeout=180,
     wait=True,
     poll_interval=3,
+    connection=None,
 ):
     """
     Wait until entity fulfill expected condition.
 
+    The entity is checked in increasing intervals, starting at one second up to
+    `poll_interval` seconds. If `connection` is passed, the engine events are followed
+    in the same increasing intervals instead, and the entity is checked only when an
+    event about it appears, or at least every `EVENTS_CHECK_INTERVAL` polls, in case
+    the change of the entity isn't reported by any event.
+
     :param service: service of the entity
     :param condition: condition to be fulfilled
     :param fail_condition: if this condition is true, raise Exception
     :param timeout: max time to wait in seconds
     :param wait: if True wait for condition, if False don't wait
-    :param poll_interval: Number of seconds we should wait until next condition check
+    :param poll_interval: Maximal number of seconds we should wait until next condition check
+    :param connection: connection to the Python SDK, whose events should be followed
     """
     # Wait until the desired state of the entity:
     if wait:
         start = time.time()
+        poll_interval = float(poll_interval)
+        interval = min(1.0, poll_interval)
+        watcher = get_events_watcher(connection) if connection is not None else None
+        entity_id = None
+        entity_event = None
         while time.time() < start + timeout:
             # Exit if the condition of entity is valid:
             entity = get_entity(service)
@@ -385,12 +822,84 @@ def wait(
             elif fail_condition(entity):
                 raise Exception("Error while waiting on result state of the entity.")
 
-            # Sleep for `poll_interval` seconds if none of the conditions apply:
-            time.sleep(float(poll_interval))
+            entity_id = getattr(entity, 'id', entity_id)
+            if watcher is not None and watcher.available and entity_id is not None:
+                # Follow the events, until there is new one about the entity
+                # or we didn't check the entity for `EVENTS_CHECK_INTERVAL` polls:
+                for dummy in range(EVENTS_CHECK_INTERVAL):
+                    time.sleep(max(min(interval * random.uniform(0.9, 1.1), start + timeout - time.time()), 0))
+                    interval = min(interval * 2, poll_interval)
+                    watcher.refresh(max_age=interval / 2)
+                    if not watcher.available or time.time() >= start + timeout:
+                        break
+                    if watcher.last_event(entity_id) != entity_event:
+                        entity_event = watcher.last_event(entity_id)
+                        break
+                continue
+
+            # Sleep with jitter, so parallel tasks don't poll at the same time,
+            # and double the interval up to the `poll_interval` if none of the conditions apply:
+            time.sleep(interval * random.uniform(0.9, 1.1))
+            interval = min(interval * 2, poll_interval)
 
         raise Exception("Timeout exceed while waiting on result state of the entity.")
 
 
+class TransferWaiter(object):
+    """
+    Waits for the changes of the phase of the image transfer.
+
+    The transfer is checked in increasing intervals, starting at `min_interval`
+    up to `max_interval` seconds, so short phases finish without idle waiting
+    and long phases don't load the engine. If `connection` is passed, the engine
+    events are followed and the transfer is checked as soon as an event about
+    the disk `disk_id` appears. The time spent waiting for every phase is
+    recorded in `metrics` dictionary, by the name passed to `poll`.
+    """
+
+    def __init__(self, transfer_service, min_interval=0.1, max_interval=1.0, connection=None, disk_id=None, metrics=None):
+        self._service = transfer_service
+        # The `max_interval` may be zero, when it's set by the poll_interval of the module,
+        # so never poll more often than every `min_interval` seconds:
+        self._min_interval = float(min_interval)
+        self._max_interval = max(float(max_interval), self._min_interval)
+        self._interval = self._min_interval
+        self._disk_id = disk_id
+        self._watcher = get_events_watcher(connection) if connection is not None and disk_id else None
+        self._event = self._watcher.last_event(disk_id) if self._watcher is not None else None
+        self._name = None
+        self._start = None
+        self.metrics = metrics if metrics is not None else {}
+
+    def poll(self, name):
+        """
+        Sleep until the next check of the transfer and return the transfer.
+        The time is accounted to the phase `name`; when the name changes, the
+        interval starts again at `min_interval`.
+        """
+        now = time.time()
+        if name != self._name:
+            self._name = name
+            self._start = now
+            self._interval = self._min_interval
+        deadline = now + self._interval * random.uniform(0.9, 1.1)
+        if self._watcher is not None and self._watcher.available and self._interval >= 1.0:
+            # Follow the events, until there is new one about the disk of the transfer:
+            while time.time() < deadline:
+                time.sleep(min(1.0, max(deadline - time.time(), 0)))
+                self._watcher.refresh()
+                if self._watcher.last_event(self._disk_id) != self._event:
+                    self._event = self._watcher.last_event(self._disk_id)
+                    break
+        else:
+            time.sleep(max(deadline - time.time(), 0))
+        self._interval = min(self._interval * 2, self._max_interval)
+        try:
+            return self._service.get()
+        finally:
+            self.metrics[name] = round(time.time() - self._start, 3)
+
+
 def __get_auth_dict():
     return dict(
         type='dict',
@@ -437,7 +946,15 @@ def __get_auth_dict():
                 default=0
             ),
             kerberos=dict(type='bool'),
-            headers=dict(type='dict')
+            headers=dict(type='dict'),
+            token_cache=dict(
+                type='path',
+                fallback=(env_fallback, ['OVIRT_TOKEN_CACHE']),
+            ),
+            token_cache_timeout=dict(
+                type='int',
+                default=600
+            ),
         )
     )
 
@@ -455,6 +972,7 @@ def ovirt_info_full_argument_spec(**kwargs):
         fetch_nested=dict(default=False, type='bool'),
         nested_attributes=dict(type='list', default=list(), elements='str'),
         follow=dict(default=list(), type='list', elements='str', aliases=['follows']),
+        fields=dict(type='list', elements='str'),
     )
     spec.update(kwargs)
     return spec
@@ -483,6 +1001,7 @@ def ovirt_full_argument_spec(**kwargs):
         timeout=dict(default=180, type='int'),
         wait=dict(default=True, type='bool'),
         poll_interval=dict(default=3, type='int'),
+        wait_events=dict(default=False, type='bool'),
         fetch_nested=dict(default=False, type='bool'),
         nested_attributes=dict(type='list', default=list(), elements='str'),
     )
@@ -594,6 +1113,24 @@ class BaseModule(object):
         """
         pass
 
+    def invalidate_caches(self):
+        """
+        This method is called after entity is changed, so the entities cached
+        for the connection are not used any more.
+        """
+        if self._connection is not None:
+            get_link_cache(self._connection).clear()
+            get_entity_cache(self._connection).clear()
+
+    def wait_connection(self):
+        """
+        Return the connection whose events should be followed when waiting
+        for the entity, if user enabled `wait_events`, otherwise None.
+        """
+        if self._module.params.get('wait_events'):
+            return self._connection
+        return None
+
     def diff_update(self, after, update):
         for k, v in update.items():
             if isinstance(v, Mapping):
@@ -648,6 +1185,7 @@ class BaseModule(object):
                         new_entity,
                         **update_params
                     )
+                    self.invalidate_caches()
                     self.post_update(entity)
 
                 # Update diffs only if user specified --diff parameter,
@@ -672,6 +1210,7 @@ class BaseModule(object):
                     self.build_entity(),
                     **kwargs
                 )
+                self.invalidate_caches()
                 self.post_create(entity)
             self.changed = True
 
@@ -694,6 +1233,7 @@ class BaseModule(object):
                 wait=_wait if _wait is not None else self._module.params['wait'],
                 timeout=self._module.params['timeout'],
                 poll_interval=self._module.params['poll_interval'],
+                connection=self.wait_connection(),
             )
 
         return {
@@ -750,12 +1290,14 @@ class BaseModule(object):
         entity_service = self._service.service(entity.id)
         if not self._module.check_mode:
             entity_service.remove(**kwargs)
+            self.invalidate_caches()
             wait(
                 service=entity_service,
                 condition=lambda entity: not entity,
                 wait=self._module.params['wait'],
                 timeout=self._module.params['timeout'],
                 poll_interval=self._module.params['poll_interval'],
+                connection=self.wait_connection(),
             )
         self.changed = True
 
@@ -822,6 +1364,7 @@ class BaseModule(object):
         if action_condition(entity):
             if not self._module.check_mode:
                 getattr(entity_service, action)(**kwargs)
+                self.invalidate_caches()
             self.changed = True
 
         post_action(entity)
@@ -833,6 +1376,7 @@ class BaseModule(object):
             wait=self._module.params['wait'],
             timeout=self._module.params['timeout'],
             poll_interval=self._module.params['poll_interval'],
+            connection=self.wait_connection(),
         )
         return {
             'changed': self.changed,
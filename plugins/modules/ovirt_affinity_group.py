@@ -166,6 +166,13 @@ class AffinityGroupsModule(BaseModule):
         self._host_label_ids = host_label_ids
         self._vm_label_ids = vm_label_ids
 
+    def search_entity(self, search_params=None, list_params=None):
+        # Fetch the assigned VMs along with the affinity group, so we don't need to follow the link:
+        return super(AffinityGroupsModule, self).search_entity(
+            search_params=search_params,
+            list_params=list_params or dict(follow='vms'),
+        )
+
     def update_vms(self, affinity_group):
         """
         This method iterate via the affinity VM assignments and datech the VMs
@@ -252,7 +259,8 @@ class AffinityGroupsModule(BaseModule):
                 vm.id for vm in self._connection.follow_link(affinity_group.vms)
             ])
         else:
-            return sorted([vm.id for vm in affinity_group.vms])
+            # The followed VMs of the group without VMs can be missing:
+            return sorted([vm.id for vm in affinity_group.vms or []])
 
     def update_check(self, entity):
         assigned_vms = self.assigned_vms(entity)
@@ -180,6 +180,7 @@ def main():
                     connection=connection,
                     fetch_nested=module.params.get('fetch_nested'),
                     attributes=module.params.get('nested_attributes'),
+                    filter_keys=module.params.get('fields'),
                 ) for l in labels
             ],
         )
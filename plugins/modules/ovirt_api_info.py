@@ -84,6 +84,7 @@ def main():
                 connection=connection,
                 fetch_nested=module.params.get('fetch_nested'),
                 attributes=module.params.get('nested_attributes'),
+                filter_keys=module.params.get('fields'),
             )
         )
         module.exit_json(changed=False, **result)
@@ -104,6 +104,7 @@ def main():
                     connection=connection,
                     fetch_nested=module.params.get('fetch_nested'),
                     attributes=module.params.get('nested_attributes'),
+                    filter_keys=module.params.get('fields'),
                 ) for d in datacenters
             ],
         )
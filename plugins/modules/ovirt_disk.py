@@ -66,6 +66,20 @@ options:
             - "Note that in order to upload iso the C(format) should be 'raw'."
         type: str
         aliases: ['image_path']
+    upload_image_url:
+        description:
+            - "URL of the disk image, which should be uploaded. The image is streamed from the URL to the disk,
+               so it's not stored locally and it's read only once."
+            - "The image can be qcow2 or raw image, it can be compressed by gzip, xz or bzip2 and it can be
+               OVA archive, in which case the first disk of the archive is uploaded."
+            - "The qcow2 image is uploaded as it is, so the C(format) must be I(cow) and the image must not have
+               backing file."
+            - "If C(size) is not specified the size of the disk is determined by the image. The size of the compressed
+               raw image isn't known before the whole image is read, so the C(size) must be specified for such image."
+            - "The image is uploaded only when the disk is created or C(force) is I(true), the same way as C(upload_image_path).
+               Resuming and checksum of the transfer are not supported for the streamed image."
+        type: str
+        version_added: 3.3.0
     size:
         description:
             - "Size of the disk. Size should be specified using IEC standard units.
@@ -247,6 +261,111 @@ options:
             - The use of multiple workers can speed up the process.
         type: int
         version_added: 1.7.0
+    resume:
+        description:
+            - If I(true) the upload/download of the image records the transferred ranges of the image
+              to the journal file, which is stored next to the local image with C(.journal) suffix,
+              unless C(journal_path) is specified.
+            - When the transfer fails, the image transfer is paused and the next run of the module
+              with C(resume) I(true) resumes it and transfers only the ranges missing in the journal.
+              If the paused image transfer doesn't exist anymore, new image transfer is created.
+            - The image, which was resumed, is verified by its checksum at the end of the transfer,
+              if the imageio server supports checksums. If the checksums don't match, the image transfer
+              is cancelled and the journal is removed, so the next run of the module starts new transfer.
+            - Resuming of the transfer is supported only for raw images, so C(format) must be I(raw)
+              when downloading the image.
+        type: bool
+        default: false
+        version_added: 3.3.0
+    journal_path:
+        description:
+            - Path to the journal file of the transfer, when C(resume) is I(true).
+            - By default the journal is stored next to the local image, so the directory of the image
+              must be writable. Use this parameter when it isn't, for example when uploading the image
+              from a read-only directory.
+        type: path
+        version_added: 3.3.0
+    checksum:
+        description:
+            - If I(true) the checksum of the image is computed from the data as they are uploaded/downloaded,
+              so the image doesn't have to be read again, and it is compared with the checksum of the image
+              computed by the imageio server, if the imageio server supports checksums.
+            - The checksum is returned in C(transfer) result.
+            - The checksum is supported only for raw images, so C(format) must be I(raw) when downloading the image.
+        type: bool
+        default: false
+        version_added: 3.3.0
+    transfer_scheduler:
+        description:
+            - Dictionary of the parameters of the transfer scheduler, which limits the number of the image
+              transfers running concurrently for the same host and storage domain.
+            - The transfers of all the tasks running on the same machine and using the same C(path) wait
+              in the queue, ordered by their C(priority), until there is free slot for the transfer.
+            - The transfer statistics returned in C(transfer) contain the time the transfer waited in the queue
+              and the aggregate throughput of the transfers, which were running concurrently with the transfer.
+        type: dict
+        version_added: 3.3.0
+        suboptions:
+            path:
+                description:
+                    - Path to the state file of the scheduler, shared by the tasks.
+                type: path
+                required: true
+            max_transfers_per_host:
+                description:
+                    - The maximal number of the concurrent transfers using the same C(host).
+                    - The limit is applied only when C(host) is passed, otherwise the host is selected by the engine.
+                type: int
+            max_transfers_per_storage_domain:
+                description:
+                    - The maximal number of the concurrent transfers of the disks on the same storage domain.
+                type: int
+            priority:
+                description:
+                    - Priority of the transfer, the transfers with higher priority start first.
+                type: str
+                choices: ['high', 'normal', 'low']
+                default: normal
+            bandwidth_limit:
+                description:
+                    - The maximal aggregate rate of the transfers of the scheduler in bytes per second.
+                    - The limit is divided evenly among the transfers running in the scheduler.
+                    - The limit is applied only to raw images, which are transferred by the collection.
+                type: int
+            queue_timeout:
+                description:
+                    - The maximal time in seconds the transfer waits in the queue, the task fails when the timeout expires.
+                    - By default the transfer waits without limit.
+                type: int
+    transfer_probe_cache:
+        description:
+            - Dictionary of the parameters of the cache of the probes of the direct connections to the hosts.
+            - The image is transferred directly to/from the host, if the host can be connected, otherwise through
+              the proxy of the engine. When the last probe of the host failed, the proxy of the engine is used right away,
+              without waiting for the connection to the host to time out.
+            - The probes of all the tasks running on the same machine and using the same C(path) are shared.
+        type: dict
+        version_added: 3.3.0
+        suboptions:
+            path:
+                description:
+                    - Path to the file with the results of the probes, shared by the tasks.
+                type: path
+                required: true
+            ttl:
+                description:
+                    - Number of seconds after which the result of the probe of the host expires
+                      and the host is probed again.
+                type: int
+                default: 3600
+    use_proxy_env:
+        description:
+            - If I(true) and the host is accessed through a proxy according to the proxy environment variables
+              (C(https_proxy), C(no_proxy)), the image is transferred through the proxy of the engine right away,
+              without connecting to the host directly.
+        type: bool
+        default: false
+        version_added: 3.3.0
 extends_documentation_fragment: ovirt.ovirt.ovirt
 '''
 
@@ -306,6 +425,47 @@ EXAMPLES = '''
     id: 7de90f31-222c-436c-a1ca-7e655bd5b60c
     download_image_path: /home/user/mydisk.qcow2
 
+# Download raw disk to local file system, if the download fails,
+# running the task again downloads only the missing parts of the disk:
+- ovirt.ovirt.ovirt_disk:
+    id: 7de90f31-222c-436c-a1ca-7e655bd5b60c
+    download_image_path: /home/user/mydisk.raw
+    format: raw
+    resume: true
+
+# Upload many disks by parallel tasks, at most 2 transfers to the same storage domain
+# run concurrently, every one of them limited to 100 MiB per second:
+- ovirt.ovirt.ovirt_disk:
+    name: "{{ item }}"
+    upload_image_path: "/path/to/{{ item }}.raw"
+    storage_domain: data
+    format: raw
+    transfer_scheduler:
+      path: /tmp/ovirt-transfers.json
+      max_transfers_per_storage_domain: 2
+      bandwidth_limit: 104857600
+  loop: "{{ disks }}"
+  async: 7200
+  poll: 0
+
+# Create template disk from the compressed qcow2 image, without downloading
+# and decompressing the image to the local disk first:
+- ovirt.ovirt.ovirt_disk:
+    name: centos7
+    upload_image_url: https://cloud.centos.org/centos/7/images/CentOS-7-x86_64-GenericCloud.qcow2.xz
+    storage_domain: data
+    format: cow
+
+# Download disks through the proxy of the engine without waiting for the connection
+# to the hosts, which can't be reached from this machine, to time out:
+- ovirt.ovirt.ovirt_disk:
+    id: "{{ item }}"
+    download_image_path: "/path/to/{{ item }}.raw"
+    format: raw
+    transfer_probe_cache:
+      path: /tmp/ovirt-transfer-probes.json
+  loop: "{{ disk_ids }}"
+
 # Export disk as image to Glance domain
 # Since Ansible 2.4
 - ovirt.ovirt.ovirt_disk:
@@ -367,13 +527,25 @@ disk_attachment:
                   http://ovirt.github.io/ovirt-engine-api-model/master/#types/disk_attachment."
     returned: "On success if disk is found and C(vm_id) or C(vm_name) was passed and VM was found."
     type: dict
+transfer:
+    description: "Statistics of the upload/download of the image. It contains the time in seconds spent waiting for the phases
+                  of the image transfer, C(initializing), C(resuming) and C(finalizing).
+                  The images uploaded from C(upload_image_url) and the raw images transferred with C(resume) or C(checksum) I(true)
+                  or with C(bandwidth_limit) contain also
+                  the size of the image, the number of transferred bytes and the number of zero bytes, which were not
+                  transferred, the elapsed time in seconds and the throughput in bytes per second.
+                  The C(checksum) of the image is returned when C(checksum) is I(true) or the transfer was resumed, it contains
+                  C(algorithm), C(block_size), C(checksum) and C(verified), which is I(true) when the checksum was compared
+                  with the checksum computed by the imageio server. When C(transfer_scheduler) is used, it contains C(queued)
+                  time in seconds and C(aggregate_throughput) in bytes per second."
+    returned: "On success if the image was uploaded or downloaded."
+    type: dict
 '''
 
 import json
 import os
 import time
 import traceback
-import inspect
 
 from ansible.module_utils.six.moves.http_client import HTTPSConnection
 from ansible.module_utils.six.moves.urllib.parse import urlparse
@@ -384,6 +556,9 @@ try:
 except ImportError:
     pass
 from ansible.module_utils.basic import AnsibleModule
+from ansible.module_utils.urls import open_url
+from ansible_collections.ovirt.ovirt.plugins.module_utils import capabilities
+from ansible_collections.ovirt.ovirt.plugins.module_utils import imageio
 from ansible_collections.ovirt.ovirt.plugins.module_utils.ovirt import (
     BaseModule,
     check_sdk,
@@ -396,6 +571,7 @@ from ansible_collections.ovirt.ovirt.plugins.module_utils.ovirt import (
     ovirt_full_argument_spec,
     search_by_name,
     wait,
+    TransferWaiter,
 )
 
 
@@ -411,16 +587,47 @@ def _search_by_lun(disks_service, lun_id):
     return res[0] if res else None
 
 
-def create_transfer_connection(module, transfer, context, connect_timeout=10, read_timeout=60):
-    url = urlparse(transfer.transfer_url)
-    connection = HTTPSConnection(
-        url.netloc, context=context, timeout=connect_timeout)
-    try:
-        connection.connect()
-    except Exception as e:
-        # Typically, "ConnectionRefusedError" or "socket.gaierror".
-        module.warn("Cannot connect to %s, trying %s: %s" % (transfer.transfer_url, transfer.proxy_url, e))
+# Probe caches of the module, by their path, so the probes are kept also without the path:
+PROBE_CACHES = {}
+
 
+def create_probe_cache(module):
+    params = module.params.get('transfer_probe_cache') or {}
+    if params.get('path') not in PROBE_CACHES:
+        PROBE_CACHES[params.get('path')] = imageio.ProbeCache(params.get('path'), params.get('ttl') or 3600)
+    return PROBE_CACHES[params.get('path')]
+
+
+def get_transfer_url(module, transfer):
+    """
+    Return the transfer URL of the host, unless the host is accessed
+    through a proxy and C(use_proxy_env) is enabled, or the last probe of
+    the direct connection to the host failed, so the proxy URL of the engine
+    should be used right away.
+    """
+    address = urlparse(transfer.transfer_url).netloc
+    if module.params.get('use_proxy_env') and imageio.proxied(transfer.transfer_url):
+        return transfer.proxy_url
+    if create_probe_cache(module).get(address) is False:
+        return transfer.proxy_url
+    return transfer.transfer_url
+
+
+def create_transfer_connection(module, transfer, context, connect_timeout=10, read_timeout=60):
+    connection = None
+    if get_transfer_url(module, transfer) == transfer.transfer_url:
+        url = urlparse(transfer.transfer_url)
+        connection = HTTPSConnection(
+            url.netloc, context=context, timeout=connect_timeout)
+        try:
+            connection.connect()
+        except Exception as e:
+            # Typically, "ConnectionRefusedError" or "socket.gaierror".
+            module.warn("Cannot connect to %s, trying %s: %s" % (transfer.transfer_url, transfer.proxy_url, e))
+            connection = None
+        create_probe_cache(module).set(url.netloc, connection is not None)
+
+    if connection is None:
         url = urlparse(transfer.proxy_url)
         connection = HTTPSConnection(
             url.netloc, context=context, timeout=connect_timeout)
@@ -430,7 +637,85 @@ def create_transfer_connection(module, transfer, context, connect_timeout=10, re
     return connection, url
 
 
-def start_transfer(connection, module, direction):
+def probe_transfer_url(module, transfer):
+    """
+    Return the URL, which should be used for the transfer: the transfer URL
+    of the host, if the host can be connected directly, otherwise the proxy
+    URL of the engine. The result of the probe is stored in the probe cache.
+    Without C(transfer_probe_cache) the result wouldn't be used by any other
+    transfer, so the host isn't probed and the client falls back to the
+    proxy URL on its own.
+    """
+    if not (module.params.get('transfer_probe_cache') or {}).get('path'):
+        return get_transfer_url(module, transfer)
+    context = imageio.create_ssl_context(module.params.get('auth'))
+    transfer_connection, url = create_transfer_connection(module, transfer, context)
+    transfer_connection.close()
+    return url.geturl()
+
+
+# Transfer schedulers of the transfers started by the module, by the transfer ID:
+TRANSFER_SCHEDULERS = {}
+
+# Time spent waiting for the phases of the transfers, by the transfer ID:
+TRANSFER_METRICS = {}
+
+
+def create_transfer_waiter(connection, module, transfer_id):
+    transfer_service = (connection.system_service()
+                        .image_transfers_service()
+                        .image_transfer_service(transfer_id))
+    return TransferWaiter(
+        transfer_service,
+        # The phases of the disk transfer were always checked every second,
+        # so don't let the interval grow longer, even if poll_interval is:
+        max_interval=min(module.params.get('poll_interval'), 1),
+        connection=connection if module.params.get('wait_events') else None,
+        disk_id=module.params.get('id'),
+        metrics=TRANSFER_METRICS.setdefault(transfer_id, {}),
+    )
+
+
+def acquire_transfer_slot(connection, module):
+    """
+    Wait for the slot of the transfer scheduler, if the module should use
+    it. Return the scheduler holding the slot, or None.
+    """
+    scheduler = imageio.create_transfer_scheduler(module.params.get('transfer_scheduler'))
+    if scheduler is not None:
+        disk = connection.system_service().disks_service().disk_service(module.params.get('id')).get()
+        scheduler.acquire(
+            module.params['transfer_scheduler'].get('queue_timeout'),
+            host=module.params.get('host'),
+            storage_domain=disk.storage_domains[0].id if disk.storage_domains else None,
+        )
+    return scheduler
+
+
+def release_transfer_slot(transfer_id, transferred=0):
+    """
+    Release the slot of the transfer scheduler held by the transfer. Return
+    the statistics of the scheduler, or None if the transfer wasn't scheduled.
+    """
+    scheduler = TRANSFER_SCHEDULERS.pop(transfer_id, None)
+    if scheduler is not None:
+        return scheduler.release(transferred)
+
+
+def start_transfer(connection, module, direction, image_format=None):
+    scheduler = acquire_transfer_slot(connection, module)
+    try:
+        transfer = _start_transfer(connection, module, direction, image_format)
+    except Exception:
+        if scheduler is not None:
+            scheduler.release()
+        raise
+    if scheduler is not None:
+        TRANSFER_SCHEDULERS[transfer.id] = scheduler
+    return transfer
+
+
+def _start_transfer(connection, module, direction, image_format=None):
     transfers_service = connection.system_service().image_transfers_service()
     hosts_service = connection.system_service().hosts_service()
     transfer = transfers_service.add(
@@ -448,17 +733,19 @@ def start_transfer(connection, module, direction):
             # - Collapsed qcow2 chains to single raw file.
             # - Extents reporting for qcow2 images and raw images on file storage,
             #   speeding up downloads.
-            format=otypes.DiskFormat.RAW,
+            # format=cow is used only for the qcow2 image streamed from URL,
+            # which is uploaded as it is, because it can't be converted.
+            format=image_format or otypes.DiskFormat.RAW,
         )
     )
     transfer_service = transfers_service.image_transfer_service(transfer.id)
+    waiter = create_transfer_waiter(connection, module, transfer.id)
 
     start = time.time()
 
     while True:
-        time.sleep(1)
         try:
-            transfer = transfer_service.get()
+            transfer = waiter.poll('initializing')
         except sdk.NotFoundError:
             # The system has removed the disk and the transfer.
             raise RuntimeError("Transfer {0} was removed".format(transfer.id))
@@ -492,25 +779,95 @@ def start_transfer(connection, module, direction):
     return transfer
 
 
+def resume_transfer(connection, module, transfer_id):
+    """
+    Resume the transfer paused by the previous run of the module. Return the
+    transfer, or None when the transfer doesn't exist or can't be resumed.
+    """
+    transfer_service = (connection.system_service()
+                        .image_transfers_service()
+                        .image_transfer_service(transfer_id))
+    try:
+        transfer = transfer_service.get()
+    except sdk.NotFoundError:
+        return None
+    if transfer.phase not in [
+        otypes.ImageTransferPhase.PAUSED_USER,
+        otypes.ImageTransferPhase.TRANSFERRING,
+    ]:
+        return None
+
+    scheduler = acquire_transfer_slot(connection, module)
+    waiter = create_transfer_waiter(connection, module, transfer.id)
+    try:
+        if transfer.phase == otypes.ImageTransferPhase.PAUSED_USER:
+            transfer_service.resume()
+            start = time.time()
+            while transfer.phase in [
+                otypes.ImageTransferPhase.PAUSED_USER,
+                otypes.ImageTransferPhase.RESUMING,
+            ] and time.time() < start + module.params.get('timeout'):
+                transfer = waiter.poll('resuming')
+    except sdk.NotFoundError:
+        transfer = None
+    if transfer is None or transfer.phase != otypes.ImageTransferPhase.TRANSFERRING:
+        TRANSFER_METRICS.pop(transfer_id, None)
+        if scheduler is not None:
+            scheduler.release()
+        return None
+    if scheduler is not None:
+        TRANSFER_SCHEDULERS[transfer.id] = scheduler
+
+    hosts_service = connection.system_service().hosts_service()
+    transfer.host = hosts_service.host_service(transfer.host.id).get()
+    return transfer
+
+
 def cancel_transfer(connection, transfer_id):
+    TRANSFER_METRICS.pop(transfer_id, None)
+    release_transfer_slot(transfer_id)
     transfer_service = (connection.system_service()
                         .image_transfers_service()
                         .image_transfer_service(transfer_id))
     transfer_service.cancel()
 
 
-def finalize_transfer(connection, module, transfer_id):
+def pause_transfer(connection, transfer_id):
+    TRANSFER_METRICS.pop(transfer_id, None)
+    release_transfer_slot(transfer_id)
+    transfer_service = (connection.system_service()
+                        .image_transfers_service()
+                        .image_transfer_service(transfer_id))
+    transfer_service.pause()
+
+
+def finalize_transfer(connection, module, transfer_id, transferred=0):
+    """
+    Finalize the transfer and wait until it finishes. Return the time spent
+    waiting for the phases of the transfer and the statistics of the
+    transfer scheduler, if the transfer was scheduled.
+    """
+    try:
+        _finalize_transfer(connection, module, transfer_id)
+    finally:
+        stats = release_transfer_slot(transfer_id, transferred)
+        metrics = TRANSFER_METRICS.pop(transfer_id, {})
+    metrics.update(stats or {})
+    return metrics
+
+
+def _finalize_transfer(connection, module, transfer_id):
     transfer = None
     transfer_service = (connection.system_service()
                         .image_transfers_service()
                         .image_transfer_service(transfer_id))
+    waiter = create_transfer_waiter(connection, module, transfer_id)
     start = time.time()
 
     transfer_service.finalize()
     while True:
-        time.sleep(1)
         try:
-            transfer = transfer_service.get()
+            transfer = waiter.poll('finalizing')
         except sdk.NotFoundError:
             # Old engine (< 4.4.7): since the transfer was already deleted from
             # the database, we can assume that the disk status is already
@@ -547,17 +904,128 @@ def finalize_transfer(connection, module, transfer_id):
                 .format(transfer.id, transfer.phase))
 
 
+def is_qcow2_image(path):
+    with open(path, 'rb') as image:
+        return image.read(4) == b'QFI\xfb'
+
+
+def transfer_raw_image(connection, module, direction, path, transfer_func):
+    """
+    Transfer the raw image by the imageio module utils. If the transfer
+    should be resumable, the progress is recorded to the journal, so the
+    failed transfer can be resumed by the next run of the module.
+    """
+    journal = None
+    transfer = None
+    if module.params.get('resume'):
+        journal = imageio.Journal(path, direction.value, module.params.get('journal_path'))
+        if journal.transfer_id:
+            transfer = resume_transfer(connection, module, journal.transfer_id)
+    if transfer is None:
+        transfer = start_transfer(connection, module, direction)
+        # The uploaded data of the transfer, which can't be resumed, can't be trusted,
+        # but the downloaded data are verified by the checksum at the end:
+        if journal is not None and direction == otypes.ImageTransferDirection.UPLOAD:
+            journal.reset(transfer.id)
+        elif journal is not None:
+            journal.transfer_id = transfer.id
+            journal.save()
+    try:
+        context = imageio.create_ssl_context(module.params.get('auth'))
+        transfer_connection, url = create_transfer_connection(module, transfer, context)
+        transfer_connection.close()
+        stats = transfer_func(url.geturl(), transfer.signed_ticket, context, journal)
+    except imageio.ChecksumError:
+        # All the ranges are recorded in the journal as transferred, so resuming
+        # the transfer would fail the same way, the next run has to start over:
+        if journal is not None:
+            journal.remove()
+        cancel_transfer(connection, transfer.id)
+        raise
+    except Exception as e:
+        if journal is not None:
+            # Keep the transfer, so the next run of the module can resume it:
+            pause_transfer(connection, transfer.id)
+        else:
+            cancel_transfer(connection, transfer.id)
+        raise e
+    stats.update(finalize_transfer(connection, module, transfer.id, stats['transferred']))
+    if journal is not None:
+        journal.remove()
+    return stats
+
+
+def download_raw_image(connection, module):
+    path = module.params.get('download_image_path')
+    if module.params.get('format') == 'cow':
+        raise ValueError("Resuming and checksum of the transfer are supported only for raw images, the 'format' must be 'raw'.")
+    return transfer_raw_image(
+        connection,
+        module,
+        otypes.ImageTransferDirection.DOWNLOAD,
+        path,
+        lambda url, ticket, context, journal: imageio.download(
+            url,
+            ticket,
+            context,
+            path,
+            max_workers=module.params.get('max_workers') or imageio.MAX_WORKERS,
+            journal=journal,
+            checksum=module.params.get('checksum'),
+            bandwidth_limit=imageio.create_bandwidth_limit(module.params.get('transfer_scheduler')),
+        ),
+    )
+
+
+def upload_raw_image(connection, module):
+    path = module.params.get('upload_image_path')
+    if is_qcow2_image(path):
+        raise ValueError("Resuming and checksum of the transfer are supported only for raw images, '%s' is qcow2 image." % path)
+    return transfer_raw_image(
+        connection,
+        module,
+        otypes.ImageTransferDirection.UPLOAD,
+        path,
+        lambda url, ticket, context, journal: imageio.upload(
+            url,
+            ticket,
+            context,
+            path,
+            max_workers=module.params.get('max_workers') or imageio.MAX_WORKERS,
+            journal=journal,
+            checksum=module.params.get('checksum'),
+            bandwidth_limit=imageio.create_bandwidth_limit(module.params.get('transfer_scheduler')),
+        ),
+    )
+
+
+def transfer_by_collection(module, raw):
+    """
+    Return True if the image should be transferred by the imageio module
+    utils of the collection, instead of the ovirt_imageio client.
+    """
+    if module.params.get('resume') or module.params.get('checksum'):
+        return True
+    if (module.params.get('transfer_scheduler') or {}).get('bandwidth_limit'):
+        if raw:
+            return True
+        module.warn("The bandwidth_limit of the transfer_scheduler is applied only to raw images.")
+    return False
+
+
 def download_disk_image(connection, module):
+    if transfer_by_collection(module, module.params.get('format') != 'cow'):
+        return download_raw_image(connection, module)
     transfer = start_transfer(connection, module, otypes.ImageTransferDirection.DOWNLOAD)
     try:
-        extra_args = {}
-        parameters = inspect.signature(client.download).parameters
-        if "proxy_url" in parameters:
-            extra_args["proxy_url"] = transfer.proxy_url
-        if module.params.get('max_workers') and "max_workers" in parameters:
-            extra_args["max_workers"] = module.params.get('max_workers')
+        # Pass only the arguments, which the installed ovirt-imageio client supports:
+        extra_args = capabilities.supported_kwargs(
+            client.download,
+            proxy_url=transfer.proxy_url,
+            max_workers=module.params.get('max_workers'),
+        )
         client.download(
-            transfer.transfer_url,
+            probe_transfer_url(module, transfer),
             module.params.get('download_image_path'),
             module.params.get('auth').get('ca_file'),
             fmt='qcow2' if module.params.get('format') == 'cow' else 'raw',
@@ -568,22 +1036,23 @@ def download_disk_image(connection, module):
     except Exception as e:
         cancel_transfer(connection, transfer.id)
         raise e
-    finalize_transfer(connection, module, transfer.id)
-    return True
+    return finalize_transfer(connection, module, transfer.id, os.path.getsize(module.params.get('download_image_path')))
 
 
 def upload_disk_image(connection, module):
+    if transfer_by_collection(module, not is_qcow2_image(module.params.get('upload_image_path'))):
+        return upload_raw_image(connection, module)
     transfer = start_transfer(connection, module, otypes.ImageTransferDirection.UPLOAD)
     try:
-        extra_args = {}
-        parameters = inspect.signature(client.upload).parameters
-        if "proxy_url" in parameters:
-            extra_args["proxy_url"] = transfer.proxy_url
-        if module.params.get('max_workers') and "max_workers" in parameters:
-            extra_args["max_workers"] = module.params.get('max_workers')
+        # Pass only the arguments, which the installed ovirt-imageio client supports:
+        extra_args = capabilities.supported_kwargs(
+            client.upload,
+            proxy_url=transfer.proxy_url,
+            max_workers=module.params.get('max_workers'),
+        )
         client.upload(
             module.params.get('upload_image_path'),
-            transfer.transfer_url,
+            probe_transfer_url(module, transfer),
             module.params.get('auth').get('ca_file'),
             secure=not module.params.get('auth').get('insecure'),
             buffer_size=client.BUFFER_SIZE,
@@ -592,12 +1061,64 @@ def upload_disk_image(connection, module):
     except Exception as e:
         cancel_transfer(connection, transfer.id)
         raise e
-    finalize_transfer(connection, module, transfer.id)
-    return True
+    return finalize_transfer(connection, module, transfer.id, os.path.getsize(module.params.get('upload_image_path')))
+
+
+def open_image_stream(module):
+    """
+    Open the image of the C(upload_image_url), which is streamed to the disk
+    without storing it locally.
+    """
+    response = open_url(module.params.get('upload_image_url'), timeout=module.params.get('timeout'))
+    size = response.headers.get('Content-Length')
+    image_stream = imageio.ImageStream(response, size=int(size) if size and size.isdigit() else None)
+    if image_stream.format == 'qcow2' and module.params.get('format') != 'cow':
+        raise ValueError("The qcow2 image '%s' can be uploaded only to the disk with 'cow' format." % module.params.get('upload_image_url'))
+    if image_stream.virtual_size is None and not module.params.get('size'):
+        raise ValueError("The size of the image '%s' is not known, the 'size' must be specified." % module.params.get('upload_image_url'))
+    return image_stream
+
+
+def upload_image_stream(connection, module, image_stream):
+    transfer = start_transfer(
+        connection,
+        module,
+        otypes.ImageTransferDirection.UPLOAD,
+        image_format=otypes.DiskFormat.COW if image_stream.format == 'qcow2' else otypes.DiskFormat.RAW,
+    )
+    try:
+        context = imageio.create_ssl_context(module.params.get('auth'))
+        transfer_connection, url = create_transfer_connection(module, transfer, context)
+        transfer_connection.close()
+        stats = imageio.upload_stream(
+            url.geturl(),
+            transfer.signed_ticket,
+            context,
+            image_stream,
+            max_workers=module.params.get('max_workers') or imageio.MAX_WORKERS,
+            bandwidth_limit=imageio.create_bandwidth_limit(module.params.get('transfer_scheduler')),
+        )
+    except Exception as e:
+        cancel_transfer(connection, transfer.id)
+        raise e
+    stats.update(finalize_transfer(connection, module, transfer.id, stats['transferred']))
+    return stats
+
+
+def has_journal(module, path, direction):
+    """
+    Return True if the transfer of the image to/from the `path` should be
+    resumed, because it failed in the previous run of the module.
+    """
+    return bool(path and module.params['resume'] and imageio.Journal(path, direction.value, module.params['journal_path']).transfer_id)
 
 
 class DisksModule(BaseModule):
 
+    def __init__(self, *args, **kwargs):
+        super(DisksModule, self).__init__(*args, **kwargs)
+        self.image_stream = None
+
     def build_entity(self):
         hosts_service = self._connection.system_service().hosts_service()
         logical_unit = self._module.params.get('logical_unit')
@@ -609,6 +1130,8 @@ class DisksModule(BaseModule):
                 self._module.fail_json(msg="Failed to get image info for '%s': %s" % (self._module.params.get('upload_image_path'), err))
             image_info = json.loads(out)
             size = image_info["virtual-size"]
+        if not size and self.image_stream is not None:
+            size = self.image_stream.virtual_size
         disk = otypes.Disk(
             id=self._module.params.get('id'),
             name=self._module.params.get('name'),
@@ -673,6 +1196,8 @@ class DisksModule(BaseModule):
                 self._module.fail_json(msg="Failed to measure image '%s': %s" % (self._module.params.get('upload_image_path'), err))
             measure = json.loads(out)
             disk.initial_size = measure["required"]
+        elif hasattr(disk, 'initial_size') and self.image_stream is not None and self._module.params.get('format') == 'cow':
+            disk.initial_size = self.image_stream.initial_size
 
         return disk
 
@@ -825,6 +1350,7 @@ def main():
         read_only=dict(default=None, type='bool'),
         download_image_path=dict(default=None),
         upload_image_path=dict(default=None, aliases=['image_path']),
+        upload_image_url=dict(default=None),
         force=dict(default=False, type='bool'),
         sparsify=dict(default=None, type='bool'),
         openstack_volume_type=dict(default=None),
@@ -833,10 +1359,17 @@ def main():
         wipe_after_delete=dict(type='bool', default=None),
         activate=dict(default=None, type='bool'),
         max_workers=dict(default=None, type='int'),
+        resume=dict(default=False, type='bool'),
+        journal_path=dict(type='path'),
+        checksum=dict(default=False, type='bool'),
+        transfer_scheduler=dict(imageio.TRANSFER_SCHEDULER_SPEC),
+        transfer_probe_cache=dict(imageio.TRANSFER_PROBE_CACHE_SPEC),
+        use_proxy_env=dict(type='bool', default=False),
     )
     module = AnsibleModule(
         argument_spec=argument_spec,
         supports_check_mode=True,
+        mutually_exclusive=[['upload_image_path', 'upload_image_url']],
     )
 
     lun = module.params.get('logical_unit')
@@ -864,6 +1397,8 @@ def main():
         )
 
         force_create = False
+        resume_upload = has_journal(module, module.params['upload_image_path'], otypes.ImageTransferDirection.UPLOAD)
+        resume_download = has_journal(module, module.params['download_image_path'], otypes.ImageTransferDirection.DOWNLOAD)
         vm_service = get_vm_service(connection, module)
         if lun:
             disk = _search_by_lun(disks_service, lun.get('id'))
@@ -873,6 +1408,11 @@ def main():
                 # If the VM doesn't exist in VMs disks, but still it's found it means it was found
                 # for template with same name as VM, so we should force create the VM disk.
                 force_create = disk.id not in [a.disk.id for a in vm_service.disk_attachments_service().list() if a.disk]
+        # Open the streamed image before the disk is created, so the size of the disk can be taken from the image:
+        if module.params['upload_image_url'] and state in ('present', 'detached', 'attached') and (
+            disk is None or force_create or module.params['force']
+        ):
+            disks_module.image_stream = open_image_stream(module)
 
         ret = None
         # First take care of creating the VM, if needed:
@@ -886,7 +1426,8 @@ def main():
                 search_params=searchable_attributes(module),
                 fail_condition=lambda d: d.status == otypes.DiskStatus.ILLEGAL if lun is None else False,
                 force_create=force_create,
-                _wait=True if module.params['upload_image_path'] else module.params['wait'],
+                # The disk of the paused upload stays locked until the upload is resumed:
+                _wait=True if (module.params['upload_image_path'] or disks_module.image_stream) and not resume_upload else module.params['wait'],
             )
             is_new_disk = ret['changed']
             ret['changed'] = ret['changed'] or disks_module.update_storage_domains(ret['id'])
@@ -894,18 +1435,27 @@ def main():
             # we have this ID specified to attach/detach method:
             module.params['id'] = ret['id']
 
-            # Upload disk image in case it is a new disk or force parameter is passed:
-            if module.params['upload_image_path'] and (is_new_disk or module.params['force']):
+            # Upload disk image in case it is a new disk, force parameter is passed or the upload should be resumed:
+            if module.params['upload_image_path'] and (is_new_disk or module.params['force'] or resume_upload):
                 if module.params['format'] == 'cow' and module.params['content_type'] == 'iso':
                     module.warn("To upload an ISO image 'format' parameter needs to be set to 'raw'.")
-                uploaded = upload_disk_image(connection, module)
-                ret['changed'] = ret['changed'] or uploaded
-            # Download disk image in case the file doesn't exist or force parameter is passed:
+                transfer = upload_disk_image(connection, module)
+                if transfer is not None:
+                    ret['transfer'] = transfer
+                ret['changed'] = True
+            if disks_module.image_stream is not None:
+                ret['transfer'] = upload_image_stream(connection, module, disks_module.image_stream)
+                ret['changed'] = True
+            # Download disk image in case the file doesn't exist, force parameter is passed or the download should be resumed:
             if (
-                module.params['download_image_path'] and (not os.path.isfile(module.params['download_image_path']) or module.params['force'])
+                module.params['download_image_path'] and (
+                    not os.path.isfile(module.params['download_image_path']) or module.params['force'] or resume_download
+                )
             ):
-                downloaded = download_disk_image(connection, module)
-                ret['changed'] = ret['changed'] or downloaded
+                transfer = download_disk_image(connection, module)
+                if transfer is not None:
+                    ret['transfer'] = transfer
+                ret['changed'] = True
 
             # Disk sparsify, only if disk is of image type:
             if not module.check_mode:
@@ -54,6 +54,22 @@ options:
         elements: str
         aliases: ['follows']
         default: []
+    output_file:
+        description:
+            - "Path to the file, where the disks are written as JSON Lines, one disk per line,
+               instead of returning them in C(ovirt_disks)."
+            - "The disks are fetched by C(page_size) per request and written as they are fetched,
+               so the memory used by the module doesn't depend on the number of the disks."
+            - "The file is written on the host, where the module is executed."
+        type: path
+        version_added: 3.3.0
+    page_size:
+        description:
+            - "Number of the disks fetched per request, when C(output_file) is specified."
+            - "Must be greater than zero."
+        type: int
+        default: 100
+        version_added: 3.3.0
 extends_documentation_fragment: ovirt.ovirt.ovirt_info
 '''
 
@@ -73,8 +89,16 @@ RETURN = '''
 ovirt_disks:
     description: "List of dictionaries describing the Disks. Disk attributes are mapped to dictionary keys,
                   all Disks attributes can be found at following url: http://ovirt.github.io/ovirt-engine-api-model/master/#types/disk."
-    returned: On success.
+    returned: On success, when C(output_file) is not specified.
     type: list
+output_file:
+    description: "Path to the file with the Disks, written as JSON Lines."
+    returned: When C(output_file) is specified.
+    type: str
+count:
+    description: "Number of the Disks written to C(output_file)."
+    returned: When C(output_file) is specified.
+    type: int
 '''
 
 import traceback
@@ -84,19 +108,25 @@ from ansible_collections.ovirt.ovirt.plugins.module_utils.ovirt import (
     check_sdk,
     create_connection,
     get_dict_of_struct,
+    list_paged,
     ovirt_info_full_argument_spec,
+    write_json_lines,
 )
 
 
 def main():
     argument_spec = ovirt_info_full_argument_spec(
         pattern=dict(default='', required=False),
+        output_file=dict(default=None, type='path'),
+        page_size=dict(default=100, type='int'),
     )
     module = AnsibleModule(
         argument_spec,
         supports_check_mode=True,
     )
     check_sdk(module)
+    if module.params['page_size'] < 1:
+        module.fail_json(msg='"page_size" must be greater than zero')
     if module.params['fetch_nested'] or module.params['nested_attributes']:
         module.deprecate(
             "The 'fetch_nested' and 'nested_attributes' are deprecated please use 'follow' parameter",
@@ -108,19 +138,32 @@ def main():
         auth = module.params.pop('auth')
         connection = create_connection(auth)
         disks_service = connection.system_service().disks_service()
+
+        def get_disk_dict(disk):
+            return get_dict_of_struct(
+                struct=disk,
+                connection=connection,
+                fetch_nested=module.params.get('fetch_nested'),
+                attributes=module.params.get('nested_attributes'),
+                filter_keys=module.params.get('fields'),
+            )
+
+        if module.params['output_file']:
+            disks = list_paged(
+                disks_service.list,
+                module.params['page_size'],
+                search=module.params['pattern'],
+                follow=",".join(module.params['follow']),
+            )
+            count = write_json_lines(module.params['output_file'], (get_disk_dict(disk) for disk in disks))
+            module.exit_json(changed=False, output_file=module.params['output_file'], count=count)
+
         disks = disks_service.list(
             search=module.params['pattern'],
             follow=",".join(module.params['follow'])
         )
         result = dict(
-            ovirt_disks=[
-                get_dict_of_struct(
-                    struct=c,
-                    connection=connection,
-                    fetch_nested=module.params.get('fetch_nested'),
-                    attributes=module.params.get('nested_attributes'),
-                ) for c in disks
-            ],
+            ovirt_disks=[get_disk_dict(c) for c in disks],
         )
         module.exit_json(changed=False, **result)
     except Exception as e:
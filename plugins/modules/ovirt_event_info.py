@@ -73,6 +73,24 @@ options:
         elements: str
         aliases: ['follows']
         default: []
+    output_file:
+        description:
+            - "Path to the file, where the events are written as JSON Lines, one event per line,
+               instead of returning them in C(ovirt_events)."
+            - "The events are fetched by C(page_size) per request and written as they are fetched,
+               so the memory used by the module doesn't depend on the number of the events."
+            - "The events are paged by their offset in the list of the events, so if new events are created
+               while the events are fetched, some events can be written twice or skipped."
+            - "The file is written on the host, where the module is executed."
+        type: path
+        version_added: 3.3.0
+    page_size:
+        description:
+            - "Number of the events fetched per request, when C(output_file) is specified."
+            - "Must be greater than zero."
+        type: int
+        default: 100
+        version_added: 3.3.0
 extends_documentation_fragment: ovirt.ovirt.ovirt_info
 '''
 
@@ -102,18 +120,30 @@ ovirt_events:
     description: "List of dictionaries describing the events. Event attributes are mapped to dictionary keys.
                   All event attributes can be found at the following url:
                   http://ovirt.github.io/ovirt-engine-api-model/master/#types/event"
-    returned: On success."
+    returned: On success, when C(output_file) is not specified.
     type: list
+output_file:
+    description: "Path to the file with the events, written as JSON Lines."
+    returned: When C(output_file) is specified.
+    type: str
+count:
+    description: "Number of the events written to C(output_file)."
+    returned: When C(output_file) is specified.
+    type: int
 '''
 
 import traceback
 
+from itertools import islice
+
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.ovirt.ovirt.plugins.module_utils.ovirt import (
     check_sdk,
     create_connection,
     get_dict_of_struct,
+    list_paged,
     ovirt_info_full_argument_spec,
+    write_json_lines,
 )
 
 
@@ -125,13 +155,17 @@ def main():
         search=dict(default='', required=False),
         headers=dict(default='', required=False),
         query=dict(default='', required=False),
-        wait=dict(default=True, type='bool', required=False)
+        wait=dict(default=True, type='bool', required=False),
+        output_file=dict(default=None, type='path'),
+        page_size=dict(default=100, type='int'),
     )
     module = AnsibleModule(
         argument_spec,
         supports_check_mode=True,
     )
     check_sdk(module)
+    if module.params['page_size'] < 1:
+        module.fail_json(msg='"page_size" must be greater than zero')
     if module.params['fetch_nested'] or module.params['nested_attributes']:
         module.deprecate(
             "The 'fetch_nested' and 'nested_attributes' are deprecated please use 'follow' parameter",
@@ -143,26 +177,44 @@ def main():
         auth = module.params.pop('auth')
         connection = create_connection(auth)
         events_service = connection.system_service().events_service()
-        events = events_service.list(
+        list_params = dict(
             case_sensitive=module.params['case_sensitive'],
             from_=module.params['from_'],
-            max=module.params['max'],
-            search=module.params['search'],
             headers=module.params['headers'],
             query=module.params['query'],
             wait=module.params['wait'],
             follow=",".join(module.params['follow'])
         )
 
+        def get_event_dict(event):
+            return get_dict_of_struct(
+                struct=event,
+                connection=connection,
+                fetch_nested=module.params.get('fetch_nested'),
+                attributes=module.params.get('nested_attributes'),
+                filter_keys=module.params.get('fields'),
+            )
+
+        if module.params['output_file']:
+            events = list_paged(
+                events_service.list,
+                module.params['page_size'],
+                search=module.params['search'],
+                **list_params
+            )
+            if module.params['max'] is not None:
+                events = islice(events, module.params['max'])
+            count = write_json_lines(module.params['output_file'], (get_event_dict(event) for event in events))
+            module.exit_json(changed=False, output_file=module.params['output_file'], count=count)
+
+        events = events_service.list(
+            max=module.params['max'],
+            search=module.params['search'],
+            **list_params
+        )
+
         result = dict(
-            ovirt_events=[
-                get_dict_of_struct(
-                    struct=c,
-                    connection=connection,
-                    fetch_nested=module.params.get('fetch_nested'),
-                    attributes=module.params.get('nested_attributes'),
-                ) for c in events
-            ],
+            ovirt_events=[get_event_dict(c) for c in events],
         )
         module.exit_json(changed=False, **result)
     except Exception as e:
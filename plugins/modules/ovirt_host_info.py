@@ -49,6 +49,22 @@ options:
         elements: str
         aliases: ['follows']
         default: []
+    output_file:
+        description:
+            - "Path to the file, where the hosts are written as JSON Lines, one host per line,
+               instead of returning them in C(ovirt_hosts)."
+            - "The hosts are fetched by C(page_size) per request and written as they are fetched,
+               so the memory used by the module doesn't depend on the number of the hosts."
+            - "The file is written on the host, where the module is executed."
+        type: path
+        version_added: 3.3.0
+    page_size:
+        description:
+            - "Number of the hosts fetched per request, when C(output_file) is specified."
+            - "Must be greater than zero."
+        type: int
+        default: 100
+        version_added: 3.3.0
 extends_documentation_fragment: ovirt.ovirt.ovirt_info
 '''
 
@@ -76,8 +92,16 @@ RETURN = '''
 ovirt_hosts:
     description: "List of dictionaries describing the hosts. Host attributes are mapped to dictionary keys,
                   all hosts attributes can be found at following url: http://ovirt.github.io/ovirt-engine-api-model/master/#types/host."
-    returned: On success.
+    returned: On success, when C(output_file) is not specified.
     type: list
+output_file:
+    description: "Path to the file with the hosts, written as JSON Lines."
+    returned: When C(output_file) is specified.
+    type: str
+count:
+    description: "Number of the hosts written to C(output_file)."
+    returned: When C(output_file) is specified.
+    type: int
 '''
 
 import traceback
@@ -87,19 +111,19 @@ from ansible_collections.ovirt.ovirt.plugins.module_utils.ovirt import (
     check_sdk,
     create_connection,
     get_dict_of_struct,
+    list_paged,
     ovirt_info_full_argument_spec,
+    write_json_lines,
 )
 
 
 def get_filtered_hosts(cluster_version, hosts, connection):
     # Filtering by cluster version returns only those which have same cluster version as input
-    filtered_hosts = []
     for host in hosts:
         cluster = connection.follow_link(host.cluster)
         cluster_version_host = str(cluster.version.major) + '.' + str(cluster.version.minor)
         if cluster_version_host == cluster_version:
-            filtered_hosts.append(host)
-    return filtered_hosts
+            yield host
 
 
 def main():
@@ -107,12 +131,16 @@ def main():
         pattern=dict(default='', required=False),
         all_content=dict(default=False, type='bool'),
         cluster_version=dict(default=None, type='str'),
+        output_file=dict(default=None, type='path'),
+        page_size=dict(default=100, type='int'),
     )
     module = AnsibleModule(
         argument_spec,
         supports_check_mode=True,
     )
     check_sdk(module)
+    if module.params['page_size'] < 1:
+        module.fail_json(msg='"page_size" must be greater than zero')
     if module.params['fetch_nested'] or module.params['nested_attributes']:
         module.deprecate(
             "The 'fetch_nested' and 'nested_attributes' are deprecated please use 'follow' parameter",
@@ -124,23 +152,40 @@ def main():
         auth = module.params.pop('auth')
         connection = create_connection(auth)
         hosts_service = connection.system_service().hosts_service()
-        hosts = hosts_service.list(
-            search=module.params['pattern'],
+        list_params = dict(
             all_content=module.params['all_content'],
-            follow=",".join(module.params['follow'])
+            follow=",".join(module.params['follow']),
         )
+        if module.params['output_file']:
+            hosts = list_paged(
+                hosts_service.list,
+                module.params['page_size'],
+                search=module.params['pattern'],
+                **list_params
+            )
+        else:
+            hosts = hosts_service.list(
+                search=module.params['pattern'],
+                **list_params
+            )
         cluster_version = module.params.get('cluster_version')
         if cluster_version is not None:
             hosts = get_filtered_hosts(cluster_version, hosts, connection)
+        hosts = (
+            get_dict_of_struct(
+                struct=c,
+                connection=connection,
+                fetch_nested=module.params.get('fetch_nested'),
+                attributes=module.params.get('nested_attributes'),
+                filter_keys=module.params.get('fields'),
+            ) for c in hosts
+        )
+        if module.params['output_file']:
+            count = write_json_lines(module.params['output_file'], hosts)
+            module.exit_json(changed=False, output_file=module.params['output_file'], count=count)
+
         result = dict(
-            ovirt_hosts=[
-                get_dict_of_struct(
-                    struct=c,
-                    connection=connection,
-                    fetch_nested=module.params.get('fetch_nested'),
-                    attributes=module.params.get('nested_attributes'),
-                ) for c in hosts
-            ],
+            ovirt_hosts=list(hosts),
         )
         module.exit_json(changed=False, **result)
     except Exception as e:
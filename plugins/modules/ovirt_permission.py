@@ -160,8 +160,6 @@ from ansible_collections.ovirt.ovirt.plugins.module_utils.ovirt import (
     check_sdk,
     create_connection,
     equal,
-    follow_link,
-    get_link_name,
     ovirt_full_argument_spec,
     search_by_attributes,
     search_by_name,
@@ -205,13 +203,31 @@ def _object_service(connection, module):
     return object_service
 
 
+def _role_names(connection):
+    return dict(
+        (role.id, role.name)
+        for role in connection.system_service().roles_service().list()
+    )
+
+
 def _permission(module, permissions_service, connection):
-    for permission in permissions_service.list():
-        user = follow_link(connection, permission.user)
+    # Fetch the users, groups and roles of all the permissions by single request
+    # and match them in memory, instead of following the links of every permission:
+    role_names = None
+    for permission in permissions_service.list(follow='user,group,role'):
+        role = permission.role
+        role_name = role.name if role else None
+        if role is not None and role_name is None:
+            if role_names is None:
+                role_names = _role_names(connection)
+            role_name = role_names.get(role.id)
+
+        user = permission.user
+        group = permission.group
         if (
+            equal(module.params['role'], role_name) and
             equal(module.params['user_name'], user.principal if user else None) and
-            equal(module.params['group_name'], get_link_name(connection, permission.group)) and
-            equal(module.params['role'], get_link_name(connection, permission.role))
+            equal(module.params['group_name'], group.name if group else None)
         ):
             return permission
 
@@ -153,13 +153,17 @@ def main():
         auth = module.params.pop('auth')
         connection = create_connection(auth)
         permissions_service = _permissions_service(connection, module)
+        fields = module.params.get('fields')
         permissions = []
         for p in permissions_service.list(follow=",".join(module.params['follow'])):
             newperm = dict()
             for key, value in p.__dict__.items():
+                key = key[1:]
+                if fields and key not in fields and '%s_id' % key not in fields:
+                    continue
                 if value and isinstance(value, sdk.Struct):
-                    newperm[key[1:]] = get_link_name(connection, value)
-                    newperm['%s_id' % key[1:]] = value.id
+                    newperm[key] = get_link_name(connection, value)
+                    newperm['%s_id' % key] = value.id
             permissions.append(newperm)
 
         result = dict(ovirt_permissions=permissions)
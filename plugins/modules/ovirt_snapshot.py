@@ -70,11 +70,100 @@ options:
                or you must provide it in C(ca_file) parameter."
             - "Note that the snapshot is not downloaded when the file already exists,
                but you can forcibly download the snapshot when using C(force) I (true)."
+            - "Only the data of the image are downloaded, the zero areas of the image are created as holes of sparse file."
         type: str
     upload_image_path:
         description:
             - "Path to disk image, which should be uploaded."
+            - "The holes of the sparse file are not uploaded, they are zeroed by the imageio server."
         type: str
+    max_workers:
+        description:
+            - "The number of workers which should be used in the upload/download of the image."
+            - "Every worker uses its own connection to the imageio server and transfers different
+               ranges of the image, so the use of multiple workers can speed up the process."
+            - "The number of workers is limited by the number of connections the imageio server accepts."
+        type: int
+        default: 4
+        version_added: 3.3.0
+    buffer_size:
+        description:
+            - "Size of the buffer in bytes, which is used by every worker to read/send the data of the image."
+        type: int
+        default: 131072
+        version_added: 3.3.0
+    resume:
+        description:
+            - "If I(true) the upload/download of the image records the transferred ranges of the image
+               to the journal file, which is stored next to the local image with C(.journal) suffix,
+               unless C(journal_path) is specified."
+            - "When the transfer fails, the image transfer is paused and the next run of the module
+               with C(resume) I(true) resumes it and transfers only the ranges missing in the journal.
+               If the paused image transfer doesn't exist anymore, new image transfer is created."
+            - "The image, which was resumed, is verified by its checksum at the end of the transfer,
+               if the imageio server supports checksums. If the checksums don't match, the image transfer
+               is cancelled and the journal is removed, so the next run of the module starts new transfer."
+        type: bool
+        default: false
+        version_added: 3.3.0
+    journal_path:
+        description:
+            - "Path to the journal file of the transfer, when C(resume) is I(true)."
+            - "By default the journal is stored next to the local image, so the directory of the image
+               must be writable. Use this parameter when it isn't, for example when uploading the image
+               from a read-only directory."
+        type: path
+        version_added: 3.3.0
+    checksum:
+        description:
+            - "If I(true) the checksum of the image is computed from the data as they are uploaded/downloaded,
+               so the image doesn't have to be read again, and it is compared with the checksum of the image
+               computed by the imageio server, if the imageio server supports checksums."
+            - "The checksum is returned in C(transfer) result."
+        type: bool
+        default: false
+        version_added: 3.3.0
+    transfer_scheduler:
+        description:
+            - "Dictionary of the parameters of the transfer scheduler, which limits the number of the image
+               transfers running concurrently for the same storage domain."
+            - "The transfers of all the tasks running on the same machine and using the same C(path) wait
+               in the queue, ordered by their C(priority), until there is free slot for the transfer."
+            - "The transfer statistics returned in C(transfer) contain the time the transfer waited in the queue
+               and the aggregate throughput of the transfers, which were running concurrently with the transfer."
+        type: dict
+        version_added: 3.3.0
+        suboptions:
+            path:
+                description:
+                    - "Path to the state file of the scheduler, shared by the tasks."
+                type: path
+                required: true
+            max_transfers_per_host:
+                description:
+                    - "The maximal number of the concurrent transfers using the same host."
+                    - "The limit isn't applied by this module, as the host is selected by the engine."
+                type: int
+            max_transfers_per_storage_domain:
+                description:
+                    - "The maximal number of the concurrent transfers of the disks on the same storage domain."
+                type: int
+            priority:
+                description:
+                    - "Priority of the transfer, the transfers with higher priority start first."
+                type: str
+                choices: ['high', 'normal', 'low']
+                default: normal
+            bandwidth_limit:
+                description:
+                    - "The maximal aggregate rate of the transfers of the scheduler in bytes per second."
+                    - "The limit is divided evenly among the transfers running in the scheduler."
+                type: int
+            queue_timeout:
+                description:
+                    - "The maximal time in seconds the transfer waits in the queue, the task fails when the timeout expires."
+                    - "By default the transfer waits without limit."
+                type: int
     use_memory:
         description:
             - "If I(true) and C(state) is I(present) save memory of the Virtual
@@ -160,6 +249,16 @@ EXAMPLES = '''
     vm_name: myvm
     download_image_path: /home/user/mysnaphost.qcow2
 
+# Download snapshot by 8 workers, if the download fails, running
+# the task again downloads only the missing parts of the snapshot:
+- ovirt.ovirt.ovirt_snapshot:
+    snapshot_id: 7de90f31-222c-436c-a1ca-7e655bd5b60c
+    disk_name: DiskName
+    vm_name: myvm
+    download_image_path: /home/user/mysnaphost.qcow2
+    max_workers: 8
+    resume: true
+
 # Delete all snapshots older than 2 days
 - ovirt.ovirt.ovirt_snapshot:
     vm_name: test
@@ -189,9 +288,34 @@ snapshots:
     description: List of deleted snapshots when keep_days_old is defined and snapshot is older than the input days
     returned: On success returns deleted snapshots
     type: list
+transfer:
+    description: "Statistics of the upload/download of the image, the size of the image, the number of transferred bytes
+                  and the number of zero bytes, which were not transferred, the elapsed time in seconds and the throughput
+                  in bytes per second, and the time in seconds spent waiting for the phases of the image transfer,
+                  C(initializing), C(resuming) and C(finalizing). The C(checksum) of the image is returned when C(checksum)
+                  is I(true) or the transfer was resumed, it contains C(algorithm), C(block_size), C(checksum) and C(verified),
+                  which is I(true) when the checksum was compared with the checksum computed by the imageio server.
+                  When C(transfer_scheduler) is used, it contains C(queued) time in seconds and C(aggregate_throughput)
+                  in bytes per second."
+    returned: On success if the image was uploaded or downloaded.
+    type: dict
+    sample:
+        size: 10737418240
+        transferred: 1073741824
+        zero: 9663676416
+        elapsed: 4.25
+        throughput: 252645135
+        initializing: 2.1
+        finalizing: 3.4
+        checksum:
+            algorithm: blake2b
+            block_size: 4194304
+            checksum: 6e2ee1f3a7b9d1ff2bd2a8e5bbd43b5bd9b5fe0e51a8e7a7a3e4d7f5b2ec2c9a
+            verified: true
 '''
 
 
+import time
 import traceback
 
 try:
@@ -201,15 +325,9 @@ except ImportError:
     pass
 
 
-import os
-import ssl
-import time
-
-from ansible.module_utils.six.moves.http_client import HTTPSConnection
-from ansible.module_utils.six.moves.urllib.parse import urlparse
-
 from datetime import datetime
 from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.ovirt.ovirt.plugins.module_utils import imageio
 from ansible_collections.ovirt.ovirt.plugins.module_utils.ovirt import (
     check_sdk,
     create_connection,
@@ -218,136 +336,205 @@ from ansible_collections.ovirt.ovirt.plugins.module_utils.ovirt import (
     ovirt_full_argument_spec,
     search_by_name,
     wait,
+    TransferWaiter,
     get_id_by_name,
     get_link_name
 )
 
 
-def transfer(connection, module, direction, transfer_func):
+def create_transfer_waiter(connection, module, transfer_service, metrics):
+    return TransferWaiter(
+        transfer_service,
+        max_interval=module.params['poll_interval'],
+        connection=connection if module.params['wait_events'] else None,
+        disk_id=module.params['disk_id'],
+        metrics=metrics,
+    )
+
+
+def resume_transfer(connection, module, transfers_service, transfer_id, metrics):
+    """
+    Resume the transfer paused by the previous run of the module. Return the
+    transfer, or None when the transfer doesn't exist or can't be resumed.
+    """
+    transfer_service = transfers_service.image_transfer_service(transfer_id)
+    try:
+        transfer = transfer_service.get()
+    except sdk.NotFoundError:
+        return None
+    try:
+        if transfer.phase == otypes.ImageTransferPhase.PAUSED_USER:
+            transfer_service.resume()
+            waiter = create_transfer_waiter(connection, module, transfer_service, metrics)
+            start = time.time()
+            while transfer.phase in [
+                otypes.ImageTransferPhase.PAUSED_USER,
+                otypes.ImageTransferPhase.RESUMING,
+            ] and time.time() < start + module.params['timeout']:
+                transfer = waiter.poll('resuming')
+    except sdk.NotFoundError:
+        return None
+    if transfer.phase != otypes.ImageTransferPhase.TRANSFERRING:
+        return None
+    return transfer
+
+
+def transfer(connection, module, direction, transfer_func, path):
     transfers_service = connection.system_service().image_transfers_service()
-    transfer = transfers_service.add(
-        otypes.ImageTransfer(
-            image=otypes.Image(
-                id=module.params['disk_id'],
-            ),
-            direction=direction,
+    scheduler = imageio.create_transfer_scheduler(module.params['transfer_scheduler'])
+    if scheduler is not None:
+        disk = connection.system_service().disks_service().disk_service(module.params['disk_id']).get()
+        scheduler.acquire(
+            module.params['transfer_scheduler'].get('queue_timeout'),
+            storage_domain=disk.storage_domains[0].id if disk.storage_domains else None,
         )
-    )
+    try:
+        stats = _transfer(connection, module, direction, transfer_func, path)
+    except Exception:
+        if scheduler is not None:
+            scheduler.release()
+        raise
+    if scheduler is not None:
+        stats.update(scheduler.release(stats['transferred']))
+    return stats
+
+
+def _transfer(connection, module, direction, transfer_func, path):
+    transfers_service = connection.system_service().image_transfers_service()
+    journal = imageio.Journal(path, direction.value, module.params['journal_path']) if module.params['resume'] else None
+    transfer = None
+    metrics = {}
+    if journal is not None and journal.transfer_id:
+        transfer = resume_transfer(connection, module, transfers_service, journal.transfer_id, metrics)
+    if transfer is None:
+        transfer = transfers_service.add(
+            otypes.ImageTransfer(
+                image=otypes.Image(
+                    id=module.params['disk_id'],
+                ),
+                direction=direction,
+            )
+        )
+        if journal is not None:
+            # The uploaded data of the transfer, which can't be resumed, can't be trusted,
+            # but the downloaded data are verified by the checksum at the end:
+            if direction == otypes.ImageTransferDirection.UPLOAD:
+                journal.reset(transfer.id)
+            else:
+                journal.transfer_id = transfer.id
+                journal.save()
     transfer_service = transfers_service.image_transfer_service(transfer.id)
+    waiter = create_transfer_waiter(connection, module, transfer_service, metrics)
 
+    paused = False
+    cancelled = False
     try:
         # After adding a new transfer for the disk, the transfer's status will be INITIALIZING.
         # Wait until the init phase is over. The actual transfer can start when its status is "Transferring".
         while transfer.phase == otypes.ImageTransferPhase.INITIALIZING:
-            time.sleep(module.params['poll_interval'])
-            transfer = transfer_service.get()
-
-        proxy_url = urlparse(transfer.proxy_url)
-        context = ssl.create_default_context()
-        auth = module.params['auth']
-        if auth.get('insecure'):
-            context.check_hostname = False
-            context.verify_mode = ssl.CERT_NONE
-        elif auth.get('ca_file'):
-            context.load_verify_locations(cafile=auth.get('ca_file'))
-
-        proxy_connection = HTTPSConnection(
-            proxy_url.hostname,
-            proxy_url.port,
-            context=context,
-        )
+            transfer = waiter.poll('initializing')
 
-        transfer_func(
-            transfer_service,
-            proxy_connection,
-            proxy_url,
-            transfer.signed_ticket
+        stats = transfer_func(
+            transfer.proxy_url,
+            transfer.signed_ticket,
+            imageio.create_ssl_context(module.params['auth']),
+            journal,
         )
-        return True
+    except imageio.ChecksumError:
+        # All the ranges are recorded in the journal as transferred, so resuming
+        # the transfer would fail the same way, the next run has to start over:
+        if journal is not None:
+            journal.remove()
+        transfer_service.cancel()
+        cancelled = True
+        raise
+    except Exception:
+        if journal is not None:
+            # Keep the transfer, so the next run of the module can resume it:
+            try:
+                transfer_service.pause()
+                paused = True
+            except sdk.Error:
+                pass
+        raise
     finally:
-        transfer_service.finalize()
-        while transfer.phase in [
-            otypes.ImageTransferPhase.TRANSFERRING,
-            otypes.ImageTransferPhase.FINALIZING_SUCCESS,
-        ]:
-            time.sleep(module.params['poll_interval'])
-            transfer = transfer_service.get()
-        if transfer.phase in [
-            otypes.ImageTransferPhase.UNKNOWN,
-            otypes.ImageTransferPhase.FINISHED_FAILURE,
-            otypes.ImageTransferPhase.FINALIZING_FAILURE,
-            otypes.ImageTransferPhase.CANCELLED,
-        ]:
-            raise Exception(
-                "Error occurred while uploading image. The transfer is in %s" % transfer.phase
-            )
-        if module.params.get('logical_unit'):
-            disks_service = connection.system_service().disks_service()
-            wait(
-                service=disks_service.service(module.params['id']),
-                condition=lambda d: d.status == otypes.DiskStatus.OK,
-                wait=module.params['wait'],
-                timeout=module.params['timeout'],
-            )
+        if not paused and not cancelled:
+            transfer_service.finalize()
+            while transfer.phase in [
+                otypes.ImageTransferPhase.TRANSFERRING,
+                otypes.ImageTransferPhase.FINALIZING_SUCCESS,
+            ]:
+                transfer = waiter.poll('finalizing')
+            if transfer.phase in [
+                otypes.ImageTransferPhase.UNKNOWN,
+                otypes.ImageTransferPhase.FINISHED_FAILURE,
+                otypes.ImageTransferPhase.FINALIZING_FAILURE,
+                otypes.ImageTransferPhase.CANCELLED,
+            ]:
+                raise Exception(
+                    "Error occurred while uploading image. The transfer is in %s" % transfer.phase
+                )
+            if module.params.get('logical_unit'):
+                disks_service = connection.system_service().disks_service()
+                wait(
+                    service=disks_service.service(module.params['id']),
+                    condition=lambda d: d.status == otypes.DiskStatus.OK,
+                    wait=module.params['wait'],
+                    timeout=module.params['timeout'],
+                )
+    if journal is not None:
+        journal.remove()
+    stats.update(metrics)
+    return stats
 
 
 def upload_disk_image(connection, module):
-    def _transfer(transfer_service, proxy_connection, proxy_url, transfer_ticket):
-        BUF_SIZE = 128 * 1024
-        path = module.params['upload_image_path']
-
-        image_size = os.path.getsize(path)
-        proxy_connection.putrequest("PUT", proxy_url.path)
-        proxy_connection.putheader('Content-Length', "%d" % (image_size,))
-        proxy_connection.endheaders()
-        with open(path, "rb") as disk:
-            pos = 0
-            while pos < image_size:
-                to_read = min(image_size - pos, BUF_SIZE)
-                chunk = disk.read(to_read)
-                if not chunk:
-                    transfer_service.pause()
-                    raise RuntimeError("Unexpected end of file at pos=%d" % pos)
-                proxy_connection.send(chunk)
-                pos += len(chunk)
+    path = module.params['upload_image_path']
+
+    def _transfer(proxy_url, transfer_ticket, context, journal):
+        return imageio.upload(
+            proxy_url,
+            transfer_ticket,
+            context,
+            path,
+            max_workers=module.params['max_workers'],
+            buffer_size=module.params['buffer_size'],
+            journal=journal,
+            checksum=module.params['checksum'],
+            bandwidth_limit=imageio.create_bandwidth_limit(module.params['transfer_scheduler']),
+        )
 
     return transfer(
         connection,
         module,
         otypes.ImageTransferDirection.UPLOAD,
         transfer_func=_transfer,
+        path=path,
     )
 
 
 def download_disk_image(connection, module):
-    def _transfer(transfer_service, proxy_connection, proxy_url, transfer_ticket):
-        BUF_SIZE = 128 * 1024
-        transfer_headers = {
-            'Authorization': transfer_ticket,
-        }
-        proxy_connection.request(
-            'GET',
-            proxy_url.path,
-            headers=transfer_headers,
+    path = module.params['download_image_path']
+
+    def _transfer(proxy_url, transfer_ticket, context, journal):
+        return imageio.download(
+            proxy_url,
+            transfer_ticket,
+            context,
+            path,
+            max_workers=module.params['max_workers'],
+            buffer_size=module.params['buffer_size'],
+            journal=journal,
+            checksum=module.params['checksum'],
+            bandwidth_limit=imageio.create_bandwidth_limit(module.params['transfer_scheduler']),
         )
-        r = proxy_connection.getresponse()
-        path = module.params["download_image_path"]
-        image_size = int(r.getheader('Content-Length'))
-        with open(path, "wb") as mydisk:
-            pos = 0
-            while pos < image_size:
-                to_read = min(image_size - pos, BUF_SIZE)
-                chunk = r.read(to_read)
-                if not chunk:
-                    raise RuntimeError("Socket disconnected")
-                mydisk.write(chunk)
-                pos += len(chunk)
 
     return transfer(
         connection,
         module,
         otypes.ImageTransferDirection.DOWNLOAD,
         transfer_func=_transfer,
+        path=path,
     )
 
 
@@ -502,6 +689,12 @@ def main():
         description=dict(default=None),
         download_image_path=dict(default=None),
         upload_image_path=dict(default=None),
+        max_workers=dict(default=4, type='int'),
+        buffer_size=dict(default=131072, type='int'),
+        resume=dict(default=False, type='bool'),
+        journal_path=dict(type='path'),
+        checksum=dict(default=False, type='bool'),
+        transfer_scheduler=dict(imageio.TRANSFER_SCHEDULER_SPEC),
         keep_days_old=dict(default=None, type='int'),
         use_memory=dict(
             default=None,
@@ -521,6 +714,7 @@ def main():
 
     check_sdk(module)
     ret = {}
+    transfer_stats = None
     auth = module.params['auth']
     connection = create_connection(auth)
     vms_service = connection.system_service().vms_service()
@@ -547,13 +741,16 @@ def main():
             if module.params.get('disk_id') or module.params.get('disk_name'):
                 module.params['disk_id'] = get_snapshot_disk_id(module, snapshots_service)
                 if module.params['upload_image_path']:
-                    ret['changed'] = upload_disk_image(connection, module)
+                    transfer_stats = upload_disk_image(connection, module)
                 if module.params['download_image_path']:
-                    ret['changed'] = download_disk_image(connection, module)
+                    transfer_stats = download_disk_image(connection, module)
             if module.params.get('keep_days_old') is not None:
                 ret = remove_old_snapshosts(module, vm_service, snapshots_service)
             else:
                 ret = create_snapshot(module, vm_service, snapshots_service, connection)
+            if transfer_stats:
+                ret['changed'] = True
+                ret['transfer'] = transfer_stats
         elif state == 'restore':
             ret = restore_snapshot(module, vm_service, snapshots_service)
         elif state == 'absent':
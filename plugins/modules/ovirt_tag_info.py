@@ -167,6 +167,7 @@ def main():
                     connection=connection,
                     fetch_nested=module.params['fetch_nested'],
                     attributes=module.params['nested_attributes'],
+                    filter_keys=module.params.get('fields'),
                 ) for t in tags
             ],
         )
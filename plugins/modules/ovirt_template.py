@@ -597,6 +597,7 @@ except ImportError:
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.ovirt.ovirt.plugins.module_utils.ovirt import (
     BaseModule,
+    CollectionIndex,
     check_sdk,
     convert_to_bytes,
     create_connection,
@@ -734,10 +735,13 @@ class TemplatesModule(BaseModule):
     def __attach_nics(self, entity):
         # Attach NICs to VM, if specified:
         nics_service = self._service.service(entity.id).nics_service()
+        # The NICs are listed once, instead of once per every NIC:
+        nics = CollectionIndex(nics_service.list())
         for nic in self.param('nics'):
-            if search_by_name(nics_service, nic.get('name')) is None:
+            if nics.find(name=nic.get('name')) is None:
                 if not self._module.check_mode:
-                    nics_service.add(
+                    # Keep the index up to date, so the NIC is found by the following lookups:
+                    nics.add(nics_service.add(
                         otypes.Nic(
                             name=nic.get('name'),
                             interface=otypes.NicInterface(
@@ -750,7 +754,7 @@ class TemplatesModule(BaseModule):
                                 address=nic.get('mac_address')
                             ) if nic.get('mac_address') else None,
                         )
-                    )
+                    ))
                 self.changed = True
 
     def get_initialization(self):
@@ -1401,6 +1401,7 @@ except ImportError:
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.ovirt.ovirt.plugins.module_utils.ovirt import (
     BaseModule,
+    CollectionIndex,
     check_params,
     check_sdk,
     convert_to_bytes,
@@ -1408,6 +1409,7 @@ from ansible_collections.ovirt.ovirt.plugins.module_utils.ovirt import (
     equal,
     get_dict_of_struct,
     get_entity,
+    get_entity_cache,
     get_link_name,
     get_id_by_name,
     ovirt_full_argument_spec,
@@ -1423,6 +1425,8 @@ class VmsModule(BaseModule):
         super(VmsModule, self).__init__(*args, **kwargs)
         self._initialization = None
         self._is_new = False
+        # The clusters, storage domains and disks referenced many times by the VM are searched only once:
+        self._entity_cache = get_entity_cache(self._connection)
 
     def __get_template_with_version(self):
         """
@@ -1435,7 +1439,7 @@ class VmsModule(BaseModule):
         if self._is_new:
             if self.param('template'):
                 clusters_service = self._connection.system_service().clusters_service()
-                cluster = search_by_name(clusters_service, self.param('cluster'))
+                cluster = self._entity_cache.search_by_name(clusters_service, self.param('cluster'))
                 data_center = self._connection.follow_link(cluster.data_center)
                 templates = templates_service.list(
                     search='name=%s and datacenter=%s' % (self.param('template'), data_center.name)
@@ -1487,7 +1491,7 @@ class VmsModule(BaseModule):
                         sparse=self.param('disk_format') != 'raw',
                         storage_domains=[
                             otypes.StorageDomain(
-                                id=get_id_by_name(
+                                id=self._entity_cache.get_id_by_name(
                                     self._connection.system_service().storage_domains_service(),
                                     self.param('storage_domain')
                                 )
@@ -1508,7 +1512,7 @@ class VmsModule(BaseModule):
             return None
 
         vms_service = self._connection.system_service().vms_service()
-        vm_id = get_id_by_name(vms_service, self.param('snapshot_vm'))
+        vm_id = self._entity_cache.get_id_by_name(vms_service, self.param('snapshot_vm'))
         vm_service = vms_service.vm_service(vm_id)
 
         snaps_service = vm_service.snapshots_service()
@@ -1539,7 +1543,7 @@ class VmsModule(BaseModule):
             return self.param('cluster')
         elif self.param('snapshot_name') is not None and self.param('snapshot_vm') is not None:
             vms_service = self._connection.system_service().vms_service()
-            vm = search_by_name(vms_service, self.param('snapshot_vm'))
+            vm = self._entity_cache.search_by_name(vms_service, self.param('snapshot_vm'))
             return self._connection.system_service().clusters_service().cluster_service(vm.cluster.id).get().name
 
     def build_entity(self):
@@ -1589,7 +1593,7 @@ class VmsModule(BaseModule):
             ) if self.param('high_availability') is not None or self.param('high_availability_priority') else None,
             lease=otypes.StorageDomainLease(
                 storage_domain=otypes.StorageDomain(
-                    id=get_id_by_name(
+                    id=self._entity_cache.get_id_by_name(
                         service=self._connection.system_service().storage_domains_service(),
                         name=self.param('lease')
                     ) if self.param('lease') else None
@@ -1654,7 +1658,7 @@ class VmsModule(BaseModule):
                 self.param('memory_max')
             )) else None,
             instance_type=otypes.InstanceType(
-                id=get_id_by_name(
+                id=self._entity_cache.get_id_by_name(
                     self._connection.system_service().instance_types_service(),
                     self.param('instance_type'),
                 ),
@@ -1964,7 +1968,7 @@ class VmsModule(BaseModule):
                 if vm_host != current_vm_host:
                     if not self._module.check_mode:
                         vm_service.migrate(
-                            cluster=search_by_name(clusters_service, self.param('cluster')),
+                            cluster=self._entity_cache.search_by_name(clusters_service, self.param('cluster')),
                             host=otypes.Host(name=vm_host),
                             force=self.param('force_migrate')
                         )
@@ -2008,6 +2012,7 @@ class VmsModule(BaseModule):
             condition=lambda vm: vm.status == otypes.VmStatus.DOWN,
             wait=self.param('wait'),
             timeout=self.param('timeout'),
+            connection=self.wait_connection(),
         )
         if vm.stateless:
             snapshots_service = vm_service.snapshots_service()
@@ -2032,12 +2037,14 @@ class VmsModule(BaseModule):
                     condition=lambda snap: snap is None,
                     wait=self.param('wait'),
                     timeout=self.param('timeout'),
+                    connection=self.wait_connection(),
                 )
                 wait(
                     service=snapshots_service.snapshot_service(snap_stateless[0].id),
                     condition=lambda snap: snap.snapshot_status == otypes.SnapshotStatus.OK,
                     wait=self.param('wait'),
                     timeout=self.param('timeout'),
+                    connection=self.wait_connection(),
                 )
         return True
 
@@ -2097,7 +2104,7 @@ class VmsModule(BaseModule):
             disk_id = disk.get('id')
             if disk_id is None:
                 disk_id = getattr(
-                    search_by_name(
+                    self._entity_cache.search_by_name(
                         service=disks_service,
                         name=disk.get('name')
                     ),
@@ -2130,7 +2137,7 @@ class VmsModule(BaseModule):
         """
         vnics_service = self._connection.system_service().vnic_profiles_service()
         clusters_service = self._connection.system_service().clusters_service()
-        cluster = search_by_name(clusters_service, self.param('cluster'))
+        cluster = self._entity_cache.search_by_name(clusters_service, self.param('cluster'))
         profiles = [
             profile for profile in vnics_service.list()
             if profile.name == nic.get('profile_name')
@@ -2223,10 +2230,13 @@ class VmsModule(BaseModule):
     def __attach_nics(self, entity):
         # Attach NICs to VM, if specified:
         nics_service = self._service.service(entity.id).nics_service()
+        # The NICs are listed once, instead of once per every NIC:
+        nics = CollectionIndex(nics_service.list())
         for nic in self.param('nics'):
-            if search_by_name(nics_service, nic.get('name')) is None:
+            if nics.find(name=nic.get('name')) is None:
                 if not self._module.check_mode:
-                    nics_service.add(
+                    # Keep the index up to date, so the NIC is found by the following lookups:
+                    nics.add(nics_service.add(
                         otypes.Nic(
                             name=nic.get('name'),
                             interface=otypes.NicInterface(
@@ -2239,7 +2249,7 @@ class VmsModule(BaseModule):
                                 address=nic.get('mac_address')
                             ) if nic.get('mac_address') else None,
                         )
-                    )
+                    ))
                 self.changed = True
 
     def get_initialization(self):
@@ -2311,24 +2321,24 @@ class VmsModule(BaseModule):
         host_devices = self.param('host_devices')
         updated = False
         if host_devices:
-            device_names = [dev.name for dev in host_devices_service.list()]
+            devices = CollectionIndex(host_devices_service.list())
             for device in host_devices:
                 device_name = device.get('name')
                 state = device.get('state', 'present')
-                if state == 'absent' and device_name in device_names:
+                attached = devices.find(name=device_name)
+                if state == 'absent' and attached is not None:
                     updated = True
                     if not self._module.check_mode:
-                        device_id = get_id_by_name(host_devices_service, device.get('name'))
-                        host_devices_service.device_service(device_id).remove()
+                        host_devices_service.device_service(attached.id).remove()
 
-                elif state == 'present' and device_name not in device_names:
+                elif state == 'present' and attached is None:
                     updated = True
                     if not self._module.check_mode:
-                        host_devices_service.add(
+                        devices.add(host_devices_service.add(
                             otypes.HostDevice(
                                 name=device.get('name'),
                             )
-                        )
+                        ))
 
         return updated
 
@@ -2570,8 +2580,11 @@ def control_state(vm, vms_service, module):
             )
 
 
-def main():
-    argument_spec = ovirt_full_argument_spec(
+def vm_argument_spec():
+    """
+    Return the argument spec of the module, it's shared with ovirt_vms action plugin.
+    """
+    return ovirt_full_argument_spec(
         state=dict(type='str', default='present', choices=[
             'absent', 'next_run', 'present', 'registered', 'running', 'stopped', 'suspended', 'exported', 'reboot', 'reset'
         ]),
@@ -2682,260 +2695,280 @@ def main():
         snapshot_vm=dict(type='str'),
         tpm_enabled=dict(type='bool'),
     )
-    module = AnsibleModule(
-        argument_spec=argument_spec,
-        supports_check_mode=True,
-        required_one_of=[['id', 'name']],
-        required_if=[
-            ('state', 'registered', ['storage_domain']),
-        ],
-        required_together=[['snapshot_name', 'snapshot_vm']]
-    )
 
-    check_sdk(module)
-    check_params(module)
 
-    try:
-        state = module.params['state']
-        auth = module.params.pop('auth')
-        connection = create_connection(auth)
-        vms_service = connection.system_service().vms_service()
-        vms_module = VmsModule(
-            connection=connection,
-            module=module,
-            service=vms_service,
-        )
-        vm = vms_module.search_entity(list_params={'all_content': True})
-
-        control_state(vm, vms_service, module)
-        if state in ('present', 'running', 'next_run'):
-            if module.params['xen'] or module.params['kvm'] or module.params['vmware']:
-                vms_module.changed = import_vm(module, connection)
-
-            # Allow migrate vm when state present.
-            # Migrate before update
-            if vm:
-                vms_module._migrate_vm(vm)
-
-            # In case of wait=false and state=running, waits for VM to be created
-            # In case VM don't exist, wait for VM DOWN state,
-            # otherwise don't wait for any state, just update VM:
-            ret = vms_module.create(
-                entity=vm,
-                result_state=otypes.VmStatus.DOWN if vm is None else None,
-                update_params={'next_run': module.params['next_run']} if module.params['next_run'] is not None else None,
-                clone=module.params['clone'],
-                clone_permissions=module.params['clone_permissions'],
-                _wait=True if not module.params['wait'] and state == 'running' else module.params['wait'],
-            )
-            # If VM is going to be created and check_mode is on, return now:
-            if module.check_mode and ret.get('id') is None:
-                module.exit_json(**ret)
-
-            vms_module.post_present(ret['id'])
-            # Run the VM if it was just created, else don't run it:
-            if state == 'running':
-                def kernel_persist_check():
-                    return (module.params.get('kernel_params') or
-                            module.params.get('initrd_path') or
-                            module.params.get('kernel_path')
-                            and not module.params.get('cloud_init_persist'))
-                initialization = vms_module.get_initialization()
-                ret = vms_module.action(
-                    action='start',
-                    post_action=vms_module._post_start_action,
-                    action_condition=lambda vm: (
-                        vm.status not in [
-                            otypes.VmStatus.MIGRATING,
-                            otypes.VmStatus.POWERING_UP,
-                            otypes.VmStatus.REBOOT_IN_PROGRESS,
-                            otypes.VmStatus.WAIT_FOR_LAUNCH,
-                            otypes.VmStatus.UP,
-                            otypes.VmStatus.RESTORING_STATE,
-                        ]
-                    ),
-                    wait_condition=lambda vm: vm.status == otypes.VmStatus.UP,
-                    # Start action kwargs:
-                    use_cloud_init=True if not module.params.get('cloud_init_persist') and module.params.get('cloud_init') else None,
-                    use_sysprep=True if not module.params.get('cloud_init_persist') and module.params.get('sysprep') else None,
-                    volatile=module.params.get('volatile'),
-                    vm=otypes.Vm(
-                        placement_policy=otypes.VmPlacementPolicy(
-                            hosts=[otypes.Host(name=module.params['host'])]
-                        ) if module.params['host'] else None,
-                        initialization=initialization,
-                        os=otypes.OperatingSystem(
-                            cmdline=module.params.get('kernel_params'),
-                            initrd=module.params.get('initrd_path'),
-                            kernel=module.params.get('kernel_path'),
-                        ) if (kernel_persist_check()) else None,
-                    ) if (
-                        kernel_persist_check() or
-                        module.params.get('host') or
-                        initialization is not None
-                        and not module.params.get('cloud_init_persist')
-                    ) else None,
-                )
+VM_ARGUMENT_SPEC_RULES = dict(
+    required_one_of=[['id', 'name']],
+    required_if=[
+        ('state', 'registered', ['storage_domain']),
+    ],
+    required_together=[['snapshot_name', 'snapshot_vm']]
+)
 
-                if module.params['ticket']:
-                    vm_service = vms_service.vm_service(ret['id'])
-                    graphics_consoles_service = vm_service.graphics_consoles_service()
-                    graphics_console = graphics_consoles_service.list()[0]
-                    console_service = graphics_consoles_service.console_service(graphics_console.id)
-                    ticket = console_service.remote_viewer_connection_file()
-                    if ticket:
-                        ret['vm']['remote_vv_file'] = ticket
-
-            if state == 'next_run':
-                # Apply next run configuration, if needed:
-                vm = vms_service.vm_service(ret['id']).get()
-                if vm.next_run_configuration_exists:
-                    ret = vms_module.action(
-                        action='reboot',
-                        entity=vm,
-                        action_condition=lambda vm: vm.status == otypes.VmStatus.UP,
-                        wait_condition=lambda vm: vm.status == otypes.VmStatus.UP,
-                    )
-            ret['changed'] = vms_module.changed
-        elif state == 'stopped':
-            if module.params['xen'] or module.params['kvm'] or module.params['vmware']:
-                vms_module.changed = import_vm(module, connection)
 
-            ret = vms_module.create(
-                entity=vm,
-                result_state=otypes.VmStatus.DOWN if vm is None else None,
-                clone=module.params['clone'],
-                clone_permissions=module.params['clone_permissions'],
+def manage_vm(module, connection):
+    """
+    Ensure the state of the VM and return the result of the module.
+
+    :param module: Ansible module, or object with the same `params`, `check_mode`,
+                   `_diff` and `fail_json` interface
+    :param connection: connection to the Python SDK
+    :return: dictionary with values returned by Ansible module
+    """
+    state = module.params['state']
+    vms_service = connection.system_service().vms_service()
+    vms_module = VmsModule(
+        connection=connection,
+        module=module,
+        service=vms_service,
+    )
+    vm = vms_module.search_entity(list_params={'all_content': True})
+
+    control_state(vm, vms_service, module)
+    if state in ('present', 'running', 'next_run'):
+        if module.params['xen'] or module.params['kvm'] or module.params['vmware']:
+            vms_module.changed = import_vm(module, connection)
+
+        # Allow migrate vm when state present.
+        # Migrate before update
+        if vm:
+            vms_module._migrate_vm(vm)
+
+        # In case of wait=false and state=running, waits for VM to be created
+        # In case VM don't exist, wait for VM DOWN state,
+        # otherwise don't wait for any state, just update VM:
+        ret = vms_module.create(
+            entity=vm,
+            result_state=otypes.VmStatus.DOWN if vm is None else None,
+            update_params={'next_run': module.params['next_run']} if module.params['next_run'] is not None else None,
+            clone=module.params['clone'],
+            clone_permissions=module.params['clone_permissions'],
+            _wait=True if not module.params['wait'] and state == 'running' else module.params['wait'],
+        )
+        # If VM is going to be created and check_mode is on, return now:
+        if module.check_mode and ret.get('id') is None:
+            return ret
+
+        vms_module.post_present(ret['id'])
+        # Run the VM if it was just created, else don't run it:
+        if state == 'running':
+            def kernel_persist_check():
+                return (module.params.get('kernel_params') or
+                        module.params.get('initrd_path') or
+                        module.params.get('kernel_path')
+                        and not module.params.get('cloud_init_persist'))
+            initialization = vms_module.get_initialization()
+            ret = vms_module.action(
+                action='start',
+                post_action=vms_module._post_start_action,
+                action_condition=lambda vm: (
+                    vm.status not in [
+                        otypes.VmStatus.MIGRATING,
+                        otypes.VmStatus.POWERING_UP,
+                        otypes.VmStatus.REBOOT_IN_PROGRESS,
+                        otypes.VmStatus.WAIT_FOR_LAUNCH,
+                        otypes.VmStatus.UP,
+                        otypes.VmStatus.RESTORING_STATE,
+                    ]
+                ),
+                wait_condition=lambda vm: vm.status == otypes.VmStatus.UP,
+                # Start action kwargs:
+                use_cloud_init=True if not module.params.get('cloud_init_persist') and module.params.get('cloud_init') else None,
+                use_sysprep=True if not module.params.get('cloud_init_persist') and module.params.get('sysprep') else None,
+                volatile=module.params.get('volatile'),
+                vm=otypes.Vm(
+                    placement_policy=otypes.VmPlacementPolicy(
+                        hosts=[otypes.Host(name=module.params['host'])]
+                    ) if module.params['host'] else None,
+                    initialization=initialization,
+                    os=otypes.OperatingSystem(
+                        cmdline=module.params.get('kernel_params'),
+                        initrd=module.params.get('initrd_path'),
+                        kernel=module.params.get('kernel_path'),
+                    ) if (kernel_persist_check()) else None,
+                ) if (
+                    kernel_persist_check() or
+                    module.params.get('host') or
+                    initialization is not None
+                    and not module.params.get('cloud_init_persist')
+                ) else None,
             )
-            if module.params['force']:
-                ret = vms_module.action(
-                    action='stop',
-                    action_condition=lambda vm: vm.status != otypes.VmStatus.DOWN,
-                    wait_condition=vms_module.wait_for_down,
-                )
-            else:
+
+            if module.params['ticket']:
+                vm_service = vms_service.vm_service(ret['id'])
+                graphics_consoles_service = vm_service.graphics_consoles_service()
+                graphics_console = graphics_consoles_service.list()[0]
+                console_service = graphics_consoles_service.console_service(graphics_console.id)
+                ticket = console_service.remote_viewer_connection_file()
+                if ticket:
+                    ret['vm']['remote_vv_file'] = ticket
+
+        if state == 'next_run':
+            # Apply next run configuration, if needed:
+            vm = vms_service.vm_service(ret['id']).get()
+            if vm.next_run_configuration_exists:
                 ret = vms_module.action(
-                    action='shutdown',
-                    pre_action=vms_module._pre_shutdown_action,
-                    action_condition=lambda vm: vm.status != otypes.VmStatus.DOWN,
-                    wait_condition=vms_module.wait_for_down,
+                    action='reboot',
+                    entity=vm,
+                    action_condition=lambda vm: vm.status == otypes.VmStatus.UP,
+                    wait_condition=lambda vm: vm.status == otypes.VmStatus.UP,
                 )
-            vms_module.post_present(ret['id'])
-        elif state == 'suspended':
-            ret = vms_module.create(
-                entity=vm,
-                result_state=otypes.VmStatus.DOWN if vm is None else None,
-                clone=module.params['clone'],
-                clone_permissions=module.params['clone_permissions'],
-            )
-            vms_module.post_present(ret['id'])
+        ret['changed'] = vms_module.changed
+    elif state == 'stopped':
+        if module.params['xen'] or module.params['kvm'] or module.params['vmware']:
+            vms_module.changed = import_vm(module, connection)
+
+        ret = vms_module.create(
+            entity=vm,
+            result_state=otypes.VmStatus.DOWN if vm is None else None,
+            clone=module.params['clone'],
+            clone_permissions=module.params['clone_permissions'],
+        )
+        if module.params['force']:
             ret = vms_module.action(
-                action='suspend',
-                pre_action=vms_module._pre_suspend_action,
-                action_condition=lambda vm: vm.status != otypes.VmStatus.SUSPENDED,
-                wait_condition=lambda vm: vm.status == otypes.VmStatus.SUSPENDED,
+                action='stop',
+                action_condition=lambda vm: vm.status != otypes.VmStatus.DOWN,
+                wait_condition=vms_module.wait_for_down,
             )
-        elif state == 'absent':
-            ret = vms_module.remove()
-        elif state == 'registered':
-            storage_domains_service = connection.system_service().storage_domains_service()
-
-            # Find the storage domain with unregistered VM:
-            sd_id = get_id_by_name(storage_domains_service, module.params['storage_domain'])
-            storage_domain_service = storage_domains_service.storage_domain_service(sd_id)
-            vms_service = storage_domain_service.vms_service()
-
-            # Find the unregistered VM we want to register:
-            vms = vms_service.list(unregistered=True)
-            vm = next(
-                (vm for vm in vms if (vm.id == module.params['id'] or vm.name == module.params['name'])),
-                None
+        else:
+            ret = vms_module.action(
+                action='shutdown',
+                pre_action=vms_module._pre_shutdown_action,
+                action_condition=lambda vm: vm.status != otypes.VmStatus.DOWN,
+                wait_condition=vms_module.wait_for_down,
             )
-            changed = False
+        vms_module.post_present(ret['id'])
+    elif state == 'suspended':
+        ret = vms_module.create(
+            entity=vm,
+            result_state=otypes.VmStatus.DOWN if vm is None else None,
+            clone=module.params['clone'],
+            clone_permissions=module.params['clone_permissions'],
+        )
+        vms_module.post_present(ret['id'])
+        ret = vms_module.action(
+            action='suspend',
+            pre_action=vms_module._pre_suspend_action,
+            action_condition=lambda vm: vm.status != otypes.VmStatus.SUSPENDED,
+            wait_condition=lambda vm: vm.status == otypes.VmStatus.SUSPENDED,
+        )
+    elif state == 'absent':
+        ret = vms_module.remove()
+    elif state == 'registered':
+        storage_domains_service = connection.system_service().storage_domains_service()
+
+        # Find the storage domain with unregistered VM:
+        sd_id = get_id_by_name(storage_domains_service, module.params['storage_domain'])
+        storage_domain_service = storage_domains_service.storage_domain_service(sd_id)
+        vms_service = storage_domain_service.vms_service()
+
+        # Find the unregistered VM we want to register:
+        vms = vms_service.list(unregistered=True)
+        vm = next(
+            (vm for vm in vms if (vm.id == module.params['id'] or vm.name == module.params['name'])),
+            None
+        )
+        changed = False
+        if vm is None:
+            vm = vms_module.search_entity()
             if vm is None:
-                vm = vms_module.search_entity()
-                if vm is None:
-                    raise ValueError(
-                        "VM '%s(%s)' wasn't found." % (module.params['name'], module.params['id'])
-                    )
-            else:
-                # Register the vm into the system:
-                changed = True
-                vm_service = vms_service.vm_service(vm.id)
-                vm_service.register(
-                    allow_partial_import=module.params['allow_partial_import'],
-                    cluster=otypes.Cluster(
-                        name=module.params['cluster']
-                    ) if module.params['cluster'] else None,
-                    vnic_profile_mappings=_get_vnic_profile_mappings(module)
-                    if module.params['vnic_profile_mappings'] else None,
-                    reassign_bad_macs=module.params['reassign_bad_macs']
-                    if module.params['reassign_bad_macs'] is not None else None,
-                    registration_configuration=otypes.RegistrationConfiguration(
-                        cluster_mappings=_get_cluster_mappings(module),
-                        role_mappings=_get_role_mappings(module),
-                        domain_mappings=_get_domain_mappings(module),
-                        lun_mappings=_get_lun_mappings(module),
-                        affinity_group_mappings=_get_affinity_group_mappings(module),
-                        affinity_label_mappings=_get_affinity_label_mappings(module),
-                    ) if (module.params['cluster_mappings']
-                          or module.params['role_mappings']
-                          or module.params['domain_mappings']
-                          or module.params['lun_mappings']
-                          or module.params['affinity_group_mappings']
-                          or module.params['affinity_label_mappings']) else None
+                raise ValueError(
+                    "VM '%s(%s)' wasn't found." % (module.params['name'], module.params['id'])
                 )
+        else:
+            # Register the vm into the system:
+            changed = True
+            vm_service = vms_service.vm_service(vm.id)
+            vm_service.register(
+                allow_partial_import=module.params['allow_partial_import'],
+                cluster=otypes.Cluster(
+                    name=module.params['cluster']
+                ) if module.params['cluster'] else None,
+                vnic_profile_mappings=_get_vnic_profile_mappings(module)
+                if module.params['vnic_profile_mappings'] else None,
+                reassign_bad_macs=module.params['reassign_bad_macs']
+                if module.params['reassign_bad_macs'] is not None else None,
+                registration_configuration=otypes.RegistrationConfiguration(
+                    cluster_mappings=_get_cluster_mappings(module),
+                    role_mappings=_get_role_mappings(module),
+                    domain_mappings=_get_domain_mappings(module),
+                    lun_mappings=_get_lun_mappings(module),
+                    affinity_group_mappings=_get_affinity_group_mappings(module),
+                    affinity_label_mappings=_get_affinity_label_mappings(module),
+                ) if (module.params['cluster_mappings']
+                      or module.params['role_mappings']
+                      or module.params['domain_mappings']
+                      or module.params['lun_mappings']
+                      or module.params['affinity_group_mappings']
+                      or module.params['affinity_label_mappings']) else None
+            )
 
-                if module.params['wait']:
-                    vm = vms_module.wait_for_import()
-                else:
-                    # Fetch vm to initialize return.
-                    vm = vm_service.get()
-            ret = {
-                'changed': changed,
-                'id': vm.id,
-                'vm': get_dict_of_struct(vm)
-            }
-        elif state == 'exported':
-            if module.params['export_domain']:
-                export_service = vms_module._get_export_domain_service()
-                export_vm = search_by_attributes(export_service.vms_service(), id=vm.id)
+            if module.params['wait']:
+                vm = vms_module.wait_for_import()
+            else:
+                # Fetch vm to initialize return.
+                vm = vm_service.get()
+        ret = {
+            'changed': changed,
+            'id': vm.id,
+            'vm': get_dict_of_struct(vm)
+        }
+    elif state == 'exported':
+        if module.params['export_domain']:
+            export_service = vms_module._get_export_domain_service()
+            export_vm = search_by_attributes(export_service.vms_service(), id=vm.id)
 
-                ret = vms_module.action(
-                    entity=vm,
-                    action='export',
-                    action_condition=lambda t: export_vm is None or module.params['exclusive'],
-                    wait_condition=lambda t: t is not None,
-                    post_action=vms_module.post_export_action,
-                    storage_domain=otypes.StorageDomain(id=export_service.get().id),
-                    exclusive=module.params['exclusive'],
-                )
-            elif module.params['export_ova']:
-                export_vm = module.params['export_ova']
-                ret = vms_module.action(
-                    entity=vm,
-                    action='export_to_path_on_host',
-                    host=otypes.Host(name=export_vm.get('host')),
-                    directory=export_vm.get('directory'),
-                    filename=export_vm.get('filename'),
-                )
-        elif state == 'reboot':
             ret = vms_module.action(
-                action='reboot',
                 entity=vm,
-                action_condition=lambda vm: vm.status == otypes.VmStatus.UP,
-                wait_condition=lambda vm: vm.status == otypes.VmStatus.UP,
+                action='export',
+                action_condition=lambda t: export_vm is None or module.params['exclusive'],
+                wait_condition=lambda t: t is not None,
+                post_action=vms_module.post_export_action,
+                storage_domain=otypes.StorageDomain(id=export_service.get().id),
+                exclusive=module.params['exclusive'],
             )
-
-        elif state == 'reset':
+        elif module.params['export_ova']:
+            export_vm = module.params['export_ova']
             ret = vms_module.action(
-                action='reset',
                 entity=vm,
-                action_condition=lambda vm: vm.status == otypes.VmStatus.UP,
-                wait_condition=lambda vm: vm.status == otypes.VmStatus.UP,
+                action='export_to_path_on_host',
+                host=otypes.Host(name=export_vm.get('host')),
+                directory=export_vm.get('directory'),
+                filename=export_vm.get('filename'),
             )
+    elif state == 'reboot':
+        ret = vms_module.action(
+            action='reboot',
+            entity=vm,
+            action_condition=lambda vm: vm.status == otypes.VmStatus.UP,
+            wait_condition=lambda vm: vm.status == otypes.VmStatus.UP,
+        )
+
+    elif state == 'reset':
+        ret = vms_module.action(
+            action='reset',
+            entity=vm,
+            action_condition=lambda vm: vm.status == otypes.VmStatus.UP,
+            wait_condition=lambda vm: vm.status == otypes.VmStatus.UP,
+        )
+
+    return ret
+
+
+def main():
+    module = AnsibleModule(
+        argument_spec=vm_argument_spec(),
+        supports_check_mode=True,
+        **VM_ARGUMENT_SPEC_RULES
+    )
+
+    check_sdk(module)
+    check_params(module)
 
-        module.exit_json(**ret)
+    try:
+        auth = module.params.pop('auth')
+        connection = create_connection(auth)
+        module.exit_json(**manage_vm(module, connection))
     except Exception as e:
         module.fail_json(msg=str(e), exception=traceback.format_exc())
     finally:
@@ -81,6 +81,22 @@ options:
       elements: str
       aliases: ['follows']
       default: []
+    output_file:
+      description:
+        - "Path to the file, where the virtual machines are written as JSON Lines, one virtual machine per line,
+           instead of returning them in C(ovirt_vms)."
+        - "The virtual machines are fetched by C(page_size) per request and written as they are fetched,
+           so the memory used by the module doesn't depend on the number of the virtual machines."
+        - "The file is written on the host, where the module is executed."
+      type: path
+      version_added: 3.3.0
+    page_size:
+      description:
+        - "Number of the virtual machines fetched per request, when C(output_file) is specified."
+        - "Must be greater than zero."
+      type: int
+      default: 100
+      version_added: 3.3.0
 extends_documentation_fragment: ovirt.ovirt.ovirt_info
 '''
 
@@ -111,24 +127,44 @@ EXAMPLES = '''
   register: result
 - ansible.builtin.debug:
     msg: "{{ result.ovirt_vms[0] }}"
+
+# Write all VMs to the file, fetching 500 VMs per request
+- ovirt.ovirt.ovirt_vm_info:
+    output_file: /tmp/vms.jsonl
+    page_size: 500
+  register: result
+- ansible.builtin.debug:
+    msg: "{{ result.count }} VMs written to {{ result.output_file }}"
 '''
 
 RETURN = '''
 ovirt_vms:
     description: "List of dictionaries describing the VMs. VM attributes are mapped to dictionary keys,
                   all VMs attributes can be found at following url: http://ovirt.github.io/ovirt-engine-api-model/master/#types/vm."
-    returned: On success.
+    returned: On success, when C(output_file) is not specified.
     type: list
+output_file:
+    description: "Path to the file with the VMs, written as JSON Lines."
+    returned: When C(output_file) is specified.
+    type: str
+count:
+    description: "Number of the VMs written to C(output_file)."
+    returned: When C(output_file) is specified.
+    type: int
 '''
 
 import traceback
 
+from itertools import islice
+
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.ovirt.ovirt.plugins.module_utils.ovirt import (
     check_sdk,
     create_connection,
     get_dict_of_struct,
+    list_paged,
     ovirt_info_full_argument_spec,
+    write_json_lines,
 )
 
 
@@ -140,12 +176,16 @@ def main():
         next_run=dict(default=None, type='bool'),
         case_sensitive=dict(default=True, type='bool'),
         max=dict(default=None, type='int'),
+        output_file=dict(default=None, type='path'),
+        page_size=dict(default=100, type='int'),
     )
     module = AnsibleModule(
         argument_spec,
         supports_check_mode=True,
     )
     check_sdk(module)
+    if module.params['page_size'] < 1:
+        module.fail_json(msg='"page_size" must be greater than zero')
     if module.params['fetch_nested'] or module.params['nested_attributes']:
         module.deprecate(
             "The 'fetch_nested' and 'nested_attributes' are deprecated please use 'follow' parameter",
@@ -157,39 +197,59 @@ def main():
         auth = module.params.pop('auth')
         connection = create_connection(auth)
         vms_service = connection.system_service().vms_service()
-        vms = vms_service.list(
-            search=module.params['pattern'],
-            all_content=module.params['all_content'],
-            case_sensitive=module.params['case_sensitive'],
-            max=module.params['max'],
-            follow=",".join(module.params['follow']),
-        )
-        if module.params['next_run']:
-            vms = [vms_service.vm_service(vm.id).get(next_run=True) for vm in vms]
 
-        result = dict(
-            ovirt_vms=[
-                get_dict_of_struct(
-                    struct=c,
-                    connection=connection,
-                    fetch_nested=module.params.get('fetch_nested'),
-                    attributes=module.params.get('nested_attributes'),
-                    follow=module.params.get('follow'),
-                ) for c in vms
-            ],
-        )
-        for i, vm in enumerate(result['ovirt_vms']):
+        def get_vm_dict(vm):
+            if module.params['next_run']:
+                vm = vms_service.vm_service(vm.id).get(next_run=True)
+            vm_dict = get_dict_of_struct(
+                struct=vm,
+                connection=connection,
+                fetch_nested=module.params.get('fetch_nested'),
+                attributes=module.params.get('nested_attributes'),
+                filter_keys=module.params.get('fields'),
+                follow=module.params.get('follow'),
+            )
+            if module.params['fields'] and 'current_cd' not in module.params['fields']:
+                # Don't fetch the CD of the VM, when it's not requested:
+                return vm_dict
             if module.params['current_cd']:
-                vm_service = vms_service.vm_service(vm['id'])
+                vm_service = vms_service.vm_service(vm.id)
                 cdroms_service = vm_service.cdroms_service()
                 cdrom_device = cdroms_service.list()[0]
                 cdrom_service = cdroms_service.cdrom_service(cdrom_device.id)
-                result['ovirt_vms'][i]['current_cd'] = get_dict_of_struct(
+                vm_dict['current_cd'] = get_dict_of_struct(
                     struct=cdrom_service.get(current=True),
                     connection=connection,
                 )
             else:
-                result['ovirt_vms'][i]['current_cd'] = {}
+                vm_dict['current_cd'] = {}
+            return vm_dict
+
+        list_params = dict(
+            all_content=module.params['all_content'],
+            case_sensitive=module.params['case_sensitive'],
+            follow=",".join(module.params['follow']),
+        )
+        if module.params['output_file']:
+            vms = list_paged(
+                vms_service.list,
+                module.params['page_size'],
+                search=module.params['pattern'],
+                **list_params
+            )
+            if module.params['max'] is not None:
+                vms = islice(vms, module.params['max'])
+            count = write_json_lines(module.params['output_file'], (get_vm_dict(vm) for vm in vms))
+            module.exit_json(changed=False, output_file=module.params['output_file'], count=count)
+
+        vms = vms_service.list(
+            search=module.params['pattern'],
+            max=module.params['max'],
+            **list_params
+        )
+        result = dict(
+            ovirt_vms=[get_vm_dict(vm) for vm in vms],
+        )
         module.exit_json(changed=False, **result)
     except Exception as e:
         module.fail_json(msg=str(e), exception=traceback.format_exc())
@@ -126,7 +126,7 @@ def main():
                     connection=connection,
                     fetch_nested=module.params.get('fetch_nested'),
                     attributes=module.params.get('nested_attributes'),
-                    filter_keys=module.params['filter_keys'],
+                    filter_keys=module.params['filter_keys'] or module.params['fields'],
                 ) for c in operating_systems
             ],
         )
@@ -89,6 +89,13 @@ options:
             - "Number of VMs in the pool."
             - "Default value is set by engine."
         type: int
+    max_workers:
+        description:
+            - "Maximal number of the VMs of the pool, to which the C(nics) of the C(vm) are attached concurrently.
+               Every worker uses its own connection to the engine."
+        type: int
+        default: 10
+        version_added: 3.3.0
     vm:
         description:
             - "For creating vm pool without editing template."
@@ -230,8 +237,12 @@ try:
 except ImportError:
     pass
 
+import threading
 import traceback
 
+from concurrent import futures
+from concurrent.futures import ThreadPoolExecutor
+
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.ovirt.ovirt.plugins.module_utils.ovirt import (
     BaseModule,
@@ -240,6 +251,7 @@ from ansible_collections.ovirt.ovirt.plugins.module_utils.ovirt import (
     create_connection,
     equal,
     get_link_name,
+    list_paged,
     ovirt_full_argument_spec,
     wait,
     convert_to_bytes,
@@ -247,9 +259,14 @@ from ansible_collections.ovirt.ovirt.plugins.module_utils.ovirt import (
 )
 
 
+# Number of the VMs of the pool fetched per request:
+PAGE_SIZE = 100
+
+
 class VmPoolsModule(BaseModule):
-    def __init__(self, *args, **kwargs):
+    def __init__(self, auth=None, *args, **kwargs):
         super(VmPoolsModule, self).__init__(*args, **kwargs)
+        self._auth = auth
         self._initialization = None
 
     def build_entity(self):
@@ -347,41 +364,87 @@ class VmPoolsModule(BaseModule):
         return self._initialization
 
     def get_vms(self, entity):
-        vms = self._connection.system_service().vms_service().list()
-        resp = []
-        for vm in vms:
-            if vm.vm_pool is not None and vm.vm_pool.id == entity.id:
-                resp.append(vm)
-        return resp
+        return list_paged(
+            self._connection.system_service().vms_service().list,
+            PAGE_SIZE,
+            search='pool="%s"' % entity.name,
+        )
 
     def post_create(self, entity):
         vm_param = self.param('vm')
         if vm_param is not None and vm_param.get('nics') is not None:
+            nics = self.__build_nics(vm_param)
             vms = self.get_vms(entity)
-            for vm in vms:
-                self.__attach_nics(vm, vm_param)
+            max_workers = self.param('max_workers') or 1
+            if max_workers > 1:
+                self.__attach_nics_concurrently(vms, nics, max_workers)
+            else:
+                for vm in vms:
+                    self.__attach_nics(self._connection, vm, nics)
+
+    def __build_nics(self, vm_param):
+        # Build the NICs only once for all the VMs of the pool, so the
+        # VNIC profiles are looked up only once:
+        return [
+            otypes.Nic(
+                name=nic.get('name'),
+                interface=otypes.NicInterface(
+                    nic.get('interface', 'virtio')
+                ),
+                vnic_profile=otypes.VnicProfile(
+                    id=self.__get_vnic_profile_id(nic),
+                ) if nic.get('profile_name') else None,
+                mac=otypes.Mac(
+                    address=nic.get('mac_address')
+                ) if nic.get('mac_address') else None,
+            )
+            for nic in vm_param.get('nics')
+        ]
+
+    def __attach_nics_concurrently(self, vms, nics, max_workers):
+        """
+        Attach NICs to the VMs by pool of workers, each with its own connection.
+        The VMs are submitted to the workers as they are fetched, so only
+        the VMs of the current page are held in memory.
+        """
+        # All the workers use the token of the connection of the module, instead of their own logins:
+        worker_auth = dict(self._auth, token=self._auth.get('token') or self._connection.authenticate())
+        local = threading.local()
+        connections = []
+        lock = threading.Lock()
+
+        def attach_nics(vm):
+            if getattr(local, 'connection', None) is None:
+                local.connection = create_connection(worker_auth)
+                with lock:
+                    connections.append(local.connection)
+            self.__attach_nics(local.connection, vm, nics)
 
-    def __attach_nics(self, entity, vm_param):
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                pending = set()
+                for vm in vms:
+                    if len(pending) >= 2 * max_workers:
+                        done, pending = futures.wait(pending, return_when=futures.FIRST_COMPLETED)
+                        # Raise the exception of the failed worker:
+                        for future in done:
+                            future.result()
+                    pending.add(executor.submit(attach_nics, vm))
+                for future in pending:
+                    future.result()
+        finally:
+            for connection in connections:
+                connection.close(logout=False)
+
+    def __attach_nics(self, connection, entity, nics):
         # Attach NICs to VM, if specified:
-        vms_service = self._connection.system_service().vms_service()
+        vms_service = connection.system_service().vms_service()
         nics_service = vms_service.service(entity.id).nics_service()
-        for nic in vm_param.get('nics'):
-            if search_by_name(nics_service, nic.get('name')) is None:
+        names = set(nic.name for nic in nics_service.list())
+        for nic in nics:
+            if nic.name not in names:
                 if not self._module.check_mode:
-                    nics_service.add(
-                        otypes.Nic(
-                            name=nic.get('name'),
-                            interface=otypes.NicInterface(
-                                nic.get('interface', 'virtio')
-                            ),
-                            vnic_profile=otypes.VnicProfile(
-                                id=self.__get_vnic_profile_id(nic),
-                            ) if nic.get('profile_name') else None,
-                            mac=otypes.Mac(
-                                address=nic.get('mac_address')
-                            ) if nic.get('mac_address') else None,
-                        )
-                    )
+                    nics_service.add(nic)
                 self.changed = True
 
     def __get_vnic_profile_id(self, nic):
@@ -441,6 +504,7 @@ def main():
         prestarted=dict(default=None, type='int'),
         vm_count=dict(default=None, type='int'),
         type=dict(default=None, choices=['automatic', 'manual']),
+        max_workers=dict(default=10, type='int'),
     )
     module = AnsibleModule(
         argument_spec=argument_spec,
@@ -455,6 +519,7 @@ def main():
         connection = create_connection(auth)
         vm_pools_service = connection.system_service().vm_pools_service()
         vm_pools_module = VmPoolsModule(
+            auth=auth,
             connection=connection,
             module=module,
             service=vm_pools_service,
@@ -0,0 +1,80 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2026, Red Hat, Inc.
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+DOCUMENTATION = '''
+---
+module: ovirt_vms
+short_description: Module to manage many Virtual Machines in oVirt/RHV at once
+version_added: "3.3.0"
+author: "oVirt Developers (@oVirt)"
+description:
+    - "This module manages the state of many Virtual Machines in oVirt/RHV by single task."
+    - "Every VM is managed the same way as by M(ovirt.ovirt.ovirt_vm) module, but all VMs share single login
+       and they are managed concurrently by pool of workers, instead of running one task per VM."
+notes:
+    - "This module is executed on the controller, so the oVirt Python SDK must be installed on the controller."
+options:
+    vms:
+        description:
+            - "List of dictionaries with the parameters of the VMs. Every dictionary accepts the same parameters
+               as M(ovirt.ovirt.ovirt_vm) module, except C(auth)."
+        type: list
+        elements: dict
+        required: true
+    defaults:
+        description:
+            - "Dictionary of M(ovirt.ovirt.ovirt_vm) parameters, which are common to all VMs.
+               The parameters specified in C(vms) take precedence."
+        type: dict
+        default: {}
+    max_workers:
+        description:
+            - "Maximal number of VMs managed concurrently. Every worker uses its own connection to the engine."
+        type: int
+        default: 10
+    auth:
+        description:
+            - "Dictionary with values needed to create HTTP/HTTPS connection to oVirt,
+               it accepts the same values as C(auth) parameter of M(ovirt.ovirt.ovirt_vm) module."
+        type: dict
+        required: true
+'''
+
+EXAMPLES = '''
+# Examples don't contain auth parameter for simplicity,
+# look at ovirt_auth module to see how to reuse authentication:
+
+- name: Create and run three VMs from the template by single task
+  ovirt.ovirt.ovirt_vms:
+    defaults:
+      state: running
+      cluster: Default
+      template: rhel8
+      timeout: 600
+    vms:
+      - name: web01
+      - name: web02
+      - name: db01
+        memory: 8GiB
+    max_workers: 3
+  register: result
+
+- ansible.builtin.debug:
+    msg: "{{ result.vms | map(attribute='id') | list }}"
+'''
+
+RETURN = '''
+vms:
+    description: "List of results of the VMs, in the same order as C(vms) parameter. Every result contains the same values
+                  as the result of M(ovirt.ovirt.ovirt_vm) module and C(name) of the VM. If managing the VM failed, the result
+                  contains C(failed) and C(msg)."
+    returned: always
+    type: list
+    elements: dict
+'''
@@ -41,20 +41,7 @@ returns:
         returned: always
 '''
 
-try:
-    from urllib import getproxies_environment
-    from urllib import proxy_bypass
-    from urlparse import urlparse
-except ImportError:
-    from urllib.request import getproxies_environment
-    from urllib.request import proxy_bypass
-    from urllib.parse import urlparse
-
-
-def proxied(value):
-    netloc = urlparse(value).netloc
-    proxied = bool(getproxies_environment()) and not proxy_bypass(netloc)
-    return (proxied)
+from ansible_collections.ovirt.ovirt.plugins.module_utils.imageio import proxied
 
 
 class TestModule(object):
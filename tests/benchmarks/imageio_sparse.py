@@ -0,0 +1,195 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2026, Red Hat, Inc.
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""
+Benchmark of the zero skipping image transfer of the imageio module utils.
+
+The sparse image is downloaded from and uploaded to a local stand-in of the
+imageio server, once with the 'extents' and 'zero' features of the server
+enabled, so only the data extents are transferred, and once with the
+features disabled, so every byte of the image is transferred. The openssl
+command is needed to create the certificate of the server. Run it from the
+directory containing the ansible_collections/ovirt/ovirt tree:
+
+    python -m ansible_collections.ovirt.ovirt.tests.benchmarks.imageio_sparse --size 1024 --data 10
+"""
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import argparse
+import json
+import os
+import shutil
+import ssl
+import subprocess
+import tempfile
+import threading
+import time
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from ansible_collections.ovirt.ovirt.plugins.module_utils import imageio
+
+
+MiB = 1024 ** 2
+
+
+class ImageioHandler(BaseHTTPRequestHandler):
+    """
+    Minimal imageio server, serving the image `server.image`.
+    """
+
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, *args):
+        pass
+
+    def _reply(self, status=200, body=b'', headers=None):
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_OPTIONS(self):
+        features = ['extents', 'zero', 'flush'] if self.server.sparse else ['flush']
+        self._reply(body=json.dumps(dict(features=features, max_readers=8, max_writers=8)).encode())
+
+    def do_GET(self):
+        image = self.server.image
+        if self.path.split('?')[0].endswith('/extents'):
+            extents = [
+                dict(start=offset, length=length, zero=zero)
+                for offset, length, zero in imageio.local_extents(image)
+            ]
+            return self._reply(body=json.dumps(extents).encode())
+
+        size = os.path.getsize(image)
+        start, end = 0, size - 1
+        status = 200
+        headers = {}
+        if self.headers.get('Range'):
+            start, end = (int(value) for value in self.headers['Range'].split('=')[1].split('-'))
+            end = min(end, size - 1)
+            status = 206
+            headers['Content-Range'] = 'bytes %d-%d/%d' % (start, end, size)
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header('Content-Length', str(end - start + 1))
+        self.end_headers()
+        with open(image, 'rb') as image_file:
+            image_file.seek(start)
+            remaining = end - start + 1
+            while remaining:
+                data = image_file.read(min(remaining, MiB))
+                self.wfile.write(data)
+                remaining -= len(data)
+
+    def do_PUT(self):
+        remaining = int(self.headers['Content-Length'])
+        content_range = self.headers.get('Content-Range')
+        offset = int(content_range.split()[1].split('-')[0]) if content_range else 0
+        with open(self.server.image, 'r+b') as image_file:
+            image_file.seek(offset)
+            while remaining:
+                data = self.rfile.read(min(remaining, MiB))
+                image_file.write(data)
+                remaining -= len(data)
+        self._reply()
+
+    def do_PATCH(self):
+        # Both 'zero' and 'flush' requests are no-ops, as the image is created
+        # sparse, so the ranges zeroed by the upload are already holes:
+        self.rfile.read(int(self.headers['Content-Length']))
+        self._reply()
+
+
+def create_sparse_image(path, size, data):
+    """
+    Create sparse image of `size` bytes, with `data` bytes of random data
+    spread in 1 MiB chunks over the image.
+    """
+    with open(path, 'wb') as image_file:
+        image_file.truncate(size)
+        chunks = data // MiB
+        step = size // max(chunks, 1)
+        for index in range(chunks):
+            image_file.seek(index * step)
+            image_file.write(os.urandom(MiB))
+
+
+def create_certificate(directory):
+    cert = os.path.join(directory, 'cert.pem')
+    key = os.path.join(directory, 'key.pem')
+    subprocess.check_call(
+        ['openssl', 'req', '-x509', '-newkey', 'rsa:2048', '-nodes', '-days', '1',
+         '-subj', '/CN=localhost', '-keyout', key, '-out', cert],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    return cert, key
+
+
+def start_server(directory, image):
+    server = ThreadingHTTPServer(('127.0.0.1', 0), ImageioHandler)
+    server.image = image
+    server.sparse = True
+    context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    context.load_cert_chain(*create_certificate(directory))
+    server.socket = context.wrap_socket(server.socket, server_side=True)
+    thread = threading.Thread(target=server.serve_forever)
+    thread.daemon = True
+    thread.start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--size', type=int, default=1024, help='virtual size of the image in MiB')
+    parser.add_argument('--data', type=int, default=10, help='percentage of the image containing data')
+    parser.add_argument('--workers', type=int, default=imageio.MAX_WORKERS, help='number of the transfer workers')
+    args = parser.parse_args()
+
+    directory = tempfile.mkdtemp()
+    try:
+        remote = os.path.join(directory, 'remote.img')
+        local = os.path.join(directory, 'local.img')
+        size = args.size * MiB
+        server = start_server(directory, remote)
+        url = 'https://127.0.0.1:%d/images/ticket' % server.server_address[1]
+        context = ssl.create_default_context()
+        context.check_hostname = False
+        context.verify_mode = ssl.CERT_NONE
+
+        for sparse in (False, True):
+            server.sparse = sparse
+            # The dense upload writes the zeros, so start every mode with fresh images:
+            create_sparse_image(remote, size, size * args.data // 100)
+            if os.path.exists(local):
+                os.remove(local)
+            for direction in ('download', 'upload'):
+                start = time.time()
+                if direction == 'download':
+                    imageio.download(url, 'ticket', context, local, max_workers=args.workers)
+                else:
+                    imageio.upload(url, 'ticket', context, local, max_workers=args.workers)
+                elapsed = time.time() - start
+                print('%-8s %-6s %6.2f s, local image uses %4d MiB, remote image uses %4d MiB' % (
+                    direction,
+                    'sparse' if sparse else 'dense',
+                    elapsed,
+                    os.stat(local).st_blocks * 512 // MiB,
+                    os.stat(remote).st_blocks * 512 // MiB,
+                ))
+        server.shutdown()
+    finally:
+        shutil.rmtree(directory)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2026, Red Hat, Inc.
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""
+Micro-benchmark of the IP address filters of ovirtvmip filter plugin.
+
+The filters are run over the list of generated VMs, every VM reports two
+devices with IPv4, IPv6 and link local IPv6 addresses. Run it from the
+directory containing the ansible_collections/ovirt/ovirt tree:
+
+    python -m ansible_collections.ovirt.ovirt.tests.benchmarks.ovirtvmip --vms 10000
+"""
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import argparse
+import random
+import timeit
+
+from ansible_collections.ovirt.ovirt.plugins.filter.ovirtvmip import FilterModule
+
+
+CASES = (
+    ('ovirtvmips', {}),
+    ('ovirtvmipsv4', dict(network_ip='10.1.0.0/16')),
+    ('ovirtvmipsv4', dict(attr='name', network_ip='10.1.0.0/16')),
+    ('ovirtvmipsv6', dict(attr='name')),
+    ('ovirtvmipsv6', dict(network_ip='fd00:1::/32')),
+)
+
+
+def generate_vms(count):
+    random.seed(1)
+    return [
+        dict(
+            name='vm%d' % i,
+            reported_devices=[
+                dict(ips=[
+                    dict(address='10.%d.%d.%d' % (random.randrange(4), random.randrange(256), random.randrange(256)), version='v4'),
+                    dict(address='fd00:%x::%x' % (random.randrange(4), i), version='v6'),
+                    dict(address='fe80::%x%%eth0' % i, version='v6'),
+                ])
+                for dummy in range(2)
+            ],
+        )
+        for i in range(count)
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--vms', type=int, default=10000, help='number of the generated VMs')
+    parser.add_argument('--repeat', type=int, default=7, help='number of the runs of every filter, the best run is reported')
+    args = parser.parse_args()
+
+    vms = generate_vms(args.vms)
+    filters = FilterModule().filters()
+    for name, kwargs in CASES:
+        best = min(timeit.repeat(lambda: filters[name](vms, **kwargs), number=1, repeat=args.repeat))
+        print('%-14s %-45s %8.1f ms' % (name, kwargs, best * 1000))
+
+
+if __name__ == '__main__':
+    main()
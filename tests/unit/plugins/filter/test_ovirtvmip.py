@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2026, Red Hat, Inc.
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import pytest
+
+from ansible.errors import AnsibleFilterError
+
+from ansible_collections.ovirt.ovirt.plugins.filter.ovirtvmip import FilterModule
+
+
+VMS = [
+    dict(
+        name='vm1',
+        reported_devices=[
+            dict(ips=[
+                dict(address='10.0.0.1', version='v4'),
+                dict(address='192.168.1.1', version='v4'),
+                dict(address='fd00::1', version='v6'),
+                dict(address='fe80::1%eth0', version='v6'),
+            ]),
+        ],
+    ),
+    dict(
+        name='vm2',
+        reported_devices=[
+            dict(ips=[
+                dict(address='10.1.0.1', version='v4'),
+                dict(address='fe80::2%eth0', version='v6'),
+            ]),
+        ],
+    ),
+]
+
+
+@pytest.fixture
+def filters():
+    return FilterModule().filters()
+
+
+@pytest.mark.parametrize('name, network_ip, expected', [
+    ('ovirtvmips', None, ['10.0.0.1', '192.168.1.1', 'fd00::1', 'fe80::1%eth0', '10.1.0.1', 'fe80::2%eth0']),
+    ('ovirtvmips', '10.0.0.0/8', ['10.0.0.1', '10.1.0.1']),
+    ('ovirtvmips', '0.0.0.0/0', ['10.0.0.1', '192.168.1.1', 'fd00::1', 'fe80::1%eth0', '10.1.0.1', 'fe80::2%eth0']),
+    ('ovirtvmips', '::/0', ['10.0.0.1', '192.168.1.1', 'fd00::1', 'fe80::1%eth0', '10.1.0.1', 'fe80::2%eth0']),
+    ('ovirtvmipsv6', '0.0.0.0/0', ['fd00::1', 'fe80::1%eth0', 'fe80::2%eth0']),
+    ('ovirtvmips', 'fe80::/10', ['fe80::1%eth0', 'fe80::2%eth0']),
+    ('ovirtvmipsv4', '10.0.0.0/16', ['10.0.0.1']),
+    ('ovirtvmipsv4', 'fd00::/8', []),
+    ('ovirtvmipsv6', '192.168.0.0/16', []),
+    ('ovirtvmipsv6', 'fd00::/8', ['fd00::1']),
+])
+def test_ips_in_network(filters, name, network_ip, expected):
+    assert filters[name](VMS, network_ip=network_ip) == expected
+
+
+@pytest.mark.parametrize('network_ip, expected', [
+    ('192.168.0.0/16', '192.168.1.1'),
+    ('fe80::/10', 'fe80::1%eth0'),
+    ('172.16.0.0/12', []),
+])
+def test_first_ip_in_network(filters, network_ip, expected):
+    assert filters['ovirtvmip'](VMS, network_ip=network_ip) == expected
+
+
+def test_ips_in_network_by_attr(filters):
+    assert filters['ovirtvmips'](VMS, attr='name', network_ip='10.1.0.0/16') == dict(vm1=[], vm2=['10.1.0.1'])
+
+
+def test_invalid_network(filters):
+    with pytest.raises(AnsibleFilterError):
+        filters['ovirtvmips'](VMS, network_ip='10.0.0.0/33')
@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2026, Red Hat, Inc.
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import pytest
+
+from ansible_collections.ovirt.ovirt.plugins.module_utils import ovirt
+
+
+class FakeClock(object):
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def time(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class FakeTransferService(object):
+
+    def get(self):
+        return 'transfer'
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(ovirt.time, 'time', clock.time)
+    monkeypatch.setattr(ovirt.time, 'sleep', clock.sleep)
+    return clock
+
+
+@pytest.mark.parametrize('max_interval', [0, 0.05])
+def test_transfer_waiter_min_interval(clock, max_interval):
+    waiter = ovirt.TransferWaiter(FakeTransferService(), min_interval=0.1, max_interval=max_interval)
+    for dummy in range(5):
+        assert waiter.poll('transferring') == 'transfer'
+    # The waiter must not spin, even if the poll_interval of the module is zero:
+    assert all(seconds >= 0.1 * 0.9 for seconds in clock.sleeps)
+
+
+def test_transfer_waiter_backoff(clock):
+    waiter = ovirt.TransferWaiter(FakeTransferService(), min_interval=0.1, max_interval=1)
+    for dummy in range(6):
+        waiter.poll('transferring')
+    assert clock.sleeps[0] < 0.2
+    assert 0.9 <= clock.sleeps[-1] <= 1.1
+    assert waiter.metrics['transferring'] == round(clock.now, 3)
+
+
+class Entity(object):
+
+    def __init__(self, **kwargs):
+        self.__dict__.update(kwargs)
+
+
+def test_collection_index_add():
+    index = ovirt.CollectionIndex([Entity(id='1', name='nic1')])
+    assert index.find(name='nic2') is None
+    index.add(Entity(id='2', name='nic2'))
+    assert index.find(name='nic2').id == '2'
+    assert index.find(id='2', name='nic2').id == '2'
+    assert len(index) == 2
+
+
+class Link(object):
+
+    def __init__(self, href):
+        self.href = href
+
+
+class FakeConnection(object):
+
+    def __init__(self):
+        self.followed = []
+
+    def follow_link(self, link):
+        self.followed.append(link.href)
+        return Entity(href=link.href)
+
+
+def test_link_cache_size(monkeypatch):
+    monkeypatch.setattr(ovirt, 'LINK_CACHE_SIZE', 2)
+    connection = FakeConnection()
+    cache = ovirt.get_link_cache(connection)
+    for href in ('/a', '/b', '/a', '/c', '/a', '/b'):
+        assert cache.follow_link(connection, Link(href)).href == href
+    # The '/b' was dropped as the least recently used, when '/c' was fetched:
+    assert connection.followed == ['/a', '/b', '/c', '/b']
+    assert ovirt.get_link_cache(connection) is cache